@@ -13,13 +13,19 @@ from asyncio import Future
 from asyncio import sleep
 from typing import Awaitable
 from typing import Callable
+from typing import Dict
+from typing import FrozenSet
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Union
 
+from legoBTLE.device.Watchers import ThresholdIndex
+from legoBTLE.device.Watchers import WATCHERS
 from legoBTLE.legoWP.message.downstream import CMD_EXT_SRV_CONNECT_REQ, CMD_EXT_SRV_DISCONNECT_REQ
 from legoBTLE.legoWP.message.downstream import CMD_HW_RESET
 from legoBTLE.legoWP.message.downstream import CMD_PORT_NOTIFICATION_DEV_REQ
+from legoBTLE.legoWP.message.downstream import CommandTemplate
 from legoBTLE.legoWP.message.downstream import DOWNSTREAM_MESSAGE
 from legoBTLE.legoWP.message.upstream import DEV_GENERIC_ERROR_NOTIFICATION
 from legoBTLE.legoWP.message.upstream import DEV_PORT_NOTIFICATION
@@ -29,14 +35,22 @@ from legoBTLE.legoWP.message.upstream import HUB_ALERT_NOTIFICATION
 from legoBTLE.legoWP.message.upstream import HUB_ATTACHED_IO_NOTIFICATION
 from legoBTLE.legoWP.message.upstream import PORT_CMD_FEEDBACK
 from legoBTLE.legoWP.message.upstream import PORT_VALUE
-from legoBTLE.legoWP.message.upstream import UpStreamMessageBuilder
+from legoBTLE.legoWP.message.upstream import build_upstream_message
 from legoBTLE.legoWP.types import C
 from legoBTLE.legoWP.types import MESSAGE_TYPE
+from legoBTLE.networking.framing import ClientFrameProtocol
+from legoBTLE.networking.framing import FRAMING_V1
+from legoBTLE.networking.framing import FRAMING_V2
+from legoBTLE.networking.framing import encode_frame
+from legoBTLE.networking.framing import open_framed_connection
 from legoBTLE.networking.prettyprint.debug import debug_info
 from legoBTLE.networking.prettyprint.debug import debug_info_begin
 from legoBTLE.networking.prettyprint.debug import debug_info_end
 from legoBTLE.networking.prettyprint.debug import debug_info_footer
 from legoBTLE.networking.prettyprint.debug import debug_info_header
+from legoBTLE.networking.prettyprint import tracelog
+from legoBTLE.networking.prettyprint.tracelog import DEVICE_RECEIVE
+from legoBTLE.networking.prettyprint.tracelog import DEVICE_SEND
 
 
 class ADevice(ABC):
@@ -56,26 +70,54 @@ class ADevice(ABC):
     
     """
     
+    _RETURN_DATA_HANDLERS: Dict[int, Tuple[str, bool]] = {
+        MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD[0]: ('_ext_srv_notification_dispatch', True),
+        MESSAGE_TYPE.UPS_PORT_VALUE[0]: ('_port_value_frame_set', False),
+        MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK[0]: ('cmd_feedback_notification_set', True),
+        MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR[0]: ('error_notification_set', True),
+        MESSAGE_TYPE.UPS_PORT_NOTIFICATION[0]: ('port_notification_set', True),
+        MESSAGE_TYPE.UPS_HUB_ATTACHED_IO[0]: ('hub_attached_io_notification_set', True),
+        MESSAGE_TYPE.UPS_DNS_HUB_ACTION[0]: ('hub_action_notification_set', True),
+        MESSAGE_TYPE.UPS_DNS_HUB_ALERT[0]: ('hub_alert_notification_set', True),
+        }
+    """Message type byte -> (name of the handler, build an :class:`UPSTREAM_MESSAGE` before handing over)."""
+    
+    _WATCHED_MESSAGE_TYPES: FrozenSet[int] = frozenset((MESSAGE_TYPE.UPS_PORT_VALUE[0],
+                                                        MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK[0],
+                                                        MESSAGE_TYPE.UPS_HUB_ATTACHED_IO[0], ))
+    """The message types after which the conditions waited for on the device are evaluated, see
+    :data:`legoBTLE.device.Watchers.WATCHERS`."""
+    
+    _thresholds: Optional[ThresholdIndex] = None
+    """The port value thresholds waited for, see :meth:`watch_value`."""
+    
+    requested_framing: int = FRAMING_V2
+    """The frame format asked for when registering with the server, see :mod:`legoBTLE.networking.framing`."""
+    requested_frame_flags: int = 0
+    """The optional frame fields asked for when registering with the server."""
+    session: Optional['ClientSession'] = None
+    """The :class:`legoBTLE.networking.session.ClientSession` to register over, see :meth:`ClientSession.add`."""
+    
     async def _delay_before(self, delay: float, when: str = 'n', cmd_id: str = f"DELAY BEFORE/AFTER SEND",
                             debug: bool = False):
         if delay is not None:
             if str.lower(when) == 'n':
                 _when = 'NO DELAY'
-                debug_info(f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: IGNORE DELAY",
-                           debug=debug)
+                debug_info("[{0.name}:{0.port}].{1} delay {2} is set to {3}: IGNORE DELAY",
+                           self, cmd_id, _when, delay, debug=debug)
                 return
             elif str.lower(when) == 'b':
                 _when = 'BEFORE'
-                msg_a = debug_info_begin(f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: ",
-                                         debug=debug)
-                msg_b = debug_info_end(f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: ",
-                                       debug=debug)
+                msg_a = debug_info_begin("[{0.name}:{0.port}].{1} delay {2} is set to {3}: ",
+                                         self, cmd_id, _when, delay, debug=debug)
+                msg_b = debug_info_end("[{0.name}:{0.port}].{1} delay {2} is set to {3}: ",
+                                       self, cmd_id, _when, delay, debug=debug)
             elif str.lower(when) == 'a':
                 _when = 'AFTER'
-                msg_a = debug_info_begin(f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: ",
-                                         debug=debug)
-                msg_b = debug_info_end(f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: ",
-                                       debug=debug)
+                msg_a = debug_info_begin("[{0.name}:{0.port}].{1} delay {2} is set to {3}: ",
+                                         self, cmd_id, _when, delay, debug=debug)
+                msg_b = debug_info_end("[{0.name}:{0.port}].{1} delay {2} is set to {3}: ",
+                                       self, cmd_id, _when, delay, debug=debug)
             else:
                 raise ValueError
             
@@ -124,19 +166,19 @@ class ADevice(ABC):
     
     @property
     @abstractmethod
-    def connection(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    def connection(self) -> Tuple[ClientFrameProtocol, asyncio.StreamWriter]:
         """
         A tuple holding the read and write connection to the Server Module given to each device at instantiation.
         
         Returns
         -------
-        tuple[StreamReader, StreamWriter]
+        tuple[ClientFrameProtocol, StreamWriter]
             The read and write connection for this device.
         """
         raise NotImplementedError
     
     @abstractmethod
-    def connection_set(self, connection: Tuple[asyncio.StreamReader, asyncio.StreamWriter]) -> None:
+    def connection_set(self, connection: Tuple[ClientFrameProtocol, asyncio.StreamWriter]) -> None:
         """Set a new connection for the device.
         
         .. note::
@@ -145,7 +187,7 @@ class ADevice(ABC):
         
         Parameters
         ----------
-        connection : tuple[asyncio.StreamReader, asyncio.StreamWriter]
+        connection : tuple[ClientFrameProtocol, asyncio.StreamWriter]
             The new destination information.
              
         Returns
@@ -214,6 +256,22 @@ class ADevice(ABC):
         """
         return self.server[1]
     
+    @property
+    def hub_id(self) -> int:
+        """
+        For convenience, the hub_id part.
+        
+        The hub_id selects the LEGO\ |copy| Hub if the server serves several hubs. It is given as optional third
+        element of :attr:`server`, e.g., ``('127.0.0.1', 8888, 1)``.
+
+        Returns
+        -------
+        int
+            The hub_id, ``0`` if none is given.
+        
+        """
+        return self.server[2] if len(self.server) > 2 else 0
+    
     @property
     @abstractmethod
     def port(self) -> bytes:
@@ -286,6 +344,35 @@ class ADevice(ABC):
             
         """
     
+    def watch_value(self, threshold: float, rising: bool = True) -> Future:
+        """Waits for the port value to reach `threshold`.
+        
+        The threshold is checked with each PORT_VALUE, in between waiting costs nothing.
+        
+        Parameters
+        ----------
+        threshold : float
+            The raw port value to wait for.
+        rising : bool, default True
+            If ``True``, port values ``>= threshold`` reach the threshold, otherwise port values ``<= threshold``.
+
+        Returns
+        -------
+        Future
+            Done with the port value that reached the threshold. Cancel it to stop waiting.
+        
+        Examples
+        --------
+        Waiting at most 5s for the motor to pass 720 raw degrees::
+        
+            await asyncio.wait_for(motor.watch_value(720), timeout=5.0)
+            
+        """
+        if self._thresholds is None:
+            self._thresholds = ThresholdIndex()
+        value = self.port_value
+        return self._thresholds.add(threshold, rising, None if value is None else value.m_port_value)
+    
     @abstractmethod
     async def port_value_set(self, port_value: PORT_VALUE) -> None:
         """Sets the current val (for motors: degrees (SI deg)) of the device.
@@ -521,60 +608,57 @@ class ADevice(ABC):
         """
         debug = self.debug if debug is None else debug
         
+        if self.session is not None:
+            return await self.session.disconnect(self)
+        
         command = CMD_EXT_SRV_DISCONNECT_REQ(port=self.port)
         
-        debug_info_header(f"[{self.name}:{self.port}] {C.OKBLUE}{C.BOLD} +++ {cmd_id} +++ {C.ENDC}", debug=debug)
+        debug_info_header("[{0.name}:{0.port}] {1.OKBLUE}{1.BOLD} +++ {2} +++ {1.ENDC}", self, C, cmd_id, debug=debug)
         if self.ext_srv_disconnected.set():
-            debug_info(f"[{self.name}:{self.port}] +++ {cmd_id}: ALREADY DISCONNECTED", debug=debug)
-            debug_info_footer(f"[{self.name}:{self.port}] {C.OKBLUE}{C.BOLD}+++ {cmd_id} +++ {C.ENDC}", debug=debug)
+            debug_info("[{0.name}:{0.port}] +++ {1}: ALREADY DISCONNECTED", self, cmd_id, debug=debug)
+            debug_info_footer("[{0.name}:{0.port}] {1.OKBLUE}{1.BOLD}+++ {2} +++ {1.ENDC}",
+                              self, C, cmd_id, debug=debug)
             return True  # already disconnected
         else:
             if delay_before is not None:
-                debug_info_begin(f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_BEFORE / {self.name} "
-                                 f" WAITING FOR {delay_before}", debug=debug)
+                debug_info_begin("{0} +++ [{1.name}:{1.port}]: DELAY_BEFORE / {1.name}  WAITING FOR {2}",
+                                 cmd_id, self, delay_before, debug=debug)
                 
                 await sleep(delay_before)
                 
-                debug_info_end(f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_BEFORE / {self.name} "
-                               f"WAITING FOR {delay_before}", debug=debug)
+                debug_info_end("{0} +++ [{1.name}:{1.port}]: DELAY_BEFORE / {1.name} WAITING FOR {2}",
+                               cmd_id, self, delay_before, debug=debug)
             
-            debug_info_begin(f"{cmd_id} +++ [{self.name}:{self.port}]: SEND CMD: {command.COMMAND.hex()}",
-                             debug=debug)
+            debug_info_begin("{0} +++ [{1.name}:{1.port}]: SEND CMD: {2.COMMAND!h}", cmd_id, self, command, debug=debug)
             
             s = await self._cmd_send(command)
             
-            debug_info_end(f"{cmd_id} +++ [{self.name}:{self.port}]: SEND CMD: {command.COMMAND.hex()}",
-                           debug=debug)
+            debug_info_end("{0} +++ [{1.name}:{1.port}]: SEND CMD: {2.COMMAND!h}", cmd_id, self, command, debug=debug)
             if not s:
-                debug_info(f"{cmd_id} +++ [{self.name}:{self.port}]: Sending CMD_EXT_SRV_DISCONNECT_REQ: failed",
-                           debug=debug)
-                debug_info_footer(f"{cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
+                debug_info("{0} +++ [{1.name}:{1.port}]: Sending CMD_EXT_SRV_DISCONNECT_REQ: failed",
+                           cmd_id, self, debug=debug)
+                debug_info_footer("{0} +++ [{1.name}:{1.port}]", cmd_id, self, debug=debug)
                 raise ConnectionError(f"[{self.name}:??]- [MSG]: UNABLE TO ESTABLISH CONNECTION... aborting...")
             else:
                 try:
-                    bytesToRead: bytes = await self.connection[0].readexactly(1)  # waiting for answer from Server
-                    data = bytearray(await self.connection[0].readexactly(bytesToRead[0]))
+                    data = await self.connection[0].read_frame()  # waiting for answer from Server
                 except IncompleteReadError as ire:
-                    debug_info(
-                        f"{cmd_id} +++ [{self.name}:{self.port}]: Sending CMD_EXT_SRV_DISCONNECT_REQ: failed... "
-                        f"Server didn't answer... (->{ire.args})",
-                        debug=debug)
-                    debug_info_footer(f"{cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
+                    debug_info("{0} +++ [{1.name}:{1.port}]: Sending CMD_EXT_SRV_DISCONNECT_REQ: failed... Server "
+                               "didn't answer... (->{2.args})", cmd_id, self, ire, debug=debug)
+                    debug_info_footer("{0} +++ [{1.name}:{1.port}]", cmd_id, self, debug=debug)
                     raise ire
                 else:
-                    UpStreamMessageBuilder(data=data, debug=debug).build()
+                    build_upstream_message(data)
                     if delay_after is not None:
-                        debug_info_begin(
-                            f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_AFTER / WAITING FOR {delay_after}",
-                            debug=debug)
+                        debug_info_begin("{0} +++ [{1.name}:{1.port}]: DELAY_AFTER / WAITING FOR {2}",
+                                         cmd_id, self, delay_after, debug=debug)
                         
                         await sleep(delay_after)
                         
-                        debug_info_end(
-                            f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_AFTER / WAITING FOR {delay_after}",
-                            debug=debug)
+                        debug_info_end("{0} +++ [{1.name}:{1.port}]: DELAY_AFTER / WAITING FOR {2}",
+                                       cmd_id, self, delay_after, debug=debug)
         
-        debug_info_footer(f"{cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
+        debug_info_footer("{0} +++ [{1.name}:{1.port}]", cmd_id, self, debug=debug)
         return s
     
     async def RESET(self,
@@ -611,44 +695,41 @@ class ADevice(ABC):
         
         command = CMD_HW_RESET(port=self.port)
         
-        debug_info_header(f"THE {cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
-        debug_info(f"{cmd_id} +++ [{self.name}:{self.port}]: RESET AT THE GATES... \t{C.WARNING}WAITING...{C.ENDC}",
-                   debug=debug)
+        debug_info_header("THE {0} +++ [{1.name}:{1.port}]", cmd_id, self, debug=debug)
+        debug_info("{0} +++ [{1.name}:{1.port}]: RESET AT THE GATES... \t{2.WARNING}WAITING...{2.ENDC}",
+                   cmd_id, self, C, debug=debug)
         
         self.port_free.clear()
         
-        debug_info(f"{cmd_id} +++ [{self.name}:{self.port}]: RESET AT THE GATES... \t{C.OKBLUE}PASS... {C.ENDC}",
-                   debug=debug)
+        debug_info("{0} +++ [{1.name}:{1.port}]: RESET AT THE GATES... \t{2.OKBLUE}PASS... {2.ENDC}",
+                   cmd_id, self, C, debug=debug)
         
         if delay_before is not None:
-            debug_info_begin(f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_BEFORE", debug=debug)
-            debug_info(f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_BEFORE... WAITING FOR {delay_before}..."
-                       f"{C.BOLD}{C.OKBLUE}START{C.ENDC}", debug=debug)
+            debug_info_begin("{0} +++ [{1.name}:{1.port}]: DELAY_BEFORE", cmd_id, self, debug=debug)
+            debug_info("{0} +++ [{1.name}:{1.port}]: DELAY_BEFORE... WAITING FOR {2}...{3.BOLD}{3.OKBLUE}START{3.ENDC}",
+                       cmd_id, self, delay_before, C, debug=debug)
             await sleep(delay_before)
-            debug_info(f"DELAY_BEFORE / {C.WARNING}{self.name} {C.WARNING} WAITING FOR {delay_before}... "
-                       f"{C.BOLD}{C.OKGREEN}DONE{C.ENDC}", debug=debug)
+            debug_info("DELAY_BEFORE / {0.WARNING}{1.name} {0.WARNING} WAITING FOR {2}... "
+                       "{0.BOLD}{0.OKGREEN}DONE{0.ENDC}", C, self, delay_before, debug=debug)
         
-        debug_info_begin(f"{self.name}.RESET({self.port[0]}) SENDING {command.COMMAND.hex()}...", debug)
+        debug_info_begin("{0.name}.RESET({0.port[0]}) SENDING {1.COMMAND!h}...", self, command, debug=debug)
         
         if wait_cond:
-            wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-            await asyncio.wait({wcd}, timeout=wait_cond_timeout)
+            await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
         
         s = await self._cmd_send(command)
         
-        debug_info_end(f"{self.name}.RESET({self.port[0]}) SENDING COMPLETE...", debug)
+        debug_info_end("{0.name}.RESET({0.port[0]}) SENDING COMPLETE...", self, debug=debug)
         
         if delay_after is not None:
             
-            debug_info_begin(f"DELAY_AFTER / {C.WARNING}{self.name} "
-                             f"{C.WARNING}WAITING FOR {delay_after}... "
-                             f"{C.BOLD}{C.OKBLUE}START{C.ENDC}", debug=debug)
+            debug_info_begin("DELAY_AFTER / {0.WARNING}{1.name} {0.WARNING}WAITING FOR {2}... "
+                             "{0.BOLD}{0.OKBLUE}START{0.ENDC}", C, self, delay_after, debug=debug)
             
             await sleep(delay_after)
             
-            debug_info_begin("DELAY_AFTER / {C.WARNING}{self.name} "
-                             f"{C.WARNING}WAITING FOR {delay_after}... "
-                             f"{C.BOLD}{C.OKGREEN}DONE{C.ENDC}", debug=debug)
+            debug_info_begin("DELAY_AFTER / {{C.WARNING}}{{self.name}} {0.WARNING}WAITING FOR {1}... "
+                             "{0.BOLD}{0.OKGREEN}DONE{0.ENDC}", C, delay_after, debug=debug)
         self.port_free.set()
         return s
     
@@ -716,11 +797,18 @@ class ADevice(ABC):
             (bool): Flag indicating success/failure.
 
         """
+        command: bytearray = cmd.COMMAND
+        if self.hub_id:
+            command = command[:2] + bytes((self.hub_id, )) + command[3:]
         try:
-            self.connection[1].write(cmd.COMMAND[:2])
-            await self.connection[1].drain()
-            self.connection[1].write(cmd.COMMAND[1:])
+            if self.connection[0].framing == FRAMING_V2:
+                self.connection[1].write(encode_frame(command))
+            else:
+                self.connection[1].write(command[:2] + command[1:])
             await self.connection[1].drain()  # cmd sent
+            trace = tracelog.TRACE
+            if trace is not None:
+                trace.frame(DEVICE_SEND, self.hub_id, command[4], command[1:])
         except (
                 AttributeError, ConnectionRefusedError, ConnectionAbortedError,
                 ConnectionResetError, ConnectionError) as ce:
@@ -732,6 +820,39 @@ class ADevice(ABC):
             self.last_cmd_snt = cmd
             return True
     
+    async def _template_send(self, template: CommandTemplate) -> bool:
+        """Send the current state of a command template downstream.
+        
+        In contrast to :meth:`_cmd_send` the template is sent as it is, i.e., already framed for the server.
+        A template framed for another frame format than the connection's is reframed once.
+        :attr:`last_cmd_snt` is not updated.
+        
+        This Method is a coroutine
+        
+        Args:
+            template (CommandTemplate): The command template.
+        
+        Returns:
+            (bool): Flag indicating success/failure.
+        
+        """
+        try:
+            if template.framing != self.connection[0].framing:
+                template.reframe(self.connection[0].framing)
+            self.connection[1].write(template.frame)
+            await self.connection[1].drain()
+            trace = tracelog.TRACE
+            if trace is not None:
+                trace.frame(DEVICE_SEND, self.hub_id, self.port[0],
+                            template.frame[2 if template.framing == FRAMING_V1 else 3:])
+        except (
+                AttributeError, ConnectionRefusedError, ConnectionAbortedError,
+                ConnectionResetError, ConnectionError) as ce:
+            print(f"[{self.name}:{self.port[0]}]-[MSG]: SENDING {template.frame.hex()} "
+                  f"OVER {self.socket} {C.FAIL}FAILED: {ce.args}...{C.ENDC}")
+            return False
+        return True
+    
     async def EXT_SRV_CONNECT_REQ(self, host: str = '127.0.0.1',
                                   srv_port: int = 8888,
                                   ) -> Tuple[str, bool]:
@@ -758,22 +879,25 @@ class ADevice(ABC):
         ConnectionError, TypeError
         
         """
+        if self.session is not None:
+            await self.session.register(self)
+            return self.name, True
         try:
             self.ext_srv_connected.clear()
             print(
                     f"[{self.name}]-[MSG]: ATTEMPTING TO REGISTER [{self.name}:{self.port[0]}] WITH SERVER "
                     f"[{self.server[0]}:"
                     f"{self.server[1]}]...")
-            reader, writer = await asyncio.open_connection(host=self.server[0], port=self.server[1])
-            self.connection_set((reader, writer))
+            protocol, writer = await open_framed_connection(host=self.server[0], port=self.server[1])
+            self.connection_set((protocol, writer))
         except ConnectionError:
             raise ConnectionError(
                 f"COULD NOT CONNECT [{self.name}:{self.port[0]}] with [{self.server[0]}:{self.server[1]}...")
         else:
             try:
                 answer = await self._connect_srv()
-                debug_info(f"[{self.name}:{self.port[0]}]-[MSG]: RECEIVED CON_REQ ANSWER: {answer.hex()}",
-                           debug=self.debug)
+                debug_info("[{0.name}:{0.port[0]}]-[MSG]: RECEIVED CON_REQ ANSWER: {1!h}",
+                           self, answer, debug=self.debug)
                 
                 await self._dispatch_return_data(data=answer)
                 await self.ext_srv_connected.wait()
@@ -800,28 +924,28 @@ class ADevice(ABC):
         s: bool = False
         
         for _ in range(1, 3):
-            current_command = CMD_EXT_SRV_CONNECT_REQ(port=self.port)
-            debug_info(
-                    f"[{self.name}:{self.port[0]}]-[MSG]: Sending CMD_EXT_SRV_CONNECT_REQ: "
-                    f"{current_command.COMMAND.hex()}",
-                    debug=self.debug)
+            current_command = CMD_EXT_SRV_CONNECT_REQ(port=self.port, framing=self.requested_framing,
+                                                      frame_flags=self.requested_frame_flags)
+            debug_info("[{0.name}:{0.port[0]}]-[MSG]: Sending CMD_EXT_SRV_CONNECT_REQ: {1.COMMAND!h}",
+                       self, current_command, debug=self.debug)
             s = await self._cmd_send(current_command)
             if not s:
-                debug_info(f"[{self.name}:{self.port[0]}]-[MSG]: Sending CMD_EXT_SRV_CONNECT_REQ: failed... retrying",
-                           debug=self.debug)
+                debug_info("[{0.name}:{0.port[0]}]-[MSG]: Sending CMD_EXT_SRV_CONNECT_REQ: failed... retrying",
+                           self, debug=self.debug)
                 continue
             else:
                 break
         if not s:
             raise ConnectionError(f"[{self.name}:??]- [MSG]: UNABLE TO ESTABLISH CONNECTION... aborting...")
         else:
-            bytes_to_read = await self.connection[0].readexactly(n=1)
-            data = bytearray(await self.connection[0].readexactly(n=bytes_to_read[0]))
+            data = await self.connection[0].read_frame()
         return data
     
     async def _listen_srv(self) -> bool:
         """Listen to the device's Server Port.
         
+        All messages that arrived since the last pass are dispatched in one go, in the order of arrival.
+        
         This Method is a coroutine
         
         Returns
@@ -831,36 +955,34 @@ class ADevice(ABC):
         
         """
         await self.ext_srv_connected.wait()
-        debug_info(
-            f"{C.BOLD}{C.OKBLUE}[{self.name}:{self.port[0]}]-[MSG]: LISTENING ON SOCKET [{self.socket}]...{C.ENDC}",
-            debug=self.debug)
+        debug_info("{0.BOLD}{0.OKBLUE}[{1.name}:{1.port[0]}]-[MSG]: LISTENING ON SOCKET [{1.socket}]...{0.ENDC}",
+                   C, self, debug=self.debug)
         while self.ext_srv_connected.is_set():
             try:
-                bytes_to_read = await self.connection[0].readexactly(n=1)
-                debug_info(
-                    f"{C.BOLD}{C.OKBLUE}[{self.name}:{self.port[0]}]-[MSG]: reading {bytes_to_read} / "
-                    f"{bytes_to_read[0]}]...{C.ENDC}",
-                    debug=self.debug)
-                data = bytearray(await self.connection[0].readexactly(n=bytes_to_read[0]))
-            except (ConnectionError, IOError) as e:
+                frames = await self.connection[0].read_frames()
+            except (ConnectionError, IOError, IncompleteReadError) as e:
                 self.ext_srv_connected.clear()
                 self.ext_srv_disconnected.set()
-                debug_info(f"CONNECTION LOST... {e.args}", debug=self.debug)
+                debug_info("CONNECTION LOST... {0.args}", e, debug=self.debug)
                 return False
             else:
                 try:
-                    await self._dispatch_return_data(data)
+                    for data in frames:
+                        await self._dispatch_return_data(data)
                 except TypeError as te:
                     raise TypeError(f"[{self.name}:{self.port[0]}]-[ERR]: Dispatching received data failed... "
                                     f"Aborting")
-            await asyncio.sleep(.001)
         
-        debug_info(f"{C.BOLD}{C.OKBLUE}[{self.server[0]}:{self.server[1]}]-[MSG]: CONNECTION CLOSED...{C.ENDC}",
-                   debug=self.debug)
+        debug_info("{0.BOLD}{0.OKBLUE}[{1.server[0]}:{1.server[1]}]-[MSG]: CONNECTION CLOSED...{0.ENDC}",
+                   C, self, debug=self.debug)
         return False
     
     async def _dispatch_return_data(self, data: bytearray) -> bool:
-        """Build an :class:`UPSTREAM_MESSAGE` and dispatch.
+        """Dispatch the raw data to the handler registered for its message type.
+        
+        The handlers are looked up by the type byte in :attr:`_RETURN_DATA_HANDLERS`. All messages but PORT_VALUE are
+        built into an :class:`UPSTREAM_MESSAGE` first, PORT_VALUE frames are handed over raw to
+        :meth:`_port_value_frame_set`.
         
         Args:
             data (bytearray): the raw data
@@ -869,27 +991,57 @@ class ADevice(ABC):
             (bool): Flag indicating Success/Failure.
             
         """
-        RETURN_MESSAGE = UpStreamMessageBuilder(data, debug=True).build()
-        if RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD:
-            await self.ext_srv_notification_set(RETURN_MESSAGE, debug=self.debug)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_PORT_VALUE:
-            await self.port_value_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK:
-            await self.cmd_feedback_notification_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR:
-            await self.error_notification_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_PORT_NOTIFICATION:
-            await self.port_notification_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_HUB_ATTACHED_IO:
-            await self.hub_attached_io_notification_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_DNS_HUB_ACTION:
-            await self.hub_action_notification_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_DNS_HUB_ALERT:
-            await self.hub_alert_notification_set(RETURN_MESSAGE)
-        else:
+        trace = tracelog.TRACE
+        if trace is not None:
+            trace.frame(DEVICE_RECEIVE, data[1], data[3], data)
+        try:
+            handler, decode = self._return_data_dispatch[data[2]]
+        except KeyError:
             raise TypeError(f"[{self.name}:{self.port}]-[ERR] Cannot dispatch CMD-ANSWER FROM DEVICE: {data.hex()}...")
+        if decode:
+            await handler(build_upstream_message(data))
+        else:
+            await handler(data)
+        if WATCHERS and (data[2] in self._WATCHED_MESSAGE_TYPES):
+            WATCHERS.notify(self)
         return True
     
+    @property
+    def _return_data_dispatch(self) -> Dict[int, Tuple[Callable[..., Awaitable], bool]]:
+        """The handlers of :attr:`_RETURN_DATA_HANDLERS` bound to this device, built on first use."""
+        try:
+            return self.__return_data_dispatch
+        except AttributeError:
+            self.__return_data_dispatch = {m_type: (getattr(self, name), decode)
+                                           for m_type, (name, decode) in self._RETURN_DATA_HANDLERS.items()}
+            return self.__return_data_dispatch
+    
+    async def _ext_srv_notification_dispatch(self, ext_srv_notification: EXT_SERVER_NOTIFICATION) -> None:
+        await self.ext_srv_notification_set(ext_srv_notification, debug=self.debug)
+        return
+    
+    async def _port_value_frame_set(self, frame: bytearray) -> None:
+        """Sets the current port value from a raw PORT_VALUE frame.
+        
+        Devices that keep their position state themselves override this to avoid building a :class:`PORT_VALUE`
+        for every notification.
+        
+        Parameters
+        ----------
+        frame : bytearray
+            The raw PORT_VALUE message.
+
+        Returns
+        -------
+        None
+        
+        """
+        value = PORT_VALUE(frame)
+        await self.port_value_set(value)
+        if self._thresholds:
+            self._thresholds.update(value.m_port_value)
+        return
+    
     @property
     @abstractmethod
     def E_CMD_STARTED(self) -> Event:
@@ -1062,22 +1214,60 @@ class ADevice(ABC):
         raise NotImplementedError
     
     async def _wait_until(self, cond: Callable, fut: Future):
-        while True:
-            if cond():
-                fut.set_result(True)
+        """Sets `fut`'s result to ``True`` once `cond` holds, see :data:`legoBTLE.device.Watchers.WATCHERS`.
+        
+        Returns right away, `fut` is waited for by the caller. Cancelling `fut` stops the watching. `cond` may look
+        at any device, so it is evaluated after the messages of all devices.
+        
+        """
+        watcher = WATCHERS.wait(cond)
+        
+        def _done(w: Future) -> None:
+            if fut.done() or w.cancelled():
                 return
-            await asyncio.sleep(0.001)
-    
-    async def _on_wait_cond_do(self, wait_cond: Union[Awaitable, Callable] = None) -> bool:
-        result: bool = False
-        if wait_cond:
-            if isinstance(wait_cond, Callable):
-                result = wait_cond()
-            elif isinstance(wait_cond, Awaitable):
-                result = await wait_cond
+            if w.exception() is not None:
+                fut.set_exception(w.exception())
             else:
-                raise TypeError(f"{wait_cond} is neither of type Awaitable nor Callable...")
-        return result
+                fut.set_result(True)
+        
+        watcher.add_done_callback(_done)
+        fut.add_done_callback(lambda f: watcher.cancel())
+        return
+    
+    async def _on_wait_cond_do(self, wait_cond: Union[Awaitable, Callable] = None, timeout: float = None) -> bool:
+        """Waits for the `wait_cond` of a command method, at most `timeout` seconds.
+        
+        A Callable is waited for with :data:`legoBTLE.device.Watchers.WATCHERS` after the messages of all devices,
+        the watcher is removed when the time is up. An Awaitable, e.g., the command task of another device or
+        ``WATCHERS.wait(cond, device)`` watching one device only, is awaited through :func:`asyncio.shield`, so it
+        runs on when the time is up. The command is sent in any case, errors of
+        `wait_cond` are reported only.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        bool
+            The result of `wait_cond`, ``False`` if the time was up or `wait_cond` failed.
+            
+        """
+        if not wait_cond:
+            return False
+        if isinstance(wait_cond, Callable):
+            fut = WATCHERS.wait(wait_cond)
+        elif isinstance(wait_cond, Awaitable):
+            fut = asyncio.shield(wait_cond)
+        else:
+            print(f"[{self.name}:{self.port[0]}]-[ERR]: {C.FAIL}{wait_cond} is neither of type Awaitable nor "
+                  f"Callable...{C.ENDC}")
+            return False
+        try:
+            return await asyncio.wait_for(fut, timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        except Exception as e:
+            print(f"[{self.name}:{self.port[0]}]-[ERR]: {C.FAIL}WAIT_COND FAILED... {e.args}{C.ENDC}")
+            return False
     
     @property
     @abstractmethod
@@ -9,8 +9,9 @@ The abstract :class:`AMotor` baseclass models common functions of a motor.
 """
 import asyncio
 from abc import abstractmethod
-from asyncio import CancelledError, Task
+from asyncio import Task
 from asyncio import Event
+from asyncio import Future
 from asyncio import sleep
 from collections import defaultdict
 from time import monotonic
@@ -21,9 +22,10 @@ from typing import Tuple
 from typing import Union
 
 import numpy as np
-from colorama import Fore, Style
+from colorama import Fore
 
 from legoBTLE.device.ADevice import ADevice
+from legoBTLE.device.StallGuard import STALL_GUARD
 from legoBTLE.legoWP.message.downstream import CMD_GOTO_ABS_POS_DEV
 from legoBTLE.legoWP.message.downstream import CMD_MODE_DATA_DIRECT
 from legoBTLE.legoWP.message.downstream import CMD_SET_ACC_DEACC_PROFILE
@@ -31,6 +33,7 @@ from legoBTLE.legoWP.message.downstream import CMD_START_MOVE_DEV_DEGREES
 from legoBTLE.legoWP.message.downstream import CMD_START_MOVE_DEV_TIME
 from legoBTLE.legoWP.message.downstream import CMD_START_PWR_DEV
 from legoBTLE.legoWP.message.downstream import CMD_START_SPEED_DEV
+from legoBTLE.legoWP.message.downstream import CommandTemplate
 from legoBTLE.legoWP.types import C
 from legoBTLE.legoWP.types import DIRECTIONAL_VALUE
 from legoBTLE.legoWP.types import MOVEMENT
@@ -54,6 +57,9 @@ class AMotor(ADevice):
     
     """
     
+    _streamed_speed: Optional[int] = None
+    """The last set point of :meth:`STREAM_SPEED`, ``None`` once a command has been sent since."""
+    
     @property
     @abstractmethod
     def time_to_stalled(self) -> float:
@@ -121,6 +127,36 @@ class AMotor(ADevice):
             if self.port_value is not None:
                 return self.port_value.m_port_value_RAD / self.gear_ratio
     
+    def watch_angle(self, angle: float, rising: bool = True, si: SI = SI.DEG) -> Future:
+        """Waits for the motor angle, as returned by :meth:`current_angle`, to reach `angle`.
+        
+        The angle is converted to a raw port value once and waited for with :meth:`watch_value`.
+        
+        Parameters
+        ----------
+        angle : float
+            The angle to wait for.
+        rising : bool, default True
+            If ``True``, angles ``>= angle`` reach it, otherwise angles ``<= angle``.
+        si : SI, default SI.DEG
+            The unit of `angle`.
+
+        Returns
+        -------
+        Future
+            Done with the raw port value that reached the angle. Cancel it to stop waiting.
+        
+        Examples
+        --------
+        Stopping the motor when it has turned beyond 90°::
+        
+            await motor.watch_angle(90.0)
+            await motor.START_SPEED_UNREGULATED(speed=0)
+            
+        """
+        degrees = np.rad2deg(angle) if si == SI.RAD else angle
+        return self.watch_value(degrees * self.gear_ratio, rising=rising)
+    
     def last_angle(self, si: SI = SI.DEG) -> float:
         """The last recorded motor angle.
         
@@ -157,6 +193,46 @@ class AMotor(ADevice):
     def stall_bias(self, stall_bias: float):
         raise NotImplementedError
     
+    @property
+    @abstractmethod
+    def stall_window(self) -> int:
+        """The number of PORT_VALUEs the velocity of the motor is computed from for stall detection.
+        
+        With ``0`` the motor is deemed stalled if it hasn't moved by :attr:`stall_bias` degrees within
+        :attr:`time_to_stalled`, otherwise if its velocity stayed below :attr:`stall_velocity` for
+        :attr:`time_to_stalled`, see :mod:`legoBTLE.device.StallGuard`.
+        
+        Returns
+        -------
+        int
+            The number of samples, ``0`` if stalling isn't detected by velocity.
+            
+        """
+        raise NotImplementedError
+    
+    @stall_window.setter
+    @abstractmethod
+    def stall_window(self, stall_window: int):
+        raise NotImplementedError
+    
+    @property
+    @abstractmethod
+    def stall_velocity(self) -> float:
+        """The velocity under which the motor is deemed stalled if :attr:`stall_window` is set.
+        
+        Returns
+        -------
+        float
+            The velocity in degrees per second per percent of the commanded speed.
+            
+        """
+        raise NotImplementedError
+    
+    @stall_velocity.setter
+    @abstractmethod
+    def stall_velocity(self, stall_velocity: float):
+        raise NotImplementedError
+    
     @property
     @abstractmethod
     def E_MOTOR_STALLED(self) -> Event:
@@ -214,60 +290,51 @@ class AMotor(ADevice):
                                     debug: Optional[bool] = None,
                                     ) -> Task:
         _debug = self.debug if debug is None else debug
-        task: Task = asyncio.create_task(self._stall_detection(debug=True))
-        debug_info_header(f"[{cmd_id}]-[MSG]", debug=_debug)
+        task: Task = STALL_GUARD.start()
+        debug_info_header("[{0}]-[MSG]", cmd_id, debug=_debug)
         
-        debug_info(f"Task: {task} -> STALL_DETECTION READY", debug=_debug)
-        debug_info(
-            f"ON_STALLED_ACTION:\t{self.ON_STALLED_ACTION.__name__ if self.ON_STALLED_ACTION is not None else f'{Fore.RED}NOT SET'}",
-            debug=_debug)
+        debug_info("Task: {0} -> STALL_DETECTION READY", task, debug=_debug)
+        debug_info("ON_STALLED_ACTION:\t{0}",
+                   self.ON_STALLED_ACTION.__name__ if self.ON_STALLED_ACTION is not None else f'{Fore.RED}NOT SET', debug=_debug)
         self.stall_guard = task
         return self.stall_guard
     
-    async def _stall_detection(self,
-                               debug: Optional[bool] = None,
-                               ) -> bool:
-        debug = self.debug if debug is None else debug
+    async def _stalled(self,
+                       delta: float,
+                       debug: Optional[bool] = None,
+                       ) -> bool:
+        """Sets :attr:`E_MOTOR_STALLED` and runs :attr:`ON_STALLED_ACTION`.
         
-        try:
-            while True:
-                await self.E_CMD_STARTED.wait()  # await command start in cmd_feedback_notification
-                await self._e_port_value_rcv.wait()  # await motor data is actually coming in
-                self.E_MOTOR_STALLED.clear()
-                if self.time_to_stalled is not None:  # is time after which motor is deemed stalled defined
-                    
-                    m0: float = self.port_value.m_port_value_DEG
-                    await asyncio.sleep(self.time_to_stalled)  # wait stall time
-                    
-                    delta = abs(self.port_value.m_port_value_DEG - m0)
-                    
-                    self.avg_speed = delta / self.time_to_stalled
-                    debug_info(f"{self._stall_detection.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}]:\r\n"
-                               f"DELTA_DEG:  {delta}\tDELTA_T:  {self.time_to_stalled}\tv:\'(°/s):  "
-                               f"{self.avg_speed}\tv_max\'(°/s):  {self.max_avg_speed}", debug=debug)
-                    
-                    if delta < self.stall_bias:  # stall_bias will have a value in any case
-                        debug_info(f"{self._stall_detection.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: "
-                                   f"{delta}  < {self.stall_bias}\t\t\t{C.FAIL}{C.BOLD}STALLED STALLED STALLED{C.ENDC}",
-                                   debug=debug)
-                        self.E_MOTOR_STALLED.set()  # motor is stalled now
-                        
-                        if self.ON_STALLED_ACTION is not None:  # is an action set for the case we stall
-                            debug_info(f"{self._stall_detection.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}] >>> CALLING {C.FAIL} "
-                                       f"{self.ON_STALLED_ACTION}", debug=debug)
-                            result = await self.ON_STALLED_ACTION
-                            debug_info(f"{self._stall_detection.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}] >>> CALLING {C.FAIL} "
-                                       f"succeeded with result {result}",
-                                       debug=debug)
-                            del self.ON_STALLED_ACTION  # action on stalled can only be used once, motor can't move anymore
-                            self._e_port_value_rcv.clear()
-                
-                else:  # user doesn't want any stall detection
-                    await asyncio.sleep(0.001)
+        Called by :data:`legoBTLE.device.StallGuard.STALL_GUARD` when the motor has not moved by
+        :attr:`stall_bias` within :attr:`time_to_stalled`.
         
-        except CancelledError as stall_detection_shutdown:
-            debug_info(f"{Style.BRIGHT}{Fore.BLUE}{12 * '*'}{Style.NORMAL} {self._stall_detection.__name__}", debug=debug)
+        Parameters
+        ----------
+        delta : float
+            The degrees moved since the motor was last seen moving.
+        debug : bool, optional
+            If ``True``, verbose messages to stdout.
+
+        Returns
+        -------
+        bool
+            ``True`` when done.
+            
+        """
+        debug = self.debug if debug is None else debug
         
+        debug_info("{0._stalled.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>: {1}  < "
+                   "{0.stall_bias}\t\t\t{2.FAIL}{2.BOLD}STALLED STALLED STALLED{2.ENDC}",
+                   self, delta, C, debug=debug)
+        self.E_MOTOR_STALLED.set()  # motor is stalled now
+        
+        if self.ON_STALLED_ACTION is not None:  # is an action set for the case we stall
+            debug_info("{0._stalled.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}] >>> "
+                       "CALLING {1.FAIL} {0.ON_STALLED_ACTION}", self, C, debug=debug)
+            result = await self.ON_STALLED_ACTION
+            debug_info("{0._stalled.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}] >>> "
+                       "CALLING {1.FAIL} succeeded with result {2}", self, C, result, debug=debug)
+            del self.ON_STALLED_ACTION  # action on stalled can only be used once, motor can't move anymore
         return True
     
     @property
@@ -436,7 +503,6 @@ class AMotor(ADevice):
             The counter-part of this method, i.e., controlling the acceleration.
         
         """
-        _wcd = None
         debug = self.debug if debug is None else debug
         
         command = CMD_SET_ACC_DEACC_PROFILE(
@@ -448,36 +514,30 @@ class AMotor(ADevice):
                 profile_nr=profile_nr,
                 )
         
-        debug_info_header(f"COMMAND {self.SET_DEC_PROFILE.__name__}:<{self.name}: {self.port[0]}>", debug=debug)
-        debug_info_begin(
-                f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: AT THE GATES: {C.WARNING}WAITING",
-                debug=debug)
+        debug_info_header("COMMAND {0.SET_DEC_PROFILE.__name__}:<{0.name}: {0.port[0]}>", self, debug=debug)
+        debug_info_begin("{0.SET_DEC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>: AT THE GATES: {1.WARNING}WAITING",
+                         self, C, debug=debug)
         async with self.port_free_condition:
             
-            debug_info_begin(
-                    f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}WAITING",
-                    debug=debug)
+            debug_info_begin("{0.SET_DEC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>: PORT_FREE.is_set(): "
+                             "{1.WARNING}WAITING", self, C, debug=debug)
             
             await self.port_free.wait()
             
-            debug_info_end(
-                    f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}SET",
-                    debug=debug)
-            debug_info(f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: LOCKING PORT",
-                       debug=debug)
+            debug_info_end("{0.SET_DEC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>: PORT_FREE.is_set(): "
+                           "{1.WARNING}SET", self, C, debug=debug)
+            debug_info("{0.SET_DEC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>: LOCKING PORT", self, debug=debug)
             
             self.port_free.clear()
             
             if delay_before:
-                debug_info_begin(
-                        f"{self.SET_DEC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying [send_cmd({command.COMMAND.hex()}) for: {delay_before}-T0]",
-                        debug=debug)
+                debug_info_begin("{0.SET_DEC_PROFILE.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>: delaying "
+                                 "[send_cmd({1.COMMAND!h}) for: {2}-T0]", self, command, delay_before, debug=debug)
                 
                 await sleep(delay_before)
                 
-                debug_info_end(
-                        f"{self.SET_DEC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying [send_cmd({command.COMMAND.hex()}) for: {delay_before}-T0]",
-                        debug=debug)
+                debug_info_end("{0.SET_DEC_PROFILE.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>: delaying "
+                               "[send_cmd({1.COMMAND!h}) for: {2}-T0]", self, command, delay_before, debug=debug)
             
             if not ms_to_zero_speed >= 0:
                 try:
@@ -485,11 +545,11 @@ class AMotor(ADevice):
                 except (TypeError, KeyError) as ke:
                     self.port_free.set()
                     self.port_free_condition.notify_all()
-                    debug_info(
-                            f"COMMAND {self.SET_DEC_PROFILE.__name__}: <{self.name}: {self.port[0]}>: {C.WARNING}EXCEPTION: No speed setting given, tied to find already saved profile - FAILED",
-                            debug=debug)
-                    debug_info_footer(f"COMMAND {self.SET_DEC_PROFILE.__name__}: <{self.name}: {self.port[0]}>",
-                                      debug=debug)
+                    debug_info("COMMAND {0.SET_DEC_PROFILE.__name__}: <{0.name}: {0.port[0]}>: {1.WARNING}EXCEPTION: "
+                               "No speed setting given, tied to find already saved profile - FAILED",
+                               self, C, debug=debug)
+                    debug_info_footer("COMMAND {0.SET_DEC_PROFILE.__name__}: <{0.name}: {0.port[0]}>",
+                                      self, debug=debug)
                     raise Exception(f"SET_DEC_PROFILE {profile_nr} not found... {ke.args}")
             else:
                 try:
@@ -498,54 +558,43 @@ class AMotor(ADevice):
                 except TypeError as te:
                     self.port_free.set()
                     self.port_free_condition.notify_all()
-                    debug_info(
-                            f"COMMAND {self.SET_DEC_PROFILE.__name__}: <{self.name}: {self.port[0]}>: {C.WARNING}EXCEPTION: SAVING PROFILE - FAILED",
-                            debug=debug)
-                    debug_info_footer(f"COMMAND {self.SET_DEC_PROFILE.__name__}: <{self.name}: {self.port[0]}>",
-                                      debug=debug)
+                    debug_info("COMMAND {0.SET_DEC_PROFILE.__name__}: <{0.name}: {0.port[0]}>: {1.WARNING}EXCEPTION: "
+                               "SAVING PROFILE - FAILED", self, C, debug=debug)
+                    debug_info_footer("COMMAND {0.SET_DEC_PROFILE.__name__}: <{0.name}: {0.port[0]}>",
+                                      self, debug=debug)
                     raise TypeError(f"SET_DEC_PROFILE {type(profile_nr)} wrong... {te.args}")
             
-            debug_info_begin(f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>:    SENDING CMD",
-                             debug=debug)
-            debug_info(f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>:    CMD: {command.COMMAND.hex()}",
-                       debug=debug)
+            debug_info_begin("{0.SET_DEC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>:    SENDING CMD",
+                             self, debug=debug)
+            debug_info("{0.SET_DEC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>:    CMD: {1.COMMAND!h}",
+                       self, command, debug=debug)
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
             
             s = await self._cmd_send(command)
             # await self.E_CMD_STARTED.wait()
             
-            debug_info_end(f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>:    CMD SENT",
-                           debug=debug)
+            debug_info_end("{0.SET_DEC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>:    CMD SENT", self, debug=debug)
             
             _t0 = monotonic()
-            debug_info(f"{self.SET_DEC_PROFILE.__name__} +*+ MOTOR {self.name} -- PORT {self.port[0]}>:    COMMAND END:    {C.WARNING}"
-                       f"WAITED -- t0={_t0}s", debug=debug)
+            debug_info("{0.SET_DEC_PROFILE.__name__} +*+ MOTOR {0.name} -- PORT {0.port[0]}>:    COMMAND END:    "
+                       "{1.WARNING}WAITED -- t0={2}s", self, C, _t0, debug=debug)
             
             await self.E_CMD_FINISHED.wait()
             
             _t0 = monotonic()
             if delay_after:
-                debug_info_begin(
-                        f"{self.SET_DEC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying [return from method] for: {delay_before}-T0",
-                        debug=debug)
+                debug_info_begin("{0.SET_DEC_PROFILE.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>: delaying "
+                                 "[return from method] for: {1}-T0", self, delay_before, debug=debug)
                 
                 await sleep(delay_after)
                 
-                debug_info_end(
-                    f"{self.SET_DEC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying [return from method] for: dt={monotonic() - _t0}s",
-                    debug=debug)
-            
-            try:
-                if _wcd is not None:
-                    _wcd.cancel()
-            except (CancelledError, AttributeError, TypeError):
-                pass
+                debug_info_end("{0.SET_DEC_PROFILE.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>: delaying "
+                               "[return from method] for: dt={1}s", self, monotonic() - _t0, debug=debug)
+            
             self.port_free_condition.notify_all()
-        debug_info_footer(f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>",
-                          debug=debug)
+        debug_info_footer("{0.SET_DEC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>", self, debug=debug)
         self.no_exec = False
         return s
     
@@ -593,8 +642,6 @@ class AMotor(ADevice):
         
         """
         debug = self.debug if debug is None else debug
-        _wcd = None
-
         command = CMD_SET_ACC_DEACC_PROFILE(
                 profile_type=SUB_COMMAND.SET_ACC_PROFILE,
                 port=self.port,
@@ -604,37 +651,31 @@ class AMotor(ADevice):
                 profile_nr=profile_nr,
                 )
         
-        debug_info_header(f"COMMAND {self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>", debug=debug)
-        debug_info_begin(
-                f"{self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: AT THE GATES: {C.WARNING}WAITING",
-                debug=debug)
+        debug_info_header("COMMAND {0.SET_ACC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>", self, debug=debug)
+        debug_info_begin("{0.SET_ACC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>: AT THE GATES: {1.WARNING}WAITING",
+                         self, C, debug=debug)
         
         async with self.port_free_condition:
             
-            debug_info_begin(
-                    f"{self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}WAITING",
-                    debug=debug)
+            debug_info_begin("{0.SET_ACC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>: PORT_FREE.is_set(): "
+                             "{1.WARNING}WAITING", self, C, debug=debug)
             
             await self.port_free.wait()
             
-            debug_info_end(
-                    f"{self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}SET",
-                    debug=debug)
-            debug_info(f"{self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: LOCKING PORT",
-                       debug=debug)
+            debug_info_end("{0.SET_ACC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>: PORT_FREE.is_set(): "
+                           "{1.WARNING}SET", self, C, debug=debug)
+            debug_info("{0.SET_ACC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>: LOCKING PORT", self, debug=debug)
             
             self.port_free.clear()
             
             if delay_before:
-                debug_info_begin(
-                        f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>",
-                        debug=debug)
+                debug_info_begin("{0.SET_ACC_PROFILE.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>",
+                                 self, debug=debug)
                 
                 await sleep(delay_before)
                 
-                debug_info_end(
-                        f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>",
-                        debug=debug)
+                debug_info_end("{0.SET_ACC_PROFILE.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>",
+                               self, debug=debug)
             
             if not ms_to_full_speed >= 0:
                 try:
@@ -643,11 +684,11 @@ class AMotor(ADevice):
                     self.port_free.set()
                     self.port_free_condition.notify_all()
                     
-                    debug_info(
-                            f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>: {C.WARNING}EXCEPTION: No speed setting given, tied to find already saved profile - FAILED",
-                            debug=debug)
-                    debug_info_footer(f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>",
-                                      debug=debug)
+                    debug_info("COMMAND {0.SET_ACC_PROFILE.__name__}: <{0.name}: {0.port[0]}>: {1.WARNING}EXCEPTION: "
+                               "No speed setting given, tied to find already saved profile - FAILED",
+                               self, C, debug=debug)
+                    debug_info_footer("COMMAND {0.SET_ACC_PROFILE.__name__}: <{0.name}: {0.port[0]}>",
+                                      self, debug=debug)
                     raise Exception(f"SET_ACC_PROFILE {profile_nr} not found... {ke.args}")
             else:
                 try:
@@ -657,52 +698,41 @@ class AMotor(ADevice):
                     self.port_free.set()
                     self.port_free_condition.notify_all()
                     
-                    debug_info(
-                            f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>: {C.WARNING}EXCEPTION: SAVING PROFILE - FAILED",
-                            debug=debug)
-                    debug_info_footer(f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>",
-                                      debug=debug)
+                    debug_info("COMMAND {0.SET_ACC_PROFILE.__name__}: <{0.name}: {0.port[0]}>: {1.WARNING}EXCEPTION: "
+                               "SAVING PROFILE - FAILED", self, C, debug=debug)
+                    debug_info_footer("COMMAND {0.SET_ACC_PROFILE.__name__}: <{0.name}: {0.port[0]}>",
+                                      self, debug=debug)
                     raise TypeError(f"Profile id [tp_id] is {profile_nr}... {te.args}")
             
-            debug_info_begin(f" {self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>:    SENDING CMD",
-                             debug=debug)
-            debug_info(f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>:    CMD: {command}",
-                       debug=debug)
+            debug_info_begin(" {0.SET_ACC_PROFILE.__name__} +*+ <{0.name}: {0.port[0]}>:    SENDING CMD",
+                             self, debug=debug)
+            debug_info("COMMAND {0.SET_ACC_PROFILE.__name__}: <{0.name}: {0.port[0]}>:    CMD: {1}",
+                       self, command, debug=debug)
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
             
             s = await self._cmd_send(command)
-            debug_info_end(f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>:    CMD SENT",
-                           debug=debug)
+            debug_info_end("COMMAND {0.SET_ACC_PROFILE.__name__}: <{0.name}: {0.port[0]}>:    CMD SENT",
+                           self, debug=debug)
             
             # await self.E_CMD_STARTED.wait()
             t0 = monotonic()
-            debug_info(f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>:    COMMAND END:    {C.WARNING}"
-                       f"WAITING -- t0={t0}s", debug=debug)
+            debug_info("{0.SET_ACC_PROFILE.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>:    COMMAND END:    "
+                       "{1.WARNING}WAITING -- t0={2}s", self, C, t0, debug=debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info(f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>:    COMMAND END:    {C.WARNING}"
-                       f"WAITED: dt={monotonic() - t0}s", debug=debug)
+            debug_info("{0.SET_ACC_PROFILE.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>:    COMMAND END:    "
+                       "{1.WARNING}WAITED: dt={2}s", self, C, monotonic() - t0, debug=debug)
             
             if delay_after:
-                debug_info_begin(
-                        f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying method return",
-                        debug=debug)
+                debug_info_begin("{0.SET_ACC_PROFILE.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>: delaying "
+                                 "method return", self, debug=debug)
                 
                 await sleep(delay_after)
-                debug_info_begin(
-                        f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying method return",
-                        debug=debug)
-            try:
-                if _wcd is not None:
-                    _wcd.cancel()
-            except (CancelledError, AttributeError, TypeError):
-                pass
-            
+                debug_info_begin("{0.SET_ACC_PROFILE.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>: delaying "
+                                 "method return", self, debug=debug)
             self.port_free_condition.notify_all()
-        debug_info_footer(f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>",
-                          debug=debug)
+        debug_info_footer("COMMAND {0.SET_ACC_PROFILE.__name__}: <{0.name}: {0.port[0]}>", self, debug=debug)
         return s
     
     async def START_MOVE_DISTANCE(self,
@@ -825,7 +855,6 @@ class AMotor(ADevice):
         <https://lego.github.io/lego-ble-wireless-protocol-docs/index.html#output-sub-command-startpower-power>`_.
         
         """
-        _wcd = None
         self.time_to_stalled = time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
@@ -844,59 +873,48 @@ class AMotor(ADevice):
                 completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS
                 )
         
-        debug_info_header(f"NAME: {self.name} / PORT: {self.port} # {self.START_POWER_UNREGULATED.__name__}", debug=debug)
-        debug_info_begin(f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # WAITING AT THE GATES",
-                         debug=debug)
+        debug_info_header("NAME: {0.name} / PORT: {0.port} # {0.START_POWER_UNREGULATED.__name__}", self, debug=debug)
+        debug_info_begin("NAME: {0.name} / PORT: {0.port} / {0.START_POWER_UNREGULATED.__name__} # WAITING AT THE "
+                         "GATES", self, debug=debug)
         async with self.port_free_condition:
             await self.port_free.wait()
             self.port_free.clear()
             
-            debug_info_end(f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # PASSED THE GATES",
-                           debug=debug)
+            debug_info_end("NAME: {0.name} / PORT: {0.port} / {0.START_POWER_UNREGULATED.__name__} # PASSED THE GATES",
+                           self, debug=debug)
             
             if delay_before is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # delay_before {delay_before}s",
-                        debug=debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port} / {0.START_POWER_UNREGULATED.__name__} # "
+                                 "delay_before {1}s", self, delay_before, debug=debug)
                 await sleep(delay_before)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # delay_before {delay_before}s",
-                        debug=debug)
+                debug_info_end("NAME: {0.name} / PORT: {0.port} / {0.START_POWER_UNREGULATED.__name__} # delay_before "
+                               "{1}s", self, delay_before, debug=debug)
             
-            debug_info_begin(
-                    f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # sending CMD", debug=debug)
+            debug_info_begin("NAME: {0.name} / PORT: {0.port} / {0.START_POWER_UNREGULATED.__name__} # sending CMD",
+                             self, debug=debug)
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
             
             s = await self._cmd_send(command)
             await self.E_CMD_STARTED.wait()
-            debug_info(f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # CMD: {command}",
-                       debug=debug)
-            debug_info_end(
-                    f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # sending CMD", debug=debug)
+            debug_info("NAME: {0.name} / PORT: {0.port} / {0.START_POWER_UNREGULATED.__name__} # CMD: {1}",
+                       self, command, debug=debug)
+            debug_info_end("NAME: {0.name} / PORT: {0.port} / {0.START_POWER_UNREGULATED.__name__} # sending CMD",
+                           self, debug=debug)
             t0 = monotonic()
-            debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=debug)
+            debug_info("WAITING FOR COMMAND END: t0={0}s", t0, debug=debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=debug)
+            debug_info("WAITED {0}s FOR COMMAND TO END...", monotonic() - t0, debug=debug)
             
             if delay_after is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # delay_after {delay_after}s",
-                        debug=debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port} / {0.START_POWER_UNREGULATED.__name__} # "
+                                 "delay_after {1}s", self, delay_after, debug=debug)
                 await sleep(delay_after)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # delay_after {delay_after}s",
-                        debug=debug)
-        
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port} # {self.START_POWER_UNREGULATED.__name__}",
-                          debug=debug)
+                debug_info_end("NAME: {0.name} / PORT: {0.port} / {0.START_POWER_UNREGULATED.__name__} # delay_after "
+                               "{1}s", self, delay_after, debug=debug)
+        
+        debug_info_footer("NAME: {0.name} / PORT: {0.port} # {0.START_POWER_UNREGULATED.__name__}", self, debug=debug)
         return s
     
     async def START_SPEED_UNREGULATED(
@@ -956,7 +974,6 @@ class AMotor(ADevice):
         for a complete command description.
         
         """
-        _wcd = None
         self.time_to_stalled = time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
@@ -977,31 +994,28 @@ class AMotor(ADevice):
                 use_acc_profile=use_acc_profile,
                 use_dec_profile=use_dec_profile)
         
-        debug_info_header(f"{self.name}:{self.port}.START_SPEED_UNREGULATED()", debug=debug)
-        debug_info(f"{self.name}:{self.port}.START_SPEED_UNREGULATED(): AT THE GATES - WAITING", debug=debug)
+        debug_info_header("{0.name}:{0.port}.START_SPEED_UNREGULATED()", self, debug=debug)
+        debug_info("{0.name}:{0.port}.START_SPEED_UNREGULATED(): AT THE GATES - WAITING", self, debug=debug)
         async with self.port_free_condition:
             await self.port_free.wait()
             self.port_free.clear()
             
-            debug_info(f"{self.name}:{self.port}.START_SPEED_UNREGULATED(): AT THE GATES - PASSED", debug=debug)
+            debug_info("{0.name}:{0.port}.START_SPEED_UNREGULATED(): AT THE GATES - PASSED", self, debug=debug)
             if delay_before is not None:
-                debug_info_begin(f"{self.name}:{self.port}.START_SPEED_UNREGULATED(): delay_before",
-                                 debug=debug)
+                debug_info_begin("{0.name}:{0.port}.START_SPEED_UNREGULATED(): delay_before", self, debug=debug)
                 await sleep(delay_before)
-                debug_info_end(f"{self.name}:{self.port}.START_SPEED_UNREGULATED(): delay_before",
-                               debug=debug)
+                debug_info_end("{0.name}:{0.port}.START_SPEED_UNREGULATED(): delay_before", self, debug=debug)
             
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
             
             s = await self._cmd_send(command)
             await self.E_CMD_STARTED.wait()
             t0 = monotonic()
-            debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=debug)
+            debug_info("WAITING FOR COMMAND END: t0={0}s", t0, debug=debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=debug)
+            debug_info("WAITED {0}s FOR COMMAND TO END...", monotonic() - t0, debug=debug)
             
             if self.debug:
                 print(f"{self.name}.START_SPEED SENDING COMPLETE...")
@@ -1018,12 +1032,6 @@ class AMotor(ADevice):
                           f"{C.WARNING}WAITING FOR {delay_after}... "
                           f"{C.BOLD}{C.UNDERLINE}{C.OKBLUE}DONE{C.ENDC}"
                           )
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-        
         return s
     
     async def GOTO_ABS_POS(
@@ -1083,8 +1091,6 @@ class AMotor(ADevice):
         self.time_to_stalled = time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
-        _wcd = None
-        
         if isinstance(speed, DIRECTIONAL_VALUE):
             _speed = speed.value * self.clockwise_direction
         else:
@@ -1108,78 +1114,63 @@ class AMotor(ADevice):
                 use_dec_profile=use_dec_profile,
                 )
         
-        debug_info_header(f"COMMAND {self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=_debug)
-        debug_info_begin(
-                f"{self.GOTO_ABS_POS.__name__} +*+ <{self.name}--{self.port[0]}>    AT THE GATES......{C.WARNING}WAITING",
-                debug=_debug)
+        debug_info_header("COMMAND {0.GOTO_ABS_POS.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>",
+                          self, debug=_debug)
+        debug_info_begin("{0.GOTO_ABS_POS.__name__} +*+ <{0.name}--{0.port[0]}>    AT THE "
+                         "GATES......{1.WARNING}WAITING", self, C, debug=_debug)
         
         async with self.port_free_condition:
             
-            debug_info_begin(
-                f"{self.GOTO_ABS_POS.__name__} +*+ <{self.name} -- {self.port[0]}>    PORT_FREE.is_set()......{C.WARNING}WAITING",
-                debug=_debug)
+            debug_info_begin("{0.GOTO_ABS_POS.__name__} +*+ <{0.name} -- {0.port[0]}>    "
+                             "PORT_FREE.is_set()......{1.WARNING}WAITING", self, C, debug=_debug)
             
             await self.port_free.wait()
             
-            debug_info_end(
-                    f"{self.GOTO_ABS_POS.__name__} +*+ <{self.name} -- {self.port[0]}>    PORT_FREE.is_set()......{C.WARNING}SET",
-                    debug=_debug)
-            debug_info(f"CMD {self.GOTO_ABS_POS.__name__} +*+ <{self.name} -- {self.port[0]}>    LOCKING PORT", debug=_debug)
+            debug_info_end("{0.GOTO_ABS_POS.__name__} +*+ <{0.name} -- {0.port[0]}>    "
+                           "PORT_FREE.is_set()......{1.WARNING}SET", self, C, debug=_debug)
+            debug_info("CMD {0.GOTO_ABS_POS.__name__} +*+ <{0.name} -- {0.port[0]}>    LOCKING PORT",
+                       self, debug=_debug)
             
             self.port_free.clear()
             
-            debug_info_end(f"{self.GOTO_ABS_POS.__name__} +*+ <{self.name} -- {self.port[0]}>    AT THE GATES......{C.WARNING}PASSED",
-                           debug=_debug)
+            debug_info_end("{0.GOTO_ABS_POS.__name__} +*+ <{0.name} -- {0.port[0]}>    AT THE "
+                           "GATES......{1.WARNING}PASSED", self, C, debug=_debug)
             
             if delay_before is not None:
-                debug_info_begin(
-                        f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying [send_cmd({command.COMMAND.hex()})] for: {delay_before}-T0]",
-                        debug=_debug)
+                debug_info_begin("{0.GOTO_ABS_POS.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>    delaying "
+                                 "[send_cmd({1.COMMAND!h})] for: {2}-T0]", self, command, delay_before, debug=_debug)
                 await sleep(delay_before)
-                debug_info_end(
-                        f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying [send_cmd({command.COMMAND.hex()})] for: {delay_before}-T0]",
-                        debug=_debug)
+                debug_info_end("{0.GOTO_ABS_POS.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>    delaying "
+                               "[send_cmd({1.COMMAND!h})] for: {2}-T0]", self, command, delay_before, debug=_debug)
             
             # _wait_until part
             if wait_cond is not None:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
             
-            debug_info_begin(
-                f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    sending {command.COMMAND.hex()}",
-                debug=_debug)
+            debug_info_begin("{0.GOTO_ABS_POS.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>    sending "
+                             "{1.COMMAND!h}", self, command, debug=_debug)
             s = await self._cmd_send(command)
             
             await self.E_CMD_STARTED.wait()
             t0 = monotonic()
-            debug_info_end(
-                    f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>     sending {command.COMMAND.hex()}",
-                    debug=_debug)
-            debug_info_begin(f"CMD {self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    waiting for "
-                             f"{command.COMMAND.hex()} to finish", debug=_debug)
+            debug_info_end("{0.GOTO_ABS_POS.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>     sending "
+                           "{1.COMMAND!h}", self, command, debug=_debug)
+            debug_info_begin("CMD {0.GOTO_ABS_POS.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>    waiting for "
+                             "{1.COMMAND!h} to finish", self, command, debug=_debug)
             
             await self.E_CMD_FINISHED.wait()
             
-            debug_info_end(
-                    f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    waiting for {command.COMMAND.hex()} to finish",
-                    debug=_debug)
+            debug_info_end("{0.GOTO_ABS_POS.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>    waiting for "
+                           "{1.COMMAND!h} to finish", self, command, debug=_debug)
             
             if delay_after is not None:
-                debug_info_begin(
-                        f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying return from method for {delay_after}",
-                        debug=_debug)
+                debug_info_begin("{0.GOTO_ABS_POS.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>    delaying "
+                                 "return from method for {1}", self, delay_after, debug=_debug)
                 await sleep(delay_after)
-                debug_info_end(
-                        f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>     delaying return from method for {delay_after}",
-                        debug=_debug)
-            try:
-                if _wcd is not None:
-                    _wcd.cancel()
-                    await _wcd
-            except (CancelledError, AttributeError):
-                pass
+                debug_info_end("{0.GOTO_ABS_POS.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>     delaying "
+                               "return from method for {1}", self, delay_after, debug=_debug)
             self.port_free_condition.notify_all()
-        debug_info_footer(f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=_debug)
+        debug_info_footer("{0.GOTO_ABS_POS.__name__} +*+ <MOTOR {0.name} -- PORT {0.port[0]}>", self, debug=_debug)
         return s
     
     async def STOP(self,
@@ -1212,9 +1203,7 @@ class AMotor(ADevice):
         
         debug = self.debug if debug is None else debug
         cmd_id = self.STOP.__qualname__ if cmd_id is None else cmd_id
-        debug_info_header(f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=debug)
-        
-        _wcd = None
+        debug_info_header("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>", cmd_id, self, debug=debug)
         
         if delay_before:
             await asyncio.sleep(delay_before)
@@ -1227,22 +1216,18 @@ class AMotor(ADevice):
                                        motor_position=0,
                                        )
         
-        debug_info_begin(f"    <MOTOR {self.name} -- PORT {self.port[0]}>: sending {command.COMMAND.hex()}",
-                         debug=debug)
+        debug_info_begin("    <MOTOR {0.name} -- PORT {0.port[0]}>: sending {1.COMMAND!h}", self, command, debug=debug)
         s = await self._cmd_send(command)
-        debug_info(f"        <MOTOR {self.name} -- PORT {self.port[0]}>: DELIVERED {command.COMMAND.hex()}",
-                   debug=debug)
+        debug_info("        <MOTOR {0.name} -- PORT {0.port[0]}>: DELIVERED {1.COMMAND!h}", self, command, debug=debug)
         await self.E_CMD_FINISHED.wait()
-        debug_info(
-            f"        <MOTOR {self.name} -- PORT {self.port[0]}>:    RECEIVED & EXECUTED {command.COMMAND.hex()}",
-            debug=debug)
-        debug_info_end(f"    <MOTOR {self.name} -- PORT {self.port[0]}>:    sending {command.COMMAND.hex()}",
-                       debug=debug)
+        debug_info("        <MOTOR {0.name} -- PORT {0.port[0]}>:    RECEIVED & EXECUTED {1.COMMAND!h}",
+                   self, command, debug=debug)
+        debug_info_end("    <MOTOR {0.name} -- PORT {0.port[0]}>:    sending {1.COMMAND!h}", self, command, debug=debug)
         
         if delay_after:
             await asyncio.sleep(delay_after)
         
-        debug_info_footer(f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=debug)
+        debug_info_footer("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>", cmd_id, self, debug=debug)
         
         return s
     
@@ -1256,7 +1241,6 @@ class AMotor(ADevice):
                            debug: Optional[bool] = None,
                            ):
         
-        _wcd = None
         debug = self.debug if debug is None else debug
         
         command = CMD_MODE_DATA_DIRECT(
@@ -1267,60 +1251,158 @@ class AMotor(ADevice):
                 motor_position=pos,
                 )
         
-        debug_info_header(f"THE {cmd_id} ++ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=debug)
+        debug_info_header("THE {0} ++ <MOTOR {1.name} -- PORT {1.port[0]}>", cmd_id, self, debug=debug)
         
-        debug_info(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>: LOCKING PORT...", debug=debug)
+        debug_info("{0} +*+ <{1.name}: {1.port[0]}>: LOCKING PORT...", cmd_id, self, debug=debug)
         self.port_free.clear()
-        debug_info(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>: AT THE GATES: {C.WARNING}PASSED",
-                   debug=debug)
+        debug_info("{0} +*+ <{1.name}: {1.port[0]}>: AT THE GATES: {2.WARNING}PASSED", cmd_id, self, C, debug=debug)
         
         # _wait_until part
         if wait_cond:
-            _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-            await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+            await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
         
-        debug_info_begin(
-                f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: SENDING {command.COMMAND.hex()}: {C.WARNING}WAITING",
-                debug=debug)
+        debug_info_begin("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>: SENDING {2.COMMAND!h}: {3.WARNING}WAITING",
+                         cmd_id, self, command, C, debug=debug)
         
         s = await self._cmd_send(command)
         
-        debug_info(
-                f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: SENDING {command.COMMAND.hex()}: {C.WARNING}SENT",
-                debug=debug)
+        debug_info("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>: SENDING {2.COMMAND!h}: {3.WARNING}SENT",
+                   cmd_id, self, command, C, debug=debug)
         # NO WAIT FOR CMD STARTED AS WRITEDIRECT
         t0 = monotonic()
-        debug_info_begin(
-            f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): WAITING FOR COMMAND TO END: t0={t0}s",
-            debug=debug)
+        debug_info_begin("{0} +*+ MOTOR {1.name} -- PORT {1.port[0]}.SET_POSITION(): WAITING FOR COMMAND TO END: "
+                         "t0={2}s", cmd_id, self, t0, debug=debug)
         await self.E_CMD_FINISHED.wait()  # Wait for CMD-Status other than `started<<<<<<<`
-        debug_info_end(
-            f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): WAITED {monotonic() - t0}s FOR COMMAND TO END",
-            debug=debug)
+        debug_info_end("{0} +*+ MOTOR {1.name} -- PORT {1.port[0]}.SET_POSITION(): WAITED {2}s FOR COMMAND TO END",
+                       cmd_id, self, monotonic() - t0, debug=debug)
         
-        debug_info_end(
-            f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): SENT, RECEIVED AND PROCESSED: {command.COMMAND.hex()}",
-            debug=debug)
+        debug_info_end("{0} +*+ MOTOR {1.name} -- PORT {1.port[0]}.SET_POSITION(): SENT, RECEIVED AND PROCESSED: "
+                       "{2.COMMAND!h}", cmd_id, self, command, debug=debug)
         if delay_after is not None:
-            debug_info_begin(f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): delay_after",
-                             debug=debug)
+            debug_info_begin("{0} +*+ MOTOR {1.name} -- PORT {1.port[0]}.SET_POSITION(): delay_after",
+                             cmd_id, self, debug=debug)
             
             await sleep(delay_after)
             
-            debug_info_end(f"CMD {cmd_id}MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): delay_after",
-                           debug=debug)
-        
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except CancelledError as ce:
-            print(f"CMD: {cmd_id} + ++ ) WAIT_CONDITION.cancel() error")
+            debug_info_end("CMD {0}MOTOR {1.name} -- PORT {1.port[0]}.SET_POSITION(): delay_after",
+                           cmd_id, self, debug=debug)
         
-        debug_info_footer(f"COMMAND {cmd_id}: <MOTOR {self.name} -- PORT {self.port[0]}> ++ dt = {monotonic() - t0}..",
-                          debug=debug)
+        debug_info_footer("COMMAND {0}: <MOTOR {1.name} -- PORT {1.port[0]}> ++ dt = {2}..",
+                          cmd_id, self, monotonic() - t0, debug=debug)
         
         return s
     
+    def START_SPEED_TEMPLATE(self,
+                             abs_max_power: int = 30,
+                             use_profile: int = 0,
+                             use_acc_profile: MOVEMENT = MOVEMENT.USE_ACC_PROFILE,
+                             use_dec_profile: MOVEMENT = MOVEMENT.USE_DEC_PROFILE,
+                             start_cond: MOVEMENT = MOVEMENT.ONSTART_EXEC_IMMEDIATELY,
+                             completion_cond: MOVEMENT = MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
+                             ) -> CommandTemplate:
+        """Encode START_SPEED_UNREGULATED once for streaming speed set points with :meth:`STREAM_SPEED`.
+        
+        Parameters
+        ----------
+        abs_max_power : int
+            The maximum power the motor is allowed to use 1% -100%.
+        use_profile : int, default 0
+            The acc/dec-profile nr. See also: :meth:`SET_ACC_PROFILE` and :meth:`SET_DEC_PROFILE`.
+        use_acc_profile : MOVEMENT
+        use_dec_profile : MOVEMENT
+        start_cond : MOVEMENT
+        completion_cond : MOVEMENT
+        
+        Returns
+        -------
+        CommandTemplate
+            The template, the speed is patched by :meth:`STREAM_SPEED`, the power can be changed with
+            ``template['abs_max_power'] = ...``.
+            
+        """
+        template: CommandTemplate = CMD_START_SPEED_DEV.template(
+                synced=False,
+                port=self.port,
+                start_cond=start_cond,
+                completion_cond=completion_cond,
+                abs_max_power=abs_max_power,
+                use_profile=use_profile,
+                use_acc_profile=use_acc_profile,
+                use_dec_profile=use_dec_profile)
+        template.hub_id = self.hub_id
+        return template
+    
+    async def STREAM_SPEED(self, template: CommandTemplate, speed: int) -> bool:
+        """Send a new speed set point using a template from :meth:`START_SPEED_TEMPLATE`.
+        
+        Only the speed byte of the template is patched. In contrast to :meth:`START_SPEED_UNREGULATED` neither
+        the port is locked nor the command feedback is waited for, the method returns as soon as the command is
+        handed to the connection. This is meant for control loops sending set points at a high rate.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        template : CommandTemplate
+            The template for this motor.
+        speed : int
+            The speed in percent -100% - 100%.
+            
+        Returns
+        -------
+        bool
+            ``True`` if the command could be sent, ``False`` otherwise.
+        
+        """
+        template['speed'] = speed * self.clockwise_direction  # normalize speed
+        self._streamed_speed = speed
+        STALL_GUARD.speed_set(self, speed)
+        return await self._template_send(template)
+    
+    def SET_POSITION_TEMPLATE(self,
+                              start_cond: MOVEMENT = MOVEMENT.ONSTART_EXEC_IMMEDIATELY,
+                              completion_cond: MOVEMENT = MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
+                              ) -> CommandTemplate:
+        """Encode SET_POSITION once for streaming positions with :meth:`STREAM_POSITION`.
+        
+        Returns
+        -------
+        CommandTemplate
+            The template.
+            
+        """
+        template: CommandTemplate = CMD_MODE_DATA_DIRECT.template(
+                port=self.port,
+                start_cond=start_cond,
+                completion_cond=completion_cond,
+                preset_mode=WRITEDIRECT_MODE.SET_POSITION,
+                )
+        template.hub_id = self.hub_id
+        return template
+    
+    async def STREAM_POSITION(self, template: CommandTemplate, pos: int) -> bool:
+        """Send a new position using a template from :meth:`SET_POSITION_TEMPLATE`.
+        
+        Only the position bytes of the template are patched, the port is not locked and no feedback is waited for.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        template : CommandTemplate
+            The template for this motor.
+        pos : int
+            The new position in degrees.
+            
+        Returns
+        -------
+        bool
+            ``True`` if the command could be sent, ``False`` otherwise.
+        
+        """
+        template['motor_position'] = pos
+        return await self._template_send(template)
+    
     async def START_MOVE_DEGREES(self,
                                  degrees: int,
                                  speed: Union[int, DIRECTIONAL_VALUE],
@@ -1398,8 +1480,6 @@ class AMotor(ADevice):
         self.time_to_stalled = time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
-        _wcd = None
-        
         if isinstance(speed, DIRECTIONAL_VALUE):
             _speed = speed.value * int(np.sign(degrees)) * self.clockwise_direction
         else:
@@ -1423,72 +1503,59 @@ class AMotor(ADevice):
                 use_dec_profile=use_dec_profile,
                 )
         
-        debug_info_header(f"COMMAND {cmd_id} +*+ <{self.name}: {self.port[0]}>", debug=debug)
-        debug_info_begin(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>: AT THE GATES: {C.WARNING}WAITING",
-                         debug=debug)
+        debug_info_header("COMMAND {0} +*+ <{1.name}: {1.port[0]}>", cmd_id, self, debug=debug)
+        debug_info_begin("{0} +*+ <{1.name}: {1.port[0]}>: AT THE GATES: {2.WARNING}WAITING",
+                         cmd_id, self, C, debug=debug)
         async with self.port_free_condition:
             
-            debug_info_begin(f"{cmd_id} +*+ {self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}WAITING",
-                             debug=debug)
-            debug_info(f"{cmd_id} +*+ {self.name}: {self.port[0]}>: PORT FREEE STATUS: {self.port_free.is_set()}",
-                       debug=debug)
+            debug_info_begin("{0} +*+ {1.name}: {1.port[0]}>: PORT_FREE.is_set(): {2.WARNING}WAITING",
+                             cmd_id, self, C, debug=debug)
+            debug_info("{0} +*+ {1.name}: {1.port[0]}>: PORT FREEE STATUS: {2}",
+                       cmd_id, self, self.port_free.is_set(), debug=debug)
             
             await self.port_free.wait()
             self.port_free.clear()
             
-            debug_info_end(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}SET",
-                           debug=debug)
-            debug_info(f"CMD {cmd_id} +*+ <{self.name}: {self.port[0]}>: LOCKING PORT", debug=debug)
+            debug_info_end("{0} +*+ <{1.name}: {1.port[0]}>: PORT_FREE.is_set(): {2.WARNING}SET",
+                           cmd_id, self, C, debug=debug)
+            debug_info("CMD {0} +*+ <{1.name}: {1.port[0]}>: LOCKING PORT", cmd_id, self, debug=debug)
             
-            debug_info_end(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>: AT THE GATES: {C.WARNING}PASSED",
-                           debug=debug)
+            debug_info_end("{0} +*+ <{1.name}: {1.port[0]}>: AT THE GATES: {2.WARNING}PASSED",
+                           cmd_id, self, C, debug=debug)
             
             if delay_before is not None:
-                debug_info_begin(
-                        f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying [send_cmd({command.COMMAND.hex()})] for: {delay_before}-T0]",
-                        debug=debug)
+                debug_info_begin("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>    delaying [send_cmd({2.COMMAND!h})] "
+                                 "for: {3}-T0]", cmd_id, self, command, delay_before, debug=debug)
                 await sleep(delay_before)
-                debug_info_end(
-                        f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying [send_cmd({command.COMMAND.hex()})] for: {delay_before}-T0]",
-                        debug=debug)
+                debug_info_end("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>    delaying [send_cmd({2.COMMAND!h})] "
+                               "for: {3}-T0]", cmd_id, self, command, delay_before, debug=debug)
             
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
             
-            debug_info_begin(
-                f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    sending {command.COMMAND.hex()}]",
-                debug=debug)
+            debug_info_begin("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>    sending {2.COMMAND!h}]",
+                             cmd_id, self, command, debug=debug)
             s = await self._cmd_send(command)
             await self.E_CMD_STARTED.wait()
             t0 = monotonic()
-            debug_info_end(
-                f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    sending {command.COMMAND.hex()}]",
-                debug=debug)
-            debug_info_begin(f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    waiting for "
-                             f"{command.COMMAND.hex()} to finish]", debug=debug)
+            debug_info_end("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>    sending {2.COMMAND!h}]",
+                           cmd_id, self, command, debug=debug)
+            debug_info_begin("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>    waiting for {2.COMMAND!h} to finish]",
+                             cmd_id, self, command, debug=debug)
             
             await self.E_CMD_FINISHED.wait()
-            debug_info_end(
-                    f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    waiting for {command.COMMAND.hex()} to finish]",
-                    debug=debug)
+            debug_info_end("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>    waiting for {2.COMMAND!h} to finish]",
+                           cmd_id, self, command, debug=debug)
             
             if delay_after:
-                debug_info_begin(
-                    f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying return from method for {delay_after}]",
-                    debug=debug)
+                debug_info_begin("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>    delaying return from method for {2}]",
+                                 cmd_id, self, delay_after, debug=debug)
                 await sleep(delay_after)
-                debug_info_end(
-                        f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying return from method for {delay_after}]",
-                        debug=debug)
-            try:
-                if _wcd is not None:
-                    _wcd.cancel()
-            except (CancelledError, AttributeError, TypeError):
-                pass
+                debug_info_end("{0} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>    delaying return from method for {2}]",
+                               cmd_id, self, delay_after, debug=debug)
             self.port_free_condition.notify_all()
-        debug_info_footer(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>", debug=debug)
+        debug_info_footer("{0} +*+ <{1.name}: {1.port[0]}>", cmd_id, self, debug=debug)
         return s
     
     async def START_SPEED_TIME(
@@ -1551,7 +1618,6 @@ class AMotor(ADevice):
         self.time_to_stalled = time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
-        _wcd = None
         if isinstance(speed, DIRECTIONAL_VALUE):
             _speed = speed.value * self.clockwise_direction  # normalize speed
         else:
@@ -1574,60 +1640,44 @@ class AMotor(ADevice):
             await self.port_free.wait()
             self.port_free.clear()
             
-            debug_info_end(f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # PASSED THE GATES",
-                           debug=_debug)
+            debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME # PASSED THE GATES",
+                           self, debug=_debug)
             
             if delay_before is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # delay_before {delay_before}s",
-                        debug=_debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME # delay_before {1}s",
+                                 self, delay_before, debug=_debug)
                 await sleep(delay_before)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # delay_before {delay_before}s",
-                        debug=_debug)
+                debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME # delay_before {1}s",
+                               self, delay_before, debug=_debug)
             
-            debug_info_begin(
-                    f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # sending CMD",
-                    debug=_debug)
+            debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME # sending CMD", self, debug=_debug)
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
             
             s = await self._cmd_send(command)
             
-            debug_info(f"CMD:  {cmd_id} +++ [{self.name}:{self.port}]: WAITING FOR COMMAND TO START", debug=_debug)
+            debug_info("CMD:  {0} +++ [{1.name}:{1.port}]: WAITING FOR COMMAND TO START", cmd_id, self, debug=_debug)
             await self.E_CMD_STARTED.wait()
             t0 = monotonic()
-            debug_info(f"CMD:  {cmd_id} +++ WAITING FOR COMMAND END: t0={t0}s", debug=_debug)
+            debug_info("CMD:  {0} +++ WAITING FOR COMMAND END: t0={1}s", cmd_id, t0, debug=_debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info(f"CMD:  {cmd_id} +++ WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=_debug)
+            debug_info("CMD:  {0} +++ WAITED {1}s FOR COMMAND TO END...", cmd_id, monotonic() - t0, debug=_debug)
             
-            debug_info(
-                f"CMD:  {cmd_id} +++ NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # CMD: {command}",
-                debug=_debug)
-            debug_info_end(
-                f"CMD:  {cmd_id} +++ NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # sending CMD",
-                debug=_debug)
+            debug_info("CMD:  {0} +++ NAME: {1.name} / PORT: {1.port[0]} / START_SPEED_TIME # CMD: {2}",
+                       cmd_id, self, command, debug=_debug)
+            debug_info_end("CMD:  {0} +++ NAME: {1.name} / PORT: {1.port[0]} / START_SPEED_TIME # sending CMD",
+                           cmd_id, self, debug=_debug)
             
             if delay_after is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # delay_after {delay_after}s",
-                        debug=_debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME # delay_after {1}s",
+                                 self, delay_after, debug=_debug)
                 await sleep(delay_after)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # delay_after {delay_after}s",
-                        debug=_debug)
-            
-            try:
-                if _wcd is not None:
-                    _wcd.cancel()  # end Task
-                    await _wcd  # check if really ended
-            except (CancelledError, AttributeError, TypeError):
-                pass
+                debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME # delay_after {1}s",
+                               self, delay_after, debug=_debug)
+            
             self.port_free_condition.notify_all()
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_SPEED_TIME",
-                          debug=_debug)
+        debug_info_footer("NAME: {0.name} / PORT: {0.port[0]} # START_SPEED_TIME", self, debug=_debug)
         
         return s
     
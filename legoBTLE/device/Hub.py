@@ -10,7 +10,6 @@ import asyncio
 import uuid
 from asyncio import Condition
 from asyncio import Event
-from asyncio.streams import StreamReader
 from asyncio.streams import StreamWriter
 from datetime import datetime
 from typing import Callable
@@ -41,6 +40,7 @@ from legoBTLE.legoWP.types import HUB_COLOR
 from legoBTLE.legoWP.types import PERIPHERAL_EVENT
 from legoBTLE.legoWP.types import PORT
 from legoBTLE.legoWP.types import WRITEDIRECT_MODE
+from legoBTLE.networking.framing import ClientFrameProtocol
 
 
 class Hub(ADevice):
@@ -86,7 +86,7 @@ class Hub(ADevice):
         self._name: str = name
         
         self._server = server
-        self._connection: [StreamReader, StreamWriter] = None
+        self._connection: [ClientFrameProtocol, StreamWriter] = None
         self._external_srv_notification: Optional[EXT_SERVER_NOTIFICATION] = None
         self._external_srv_notification_log: List[Tuple[float, EXT_SERVER_NOTIFICATION]] = []
         self._ext_srv_connected: Event = Event()
@@ -414,10 +414,10 @@ class Hub(ADevice):
         return self._cmd_feedback_log
     
     @property
-    def connection(self) -> (StreamReader, StreamWriter):
+    def connection(self) -> (ClientFrameProtocol, StreamWriter):
         return self._connection
     
-    def connection_set(self, connection: [StreamReader, StreamWriter]):
+    def connection_set(self, connection: [ClientFrameProtocol, StreamWriter]):
         self._ext_srv_connected.set()
         self._connection = connection
         return
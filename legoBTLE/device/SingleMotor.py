@@ -8,7 +8,6 @@ A concrete :class:`AMotor`.
 import uuid
 from asyncio import Condition, Task
 from asyncio import Event
-from asyncio.streams import StreamReader
 from asyncio.streams import StreamWriter
 from collections import defaultdict
 from datetime import datetime
@@ -20,6 +19,7 @@ from typing import Union
 import numpy as np
 
 from legoBTLE.device.AMotor import AMotor
+from legoBTLE.device.StallGuard import STALL_GUARD
 from legoBTLE.legoWP.message.downstream import DOWNSTREAM_MESSAGE
 from legoBTLE.legoWP.message.upstream import DEV_GENERIC_ERROR_NOTIFICATION
 from legoBTLE.legoWP.message.upstream import DEV_PORT_NOTIFICATION
@@ -29,10 +29,12 @@ from legoBTLE.legoWP.message.upstream import HUB_ALERT_NOTIFICATION
 from legoBTLE.legoWP.message.upstream import HUB_ATTACHED_IO_NOTIFICATION
 from legoBTLE.legoWP.message.upstream import PORT_CMD_FEEDBACK
 from legoBTLE.legoWP.message.upstream import PORT_VALUE
+from legoBTLE.legoWP.message.upstream import decode_port_value
 from legoBTLE.legoWP.types import CMD_FEEDBACK_MSG
 from legoBTLE.legoWP.types import MOVEMENT
 from legoBTLE.legoWP.types import PERIPHERAL_EVENT
 from legoBTLE.legoWP.types import PORT
+from legoBTLE.networking.framing import ClientFrameProtocol
 from legoBTLE.networking.prettyprint.debug import debug_info
 from legoBTLE.networking.prettyprint.debug import debug_info_begin
 from legoBTLE.networking.prettyprint.debug import debug_info_end
@@ -54,6 +56,8 @@ class SingleMotor(AMotor):
                  on_stall: Callable[[], Awaitable] = None,
                  time_to_stalled: float = 0.05,
                  stall_bias: float = 0.2,
+                 stall_window: int = 0,
+                 stall_velocity: float = 1.0,
                  wheel_diameter: float = 100.0,
                  gear_ratio: float = 1.0,
                  clockwise: MOVEMENT = MOVEMENT.CLOCKWISE,
@@ -83,6 +87,11 @@ class SingleMotor(AMotor):
         ----------------
         stall_bias : float, default 0.2
             The range :math:`[-$stall_bias$, $stall_bias$]` of degrees between which a moving motor is still considered stalled.
+        stall_window : int, default 0
+            The number of port values the velocity for detecting stalling is computed from, ``0`` uses `stall_bias`.
+        stall_velocity : float, default 1.0
+            With `stall_window`, the velocity in degrees per second per percent of the commanded speed below which the
+            motor is considered stalled.
         wheel_diameter : float, default 100.0
             The diameter in mm of the attached wheel. Used for determining the traveled distance in mm.
         max_steering_angle : float, optional
@@ -121,6 +130,8 @@ class SingleMotor(AMotor):
         
         self._time_to_stalled: float = time_to_stalled
         self._stall_bias: float = stall_bias
+        self._stall_window: int = stall_window
+        self._stall_velocity: float = stall_velocity
         self._ON_STALLED_ACTION: Optional[Callable[[], Awaitable]] = on_stall
         self._E_MOTOR_STALLED: Event = Event()
         self._E_DETECT_STALLING: Event = Event()
@@ -138,7 +149,7 @@ class SingleMotor(AMotor):
         self._port2hub_connected: Event = Event()
         self._ext_srv_notification: Optional[EXT_SERVER_NOTIFICATION] = None
         self._ext_srv_notification_log: Optional[List[Tuple[float, EXT_SERVER_NOTIFICATION]]] = None
-        self._connection: Optional[Tuple[StreamReader, StreamWriter]] = None
+        self._connection: Optional[Tuple[ClientFrameProtocol, StreamWriter]] = None
         self._error: Event = Event()
         self._ext_srv_disconnected: Event = Event()
         self._ext_srv_disconnected.set()
@@ -151,7 +162,10 @@ class SingleMotor(AMotor):
         self._distance: float = 0.0
         self._total_distance: float = 0.0
         
+        self._current_frame: Optional[bytearray] = None
+        self._current_position: float = 0.0
         self._current_value: Optional[PORT_VALUE] = None
+        self._last_frame: Optional[bytearray] = None
         self._last_value: Optional[PORT_VALUE] = None
         
         self._measure_distance_start = None
@@ -300,6 +314,8 @@ class SingleMotor(AMotor):
 
     @property
     def port_value(self) -> PORT_VALUE:
+        if self._current_value is None and self._current_frame is not None:
+            self._current_value = PORT_VALUE(self._current_frame)
         return self._current_value
     
     async def port_value_set(self, value: PORT_VALUE) -> None:
@@ -314,12 +330,32 @@ class SingleMotor(AMotor):
         -------
         None
         """
-        self._last_value = self._current_value if self._current_value is not None else value
-        self._current_value = value
-        self.__e_port_value_rcv.set()
-        debug_info(f"{self._name}:{self._port[0]} >>>>>>>> CURRENTVALUE: {value.m_port_value_DEG}", debug=self.debug)
-        self._total_distance += abs(self._current_value.m_port_value_DEG - self._last_value.m_port_value_DEG)
+        self._port_value_update(value.COMMAND, value.m_port_value_DEG, value)
+        return
+    
+    async def _port_value_frame_set(self, frame: bytearray) -> None:
+        self._port_value_update(frame, decode_port_value(frame))
+        return
+    
+    def _port_value_update(self, frame: bytearray, position: float, value: Optional[PORT_VALUE] = None) -> None:
+        """Moves the current value to the last value and sets the new one.
+        
+        The :class:`PORT_VALUE` objects are only built when :attr:`port_value` or :attr:`last_value` are read.
         
+        """
+        if self._current_frame is None:
+            self._last_frame, self._last_value, last_position = frame, value, position
+        else:
+            self._last_frame, self._last_value, last_position = (self._current_frame, self._current_value,
+                                                                 self._current_position)
+        self._current_frame, self._current_value, self._current_position = frame, value, position
+        self.__e_port_value_rcv.set()
+        if self.debug:
+            debug_info("{0._name}:{0._port[0]} >>>>>>>> CURRENTVALUE: {1}", self, position, debug=self.debug)
+        self._total_distance += abs(position - last_position)
+        STALL_GUARD.update(self, position)
+        if self._thresholds:
+            self._thresholds.update(position)
         return
     
     @property
@@ -328,6 +364,8 @@ class SingleMotor(AMotor):
     
     @property
     def last_value(self) -> PORT_VALUE:
+        if self._last_value is None and self._last_frame is not None:
+            self._last_value = PORT_VALUE(self._last_frame)
         return self._last_value
 
     @property
@@ -382,6 +420,22 @@ class SingleMotor(AMotor):
     def stall_bias(self, stall_bias: float):
         self._stall_bias = stall_bias
     
+    @property
+    def stall_window(self) -> int:
+        return self._stall_window
+    
+    @stall_window.setter
+    def stall_window(self, stall_window: int):
+        self._stall_window = stall_window
+    
+    @property
+    def stall_velocity(self) -> float:
+        return self._stall_velocity
+    
+    @stall_velocity.setter
+    def stall_velocity(self, stall_velocity: float):
+        self._stall_velocity = stall_velocity
+    
     @property
     def current_profile(self) -> defaultdict:
         return self._current_profile
@@ -446,15 +500,15 @@ class SingleMotor(AMotor):
         self._server = server
     
     @property
-    def connection(self) -> Tuple[StreamReader, StreamWriter]:
+    def connection(self) -> Tuple[ClientFrameProtocol, StreamWriter]:
         return self._connection
     
-    def connection_set(self, connection: Tuple[StreamReader, StreamWriter]) -> None:
+    def connection_set(self, connection: Tuple[ClientFrameProtocol, StreamWriter]) -> None:
         """Sets a new Server <-> device Read/write connection.
         
         Parameters
         ----------
-        connection : tuple[StreamReader, StreamWriter]
+        connection : tuple[ClientFrameProtocol, StreamWriter]
             The connection.
         
         Returns
@@ -608,7 +662,7 @@ class SingleMotor(AMotor):
         """
         debug = self._debug if debug is None else debug
         
-        debug_info_header(f"[{self._name}].[{__name__}]", debug)
+        debug_info_header("[{0._name}].[{1}]", self, __name__, debug=debug)
         if notification is not None:
             self._ext_srv_notification = notification
             print(f"IN EXTSERVER_NOTIFICATION: {self._name} / NOT NONE {bytes(self._ext_srv_notification.m_event)} / TYPE: {PERIPHERAL_EVENT.EXT_SRV_CONNECTED}")
@@ -641,6 +695,7 @@ class SingleMotor(AMotor):
     @last_cmd_snt.setter
     def last_cmd_snt(self, command: DOWNSTREAM_MESSAGE):
         self._last_cmd_snt = command
+        self._streamed_speed = None
         return
     
     @property
@@ -691,15 +746,14 @@ class SingleMotor(AMotor):
         """
         self._hub_attached_io_notification = io_notification
         if io_notification.m_io_event == PERIPHERAL_EVENT.IO_ATTACHED:
-            debug_info(
-                    f"[{self._name}:{self._port[0]}]-[MSG]: MOTOR {self._name} is ATTACHED... "
-                    f"{io_notification.m_device_type}", debug=self._debug)
+            debug_info("[{0._name}:{0._port[0]}]-[MSG]: MOTOR {0._name} is ATTACHED... {1.m_device_type}",
+                       self, io_notification, debug=self._debug)
             self.ext_srv_connected.set()
             self._ext_srv_disconnected.clear()
             self._port_free.set()
             self._port2hub_connected.set()
         elif io_notification.m_io_event == PERIPHERAL_EVENT.IO_DETACHED:
-            debug_info(f"[{self._name}:{self._port[0]}]-[MSG]: MOTOR {self._name} is DETACHED...", debug=self._debug)
+            debug_info("[{0._name}:{0._port[0]}]-[MSG]: MOTOR {0._name} is DETACHED...", self, debug=self._debug)
             self.ext_srv_connected.clear()
             self._ext_srv_disconnected.set()
             self._port_free.clear()
@@ -709,16 +763,16 @@ class SingleMotor(AMotor):
     
     @property
     def measure_start(self) -> Tuple[float, float]:
-        self._measure_distance_start = (self._current_value.m_port_value, datetime.timestamp(datetime.now()))
-        debug_info(f"[{self._name}:{self._port[0]}]-[TIME_STOP]: STOP TIME: {self._measure_distance_end[1]}\t"
-                  f"VALUE: {self._measure_distance_end[0]}", debug=self._debug)
+        self._measure_distance_start = (self._current_position, datetime.timestamp(datetime.now()))
+        debug_info("[{0._name}:{0._port[0]}]-[TIME_STOP]: STOP TIME: {0._measure_distance_end[1]}\tVALUE: "
+                   "{0._measure_distance_end[0]}", self, debug=self._debug)
         return self._measure_distance_start
     
     @property
     def measure_end(self) -> Tuple[float, float]:
-        self._measure_distance_end = (self._current_value.m_port_value, datetime.timestamp(datetime.now()))
-        debug_info(f"[{self._name}:{self._port[0]}]-[TIME_STOP]: STOP TIME: {self._measure_distance_end[1]}\t"
-                  f"VALUE: {self._measure_distance_end[0]}", debug=self._debug)
+        self._measure_distance_end = (self._current_position, datetime.timestamp(datetime.now()))
+        debug_info("[{0._name}:{0._port[0]}]-[TIME_STOP]: STOP TIME: {0._measure_distance_end[1]}\tVALUE: "
+                   "{0._measure_distance_end[0]}", self, debug=self._debug)
         return self._measure_distance_end
     
     @property
@@ -753,56 +807,61 @@ class SingleMotor(AMotor):
             This is a setter
             
         """
-        debug_info_header(f"<{self.name} -- {self.port[0]}> - CMD_FEEDBACK", debug=self._debug)
-        debug_info_begin(f"<{self.name}:{self.port[0]}> - CMD_FEEDBACK: NOTIFICATION-MSG-DETAILS", debug=self._debug)
-        debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: PORT: {notification.m_port[0]}", debug=self._debug)
-        debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: MSG_CONTENT: {notification.COMMAND.hex()}", debug=self._debug)
+        debug_info_header("<{0.name} -- {0.port[0]}> - CMD_FEEDBACK", self, debug=self._debug)
+        debug_info_begin("<{0.name}:{0.port[0]}> - CMD_FEEDBACK: NOTIFICATION-MSG-DETAILS", self, debug=self._debug)
+        debug_info("<{0.name}:{0.port[0]}> - <CMD_FEEDBACK]: PORT: {1.m_port[0]}",
+                   self, notification, debug=self._debug)
+        debug_info("<{0.name}:{0.port[0]}> - <CMD_FEEDBACK]: MSG_CONTENT: {1.COMMAND!h}",
+                   self, notification, debug=self._debug)
         if notification.COMMAND[len(notification.COMMAND) - 1] == int.from_bytes(b'\x01', 'little'):
             
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS: CMD STARTED", debug=self._debug)
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {notification.COMMAND[len(notification.COMMAND) - 1]}", debug=self._debug)
+            debug_info("[{0.name}:{1.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS: CMD STARTED",
+                       self, notification, debug=self._debug)
+            debug_info("[{0.name}:{1.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {2}",
+                       self, notification, notification.COMMAND[len(notification.COMMAND) - 1], debug=self._debug)
             
             self._set_cmd_running(True)
-            if self._stall_guard is None:  # if stall_guard not running start it
-                self.__e_port_value_rcv.clear()
+            self.__e_port_value_rcv.clear()
+            if (self._stall_guard is None) or self._stall_guard.done():  # if stall_guard not running start it
                 await self._stall_detection_init(f"{self._name}.STALL_GUARD INITIALISED", debug=self._debug)  # stall_guard now running
-                debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:\tSTALL_GUARD RUNNING", debug=self._debug)
+                debug_info("[{0.name}:{1.m_port[0]}]-[CMD_FEEDBACK]:\tSTALL_GUARD RUNNING",
+                           self, notification, debug=self._debug)
+            STALL_GUARD.arm(self)
             self._E_DETECT_STALLING.set()
             
             self._port_free.clear()
             
-            debug_info_end(f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
-                           debug=self._debug)
+            debug_info_end("[{0.name}:{0.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{1.m_port[0]}",
+                           self, notification, debug=self._debug)
             
         elif notification.COMMAND[len(notification.COMMAND) - 1] == int.from_bytes(b'\x0a', 'little'):
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: REPORTED CMD-STATUS: CMD EXECUTED",
-                       debug=self._debug)
-            debug_info(
-                    f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {notification.COMMAND[len(notification.COMMAND) - 1]}",
-                    debug=self._debug)
+            debug_info("[{0.name}:{1.m_port[0]}]-[CMD_FEEDBACK]: REPORTED CMD-STATUS: CMD EXECUTED",
+                       self, notification, debug=self._debug)
+            debug_info("[{0.name}:{1.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {2}",
+                       self, notification, notification.COMMAND[len(notification.COMMAND) - 1], debug=self._debug)
             
             self._set_cmd_running(False)
+            STALL_GUARD.disarm(self)
             self.__e_port_value_rcv.clear()
             self._port_free.set()
             
             # self.E_MOTOR_STALLED.clear()
             
-            debug_info_end(
-                    f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
-                    debug=self._debug)
+            debug_info_end("[{0.name}:{0.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{1.m_port[0]}",
+                           self, notification, debug=self._debug)
         else:
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:REPORTED CMD-STATUS: CMD DISCARDED",
-                       debug=self._debug)
-            debug_info(
-                f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:CMD-STATUS CODE: {notification.COMMAND[len(notification.COMMAND) - 1]}",
-                debug=self._debug)
+            debug_info("[{0.name}:{1.m_port[0]}]-[CMD_FEEDBACK]:REPORTED CMD-STATUS: CMD DISCARDED",
+                       self, notification, debug=self._debug)
+            debug_info("[{0.name}:{1.m_port[0]}]-[CMD_FEEDBACK]:CMD-STATUS CODE: {2}",
+                       self, notification, notification.COMMAND[len(notification.COMMAND) - 1], debug=self._debug)
 
             self._set_cmd_running(False)
+            STALL_GUARD.disarm(self)
             self.__e_port_value_rcv.clear()
             self.port_free.set()
             
-        debug_info_end(f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS", debug=self._debug)
-        debug_info_footer(f"<{self.name} -- {self.port[0]}> - CMD_FEEDBACK", debug=self._debug)
+        debug_info_end("[{0.name}:{0.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS", self, debug=self._debug)
+        debug_info_footer("<{0.name} -- {0.port[0]}> - CMD_FEEDBACK", self, debug=self._debug)
         # self._cmd_feedback_log.append((datetime.timestamp(datetime.now()), notification.m_cmd_status))
         self._current_cmd_feedback_notification = notification
         return True
@@ -0,0 +1,351 @@
+"""
+legoBTLE.device.StallGuard
+==========================
+
+This module contains :class:`StallGuard`, the stall detection shared by all motors of a process.
+
+A motor is deemed stalled if, while one of its commands is running, it has not been seen moving for
+:attr:`AMotor.time_to_stalled` seconds. How a motor is seen moving depends on :attr:`AMotor.stall_window`:
+
+``0``
+    The motor has moved by at least :attr:`AMotor.stall_bias` degrees since it was last seen moving.
+
+``n > 0``
+    The least-squares velocity through the last `n` PORT_VALUEs (see :class:`VelocityWindow`) reaches
+    :attr:`AMotor.stall_velocity` degrees per second per percent of the commanded speed. Slow creep is detected
+    as well as a motor that stopped, and single samples jittering around the position don't count as movement.
+
+Instead of one task per motor that wakes up every :attr:`AMotor.time_to_stalled` seconds, all motors share one
+hashed timer wheel: the command feedback "command started" arms a timer for the motor, each
+PORT_VALUE showing that the motor has moved sets the timer's deadline anew, and the end of the command removes it.
+The task behind the wheel advances it tick by tick only while timers are set; without running commands it waits
+and costs nothing. Only a timer that actually expires calls :meth:`AMotor._stalled`, which sets
+:attr:`AMotor.E_MOTOR_STALLED` and runs :attr:`AMotor.ON_STALLED_ACTION`.
+
+"""
+import asyncio
+import math
+from asyncio import Event
+from asyncio import Task
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+
+from legoBTLE.networking.prettyprint.debug import debug_info
+
+
+class _Timer:
+    """The stall timer of one motor.
+
+    `position` is the motor's position when it was last seen moving, ``None`` until the first PORT_VALUE after the
+    command has started. `expires` is the tick the timer expires at and `slot` the wheel slot holding it, ``None``
+    while no deadline is set. `window` holds the samples if the motor is watched by velocity, `speed` is the
+    commanded speed in percent.
+
+    """
+    __slots__ = ('motor', 'position', 'since', 'expires', 'slot', 'window', 'speed')
+
+    def __init__(self, motor: 'AMotor'):
+        self.motor: 'AMotor' = motor
+        self.position: Optional[float] = None
+        self.since: float = 0.0
+        self.expires: int = 0
+        self.slot: Optional[int] = None
+        self.window: Optional[VelocityWindow] = None
+        self.speed: Optional[float] = None
+        return
+
+
+class VelocityWindow:
+    """The last `size` samples ``(time, degrees)`` of a motor and the least-squares velocity through them.
+
+    The sums the velocity is computed from are updated by the sample added and the one it replaces, adding a sample
+    costs the same for any `size`. The samples are stored relative to an origin that moves to the oldest sample
+    each time the ring has been filled anew, so rounding errors can't pile up in the sums.
+
+    Examples
+    --------
+    >>> window = VelocityWindow(4)
+    >>> for t, x in ((0.0, 0.0), (0.1, 11.0), (0.2, 19.0), (0.3, 30.0), (0.4, 40.0)):
+    ...     window.add(t, x)
+    >>> round(window.velocity(), 6)
+    98.0
+
+    """
+    __slots__ = ('size', '_t', '_x', '_next', '_count', '_origin_t', '_origin_x', '_st', '_sx', '_stt', '_stx')
+
+    def __init__(self, size: int):
+        """
+
+        Parameters
+        ----------
+        size : int
+            The number of samples the velocity is computed from, at least 2.
+        """
+        self.size: int = max(size, 2)
+        self._t: List[float] = [0.0] * self.size
+        self._x: List[float] = [0.0] * self.size
+        self._next: int = 0
+        self._count: int = 0
+        self._origin_t: Optional[float] = None
+        self._origin_x: float = 0.0
+        self._st: float = 0.0
+        self._sx: float = 0.0
+        self._stt: float = 0.0
+        self._stx: float = 0.0
+        return
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, t: float, x: float) -> None:
+        """Adds a sample, the oldest one is dropped if the window is full.
+
+        Parameters
+        ----------
+        t : float
+            The time of the sample in seconds.
+        x : float
+            The position of the motor in degrees.
+
+        """
+        if self._origin_t is None:
+            self._origin_t, self._origin_x = t, x
+        t -= self._origin_t
+        x -= self._origin_x
+        i = self._next
+        if self._count == self.size:
+            ot, ox = self._t[i], self._x[i]
+            self._st -= ot
+            self._sx -= ox
+            self._stt -= ot * ot
+            self._stx -= ot * ox
+        else:
+            self._count += 1
+        self._t[i], self._x[i] = t, x
+        self._st += t
+        self._sx += x
+        self._stt += t * t
+        self._stx += t * x
+        self._next = (i + 1) % self.size
+        if self._next == 0:
+            self._rebase()
+        return
+
+    def _rebase(self) -> None:
+        # the ring is full and starts at index 0 with the oldest sample
+        dt, dx = self._t[0], self._x[0]
+        self._origin_t += dt
+        self._origin_x += dx
+        self._st = self._sx = self._stt = self._stx = 0.0
+        for i in range(self.size):
+            t, x = self._t[i] - dt, self._x[i] - dx
+            self._t[i], self._x[i] = t, x
+            self._st += t
+            self._sx += x
+            self._stt += t * t
+            self._stx += t * x
+        return
+
+    def velocity(self) -> Optional[float]:
+        """The slope of the least-squares line through the samples in degrees per second.
+
+        Returns
+        -------
+        float
+            The velocity, ``None`` with less than two samples or all samples at the same time.
+
+        """
+        n = self._count
+        if n < 2:
+            return None
+        d = n * self._stt - self._st * self._st
+        if d <= 0.0:
+            return None
+        return (n * self._stx - self._st * self._sx) / d
+
+
+class StallGuard:
+    """A hashed timer wheel watching the motors for stalling.
+
+    The wheel has `slots` slots of `tick` seconds each, a timer expiring at tick `n` is kept in slot
+    ``n % slots``. Setting, moving and removing a timer costs a set operation; the wheel's task looks at one slot
+    per tick and at the timers in it only.
+
+    :meth:`arm`, :meth:`update` and :meth:`disarm` are called from the event loop the guard runs in.
+
+    """
+
+    def __init__(self, tick: float = 0.01, slots: int = 256):
+        """
+
+        Parameters
+        ----------
+        tick : float
+            The resolution of the deadlines in seconds.
+        slots : int
+            The number of slots of the wheel.
+        """
+        self._tick: float = tick
+        self._slots: int = slots
+        self._wheel: List[Set[_Timer]] = [set() for _ in range(slots)]
+        self._timers: Dict['AMotor', _Timer] = {}
+        self._scheduled: int = 0
+        self._cursor: int = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[Task] = None
+        self._wakeup: Optional[Event] = None
+        self.expired: int = 0
+        return
+
+    @property
+    def task(self) -> Optional[Task]:
+        """The task advancing the wheel, ``None`` before :meth:`start`."""
+        return self._task
+
+    def start(self) -> Task:
+        """Starts the task advancing the wheel in the running event loop, if not running yet.
+
+        Returns
+        -------
+        Task
+            The task advancing the wheel.
+
+        """
+        loop = asyncio.get_running_loop()
+        if (self._task is None) or self._task.done() or (self._loop is not loop):
+            # timers of a former event loop can't expire anymore
+            for slot in self._wheel:
+                slot.clear()
+            self._timers.clear()
+            self._scheduled = 0
+            self._loop = loop
+            self._wakeup = Event()
+            self._task = loop.create_task(self._run())
+        return self._task
+
+    def arm(self, motor: 'AMotor') -> None:
+        """Starts watching `motor`, called when a command of `motor` has started.
+
+        The deadline is set with the first PORT_VALUE that follows. Motors without
+        :attr:`AMotor.time_to_stalled` aren't watched. Motors with a :attr:`AMotor.stall_window` are watched by
+        velocity, the commanded speed is the last set point streamed with :meth:`AMotor.STREAM_SPEED` or else taken from
+        :attr:`AMotor.last_cmd_snt`.
+
+        """
+        self.disarm(motor)
+        if motor.time_to_stalled is None:
+            return
+        motor.E_MOTOR_STALLED.clear()
+        timer = _Timer(motor)
+        if motor.stall_window:
+            timer.window = VelocityWindow(motor.stall_window)
+            speed = motor._streamed_speed
+            if speed is None:
+                # the template sends of STREAM_SPEED don't update last_cmd_snt
+                command = motor.last_cmd_snt
+                speed = getattr(command, 'speed', None)
+                if speed is None:
+                    speed = getattr(command, 'power', None)
+            timer.speed = speed
+        self._timers[motor] = timer
+        return
+
+    def speed_set(self, motor: 'AMotor', speed: float) -> None:
+        """Updates the commanded speed of `motor`, for set points not sent as a command of their own."""
+        timer = self._timers.get(motor)
+        if timer is not None:
+            timer.speed = speed
+        return
+
+    def update(self, motor: 'AMotor', position: float) -> None:
+        """Sets the deadline of `motor` anew if it is seen moving, see :mod:`legoBTLE.device.StallGuard`.
+
+        Called with every PORT_VALUE of `motor`. Motors watched by velocity without a commanded speed, e.g., holding
+        their position, are watched by :attr:`AMotor.stall_bias` instead.
+
+        """
+        timer = self._timers.get(motor)
+        if timer is None:
+            return
+        now = self._loop.time()
+        window = timer.window
+        if (window is not None) and timer.speed:
+            window.add(now, position)
+            velocity = window.velocity()
+            if velocity is not None:
+                velocity = abs(velocity)
+                motor.avg_speed = velocity
+                if velocity < motor.stall_velocity * abs(timer.speed):
+                    return
+            elif timer.position is not None:
+                return
+        elif timer.position is not None:
+            delta = abs(position - timer.position)
+            if delta < motor.stall_bias:
+                return
+            if now > timer.since:
+                motor.avg_speed = delta / (now - timer.since)
+        timer.position, timer.since = position, now
+        self._schedule(timer, now + motor.time_to_stalled)
+        return
+
+    def disarm(self, motor: 'AMotor') -> None:
+        """Stops watching `motor`, called when its command has finished."""
+        timer = self._timers.pop(motor, None)
+        if timer is not None:
+            self._unschedule(timer)
+        return
+
+    def _schedule(self, timer: _Timer, deadline: float) -> None:
+        self._unschedule(timer)
+        expires = max(math.ceil(deadline / self._tick), self._cursor + 1)
+        timer.expires, timer.slot = expires, expires % self._slots
+        self._wheel[timer.slot].add(timer)
+        self._scheduled += 1
+        if self._scheduled == 1:
+            self._wakeup.set()
+        return
+
+    def _unschedule(self, timer: _Timer) -> None:
+        if timer.slot is not None:
+            self._wheel[timer.slot].discard(timer)
+            timer.slot = None
+            self._scheduled -= 1
+        return
+
+    async def _run(self) -> None:
+        loop = self._loop
+        tick = self._tick
+        wheel = self._wheel
+        slots = self._slots
+        while True:
+            if not self._scheduled:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                self._cursor = int(loop.time() / tick)
+            await asyncio.sleep(max((self._cursor + 1) * tick - loop.time(), 0))
+            now = int(loop.time() / tick)
+            # a late wake-up looks at the slots passed meanwhile, the whole wheel at most
+            for n in range(max(self._cursor + 1, now - slots + 1), now + 1):
+                slot = wheel[n % slots]
+                if slot:
+                    for timer in [t for t in slot if t.expires <= now]:
+                        self._expire(timer)
+            self._cursor = now
+
+    def _expire(self, timer: _Timer) -> None:
+        self._unschedule(timer)
+        motor = timer.motor
+        del self._timers[motor]
+        self.expired += 1
+        delta = abs(motor.port_value.m_port_value_DEG - timer.position)
+        debug_info("{0.__class__.__name__} +*+ <MOTOR {1.name} -- PORT {1.port[0]}>: NO MOVEMENT FOR "
+                   "{1.time_to_stalled}s", self, motor, debug=motor.debug)
+        self._loop.create_task(motor._stalled(delta))
+        return
+
+
+STALL_GUARD: StallGuard = StallGuard()
+"""The stall detection of all motors."""
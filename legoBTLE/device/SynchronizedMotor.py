@@ -8,11 +8,10 @@
 
 import asyncio
 import uuid
-from asyncio import CancelledError, Task
+from asyncio import Task
 from asyncio import Event
 from asyncio import sleep
 from asyncio.locks import Condition
-from asyncio.streams import StreamReader
 from asyncio.streams import StreamWriter
 from collections import defaultdict
 from datetime import datetime
@@ -31,6 +30,7 @@ from legoBTLE.legoWP.message.downstream import CMD_START_MOVE_DEV_DEGREES
 from legoBTLE.legoWP.message.downstream import CMD_START_MOVE_DEV_TIME
 from legoBTLE.legoWP.message.downstream import CMD_START_PWR_DEV
 from legoBTLE.legoWP.message.downstream import CMD_START_SPEED_DEV
+from legoBTLE.legoWP.message.downstream import CommandTemplate
 from legoBTLE.legoWP.message.downstream import DOWNSTREAM_MESSAGE
 from legoBTLE.legoWP.message.upstream import DEV_GENERIC_ERROR_NOTIFICATION
 from legoBTLE.legoWP.message.upstream import DEV_PORT_NOTIFICATION
@@ -48,6 +48,7 @@ from legoBTLE.legoWP.types import DIRECTIONAL_VALUE
 from legoBTLE.legoWP.types import MOVEMENT
 from legoBTLE.legoWP.types import PERIPHERAL_EVENT
 from legoBTLE.legoWP.types import PORT
+from legoBTLE.networking.framing import ClientFrameProtocol
 from legoBTLE.networking.prettyprint.debug import debug_info
 from legoBTLE.networking.prettyprint.debug import debug_info_begin
 from legoBTLE.networking.prettyprint.debug import debug_info_end
@@ -145,7 +146,7 @@ class SynchronizedMotor(AMotor):
         self._port2hub_connected: Event = Event()
     
         self._server = server
-        self._connection: Optional[StreamReader, StreamWriter] = None
+        self._connection: Optional[ClientFrameProtocol, StreamWriter] = None
     
         self._ext_srv_notification: Optional[EXT_SERVER_NOTIFICATION] = None
         self._ext_srv_notification_log: Optional[List[Tuple[float, EXT_SERVER_NOTIFICATION]]] = None
@@ -262,6 +263,16 @@ class SynchronizedMotor(AMotor):
     def stall_bias(self, stall_bias: float):
         self._stall_bias = stall_bias
     
+    @property
+    def stall_window(self) -> int:
+        """Always ``0``, a :class:`SynchronizedMotor` has no stall detection."""
+        return 0
+    
+    @property
+    def stall_velocity(self) -> float:
+        """Unused, see :attr:`stall_window`."""
+        return 0.0
+    
     @property
     def E_MOTOR_STALLED(self) -> Event:
         return self._E_MOTOR_STALLED
@@ -309,8 +320,8 @@ class SynchronizedMotor(AMotor):
     
     async def ext_srv_notification_set(self, ext_srv_notification: EXT_SERVER_NOTIFICATION, debug: bool = False):
         debug = self._debug if debug is None else debug
-        debug_info_header(f"{self._name}: RECEIVED EXTERNAL_SERVER_NOTIFICATION ", debug=debug)
-        debug_info(f"PORT: {self._port[0]}", debug=debug)
+        debug_info_header("{0._name}: RECEIVED EXTERNAL_SERVER_NOTIFICATION ", self, debug=debug)
+        debug_info("PORT: {0._port[0]}", self, debug=debug)
         if ext_srv_notification is not None:
             self._ext_srv_notification = ext_srv_notification
             # if self._debug:
@@ -328,11 +339,11 @@ class SynchronizedMotor(AMotor):
                 self._ext_srv_disconnected.set()
                 self._port2hub_connected.clear()
             
-            debug_info(f"EXT_SRV_CONNECTED ?:    {self._ext_srv_connected.is_set()}", debug=debug)
-            debug_info(f"EXT_SRV_DISCONNECTED ?: {self._ext_srv_disconnected.is_set()}", debug=debug)
-            debug_info(f"PORT2HUB_CONNECTED ?:   {self._port2hub_connected.is_set()}", debug=debug)
-            debug_info(f"PORT_FREE ?:            {self._port_free.is_set()}", debug=debug)
-            debug_info_footer(footer=f"{self._name}: RECEIVED EXTERNAL_SERVER_NOTIFICATION", debug=debug)
+            debug_info("EXT_SRV_CONNECTED ?:    {0}", self._ext_srv_connected.is_set(), debug=debug)
+            debug_info("EXT_SRV_DISCONNECTED ?: {0}", self._ext_srv_disconnected.is_set(), debug=debug)
+            debug_info("PORT2HUB_CONNECTED ?:   {0}", self._port2hub_connected.is_set(), debug=debug)
+            debug_info("PORT_FREE ?:            {0}", self._port_free.is_set(), debug=debug)
+            debug_info_footer("{0._name}: RECEIVED EXTERNAL_SERVER_NOTIFICATION", self, debug=debug)
         return
         
     @property
@@ -524,8 +535,6 @@ class SynchronizedMotor(AMotor):
         self.ON_STALLED_ACTION = on_stalled
         cmd_debug = self._debug if cmd_debug is None else cmd_debug
         
-        _wcd = None
-        
         if isinstance(speed_a, DIRECTIONAL_VALUE):
             _speed_a = speed_a.value * self._motor_a.clockwise_direction  # normalize speed
         else:
@@ -548,10 +557,9 @@ class SynchronizedMotor(AMotor):
                 use_dec_profile=use_dec_profile,
                 )
 
-        debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED_SYNCED", debug=cmd_debug)
-        debug_info_begin(
-                f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # WAITING AT THE GATES",
-                debug=cmd_debug)
+        debug_info_header("NAME: {0.name} / PORT: {0.port[0]} # START_POWER_UNREGULATED_SYNCED", self, debug=cmd_debug)
+        debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED_SYNCED # WAITING AT THE GATES",
+                         self, debug=cmd_debug)
         async with self._port_free_condition, self._motor_a.port_free_condition, self._motor_b.port_free_condition:
             await self.port_free.wait()
             self.port_free.clear()
@@ -561,54 +569,99 @@ class SynchronizedMotor(AMotor):
             self._motor_b.port_free.clear()
             self._E_CMD_FINISHED.clear()
             
-            debug_info_end(f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # PASSED THE GATES",
-                           debug=cmd_debug)
+            debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED_SYNCED # PASSED THE GATES",
+                           self, debug=cmd_debug)
             
             if delay_before is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before {delay_before}s",
-                        debug=cmd_debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before "
+                                 "{1}s", self, delay_before, debug=cmd_debug)
                 await sleep(delay_before)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before {delay_before}s",
-                        debug=cmd_debug)
+                debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before "
+                               "{1}s", self, delay_before, debug=cmd_debug)
             
-            debug_info_begin(
-                    f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # sending CMD", debug=cmd_debug)
+            debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED # sending CMD",
+                             self, debug=cmd_debug)
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
             
             s = await self._cmd_send(command)
 
             t0 = monotonic()
-            debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=cmd_debug)
+            debug_info("WAITING FOR COMMAND END: t0={0}s", t0, debug=cmd_debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=cmd_debug)
+            debug_info("WAITED {0}s FOR COMMAND TO END...", monotonic() - t0, debug=cmd_debug)
             
-            debug_info(f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # CMD: {command}",
-                       debug=cmd_debug)
-            debug_info_end(
-                    f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # sending CMD", debug=cmd_debug)
+            debug_info("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED # CMD: {1}",
+                       self, command, debug=cmd_debug)
+            debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED # sending CMD",
+                           self, debug=cmd_debug)
             
             if delay_after is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # delay_after {delay_after}s",
-                        debug=cmd_debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED # delay_after {1}s",
+                                 self, delay_after, debug=cmd_debug)
                 await sleep(delay_after)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # delay_after {delay_after}s",
-                        debug=cmd_debug)
+                debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED # delay_after {1}s",
+                               self, delay_after, debug=cmd_debug)
 
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED", debug=cmd_debug)
+        debug_info_footer("NAME: {0.name} / PORT: {0.port[0]} # START_POWER_UNREGULATED", self, debug=cmd_debug)
         return s
 
+    def START_SPEED_SYNCED_TEMPLATE(self,
+                                    abs_max_power: int = 30,
+                                    start_cond: MOVEMENT = MOVEMENT.ONSTART_EXEC_IMMEDIATELY,
+                                    completion_cond: MOVEMENT = MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
+                                    use_profile: int = 0,
+                                    use_acc_profile: MOVEMENT = MOVEMENT.USE_ACC_PROFILE,
+                                    use_dec_profile: MOVEMENT = MOVEMENT.USE_DEC_PROFILE,
+                                    ) -> CommandTemplate:
+        """Encode START_SPEED_UNREGULATED_SYNCED once for streaming with :meth:`STREAM_SPEED_SYNCED`.
+        
+        Returns
+        -------
+        CommandTemplate
+            The template with the fields ``speed_a``, ``speed_b`` and ``abs_max_power``.
+        
+        """
+        template: CommandTemplate = CMD_START_SPEED_DEV.template(
+                synced=True,
+                port=self._port,
+                start_cond=start_cond,
+                completion_cond=completion_cond,
+                abs_max_power=abs_max_power,
+                use_profile=use_profile,
+                use_acc_profile=use_acc_profile,
+                use_dec_profile=use_dec_profile,
+                )
+        template.hub_id = self.hub_id
+        return template
+    
+    async def STREAM_SPEED_SYNCED(self, template: CommandTemplate, speed_a: int, speed_b: int) -> bool:
+        """Send new speed set points for both motors using a template from :meth:`START_SPEED_SYNCED_TEMPLATE`.
+        
+        Only the speed bytes are patched, the ports are not locked and no feedback is waited for.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        template : CommandTemplate
+            The template for this virtual port.
+        speed_a : int
+            Speed of the first motor in percent.
+        speed_b : int
+            Speed of the second motor in percent.
+        
+        Returns
+        -------
+        bool
+            ``True`` if the command could be sent, ``False`` otherwise.
+        
+        """
+        template['speed_a'] = speed_a * self._clockwise_direction_a  # normalize speed motor A
+        template['speed_b'] = speed_b * self._clockwise_direction_b  # normalize speed motor B
+        return await self._template_send(template)
+    
     async def START_POWER_UNREGULATED_SYNCED(self,
                                              power_a: int = 0,
                                              power_b: int = 0,
@@ -655,8 +708,6 @@ class SynchronizedMotor(AMotor):
         
         debug = self._debug if debug is None else debug
         
-        _wcd = None
-
         power_a *= self._clockwise_direction_a  # normalize power motor A
         power_b *= self._clockwise_direction_b  # normalize power motor B
 
@@ -669,9 +720,9 @@ class SynchronizedMotor(AMotor):
                 completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
                 )
 
-        debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED_SYNCED", debug=debug)
-        debug_info_begin(f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # WAITING AT THE GATES",
-                         debug=debug)
+        debug_info_header("NAME: {0.name} / PORT: {0.port[0]} # START_POWER_UNREGULATED_SYNCED", self, debug=debug)
+        debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED_SYNCED # WAITING AT THE GATES",
+                         self, debug=debug)
         async with self._port_free_condition, self._motor_a.port_free_condition, self._motor_b.port_free_condition:
             await self.port_free.wait()
             self.port_free.clear()
@@ -681,53 +732,42 @@ class SynchronizedMotor(AMotor):
             self._motor_b.port_free.clear()
             self._E_CMD_FINISHED.clear()
             
-            debug_info_end(f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # PASSED THE GATES",
-                           debug=debug)
+            debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED_SYNCED # PASSED THE GATES",
+                           self, debug=debug)
             
             if delay_before is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before {delay_before}s",
-                        debug=debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before "
+                                 "{1}s", self, delay_before, debug=debug)
                 await sleep(delay_before)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before {delay_before}s",
-                        debug=debug)
+                debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before "
+                               "{1}s", self, delay_before, debug=debug)
             
-            debug_info_begin(
-                    f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # sending CMD", debug=debug)
+            debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED # sending CMD",
+                             self, debug=debug)
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
             
             s = await self._cmd_send(command)
             
-            debug_info(f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # CMD: {command}",
-                       debug=debug)
-            debug_info_end(
-                    f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # sending CMD", debug=debug)
+            debug_info("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED # CMD: {1}",
+                       self, command, debug=debug)
+            debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED # sending CMD",
+                           self, debug=debug)
 
             t0 = monotonic()
-            debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=debug)
+            debug_info("WAITING FOR COMMAND END: t0={0}s", t0, debug=debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=debug)
+            debug_info("WAITED {0}s FOR COMMAND TO END...", monotonic() - t0, debug=debug)
 
             if delay_after is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # delay_after {delay_after}s",
-                        debug=debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED # delay_after {1}s",
+                                 self, delay_after, debug=debug)
                 await sleep(delay_after)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # delay_after {delay_after}s",
-                        debug=debug)
+                debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_POWER_UNREGULATED # delay_after {1}s",
+                               self, delay_after, debug=debug)
 
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-    
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED", debug=debug)
+        debug_info_footer("NAME: {0.name} / PORT: {0.port[0]} # START_POWER_UNREGULATED", self, debug=debug)
         return s
     
     @property
@@ -777,9 +817,10 @@ class SynchronizedMotor(AMotor):
     
     async def hub_attached_io_notification_set(self, io_notification: HUB_ATTACHED_IO_NOTIFICATION):
         former_port = self._port
-        debug_info_header(f"VIRTUAL PORT {self._port[0]}: HUB_ATTACHED_IO_NOTIFICATION:", debug=self._debug)
+        debug_info_header("VIRTUAL PORT {0._port[0]}: HUB_ATTACHED_IO_NOTIFICATION:", self, debug=self._debug)
         if io_notification.m_io_event == PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED:
-            debug_info(f"PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED?: {io_notification.m_io_event == PERIPHERAL_EVENT.EXT_SRV_CONNECTED}", debug=self._debug)
+            debug_info("PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED?: {0}",
+                       io_notification.m_io_event == PERIPHERAL_EVENT.EXT_SRV_CONNECTED, debug=self._debug)
             
             self._hub_attached_io = io_notification
             self._port = io_notification.m_port
@@ -793,7 +834,8 @@ class SynchronizedMotor(AMotor):
             self._port_free.set()
         
         elif io_notification.m_io_event == PERIPHERAL_EVENT.IO_DETACHED:
-            debug_info(f"PERIPHERAL_EVENT.IO_DETACHED?: {io_notification.m_io_event == PERIPHERAL_EVENT.IO_DETACHED}", debug=self._debug)
+            debug_info("PERIPHERAL_EVENT.IO_DETACHED?: {0}",
+                       io_notification.m_io_event == PERIPHERAL_EVENT.IO_DETACHED, debug=self._debug)
             
             self._port_connected.clear()
             self._ext_srv_connected.clear()
@@ -801,15 +843,15 @@ class SynchronizedMotor(AMotor):
             self._port2hub_connected.clear()
             self._port_free.clear()
         
-        debug_info(f"FORMER PORT: {int.from_bytes(former_port, 'little', signed=False)}", debug=self._debug)
-        debug_info(f"NEW VIRTUAL PORT: {int.from_bytes(self._port, 'little', signed=False)}", debug=self._debug)
-        debug_info(f"PORT A: {int.from_bytes(self._motor_a.port, 'little', signed=False)}", debug=self._debug)
-        debug_info(f"PORT B: {int.from_bytes(self._motor_b.port, 'little', signed=False)}", debug=self._debug)
-        debug_info(f"EXT_SRV_CONNECTED?:    {self._ext_srv_connected.is_set()}{C.ENDC}", debug=self._debug)
-        debug_info(f"EXT_SRV_DISCONNECTED?: {self._ext_srv_disconnected.is_set()}{C.ENDC}", debug=self._debug)
-        debug_info(f"PORT2HUB_CONNECTED?:   {self._port2hub_connected.is_set()}{C.ENDC}", debug=self._debug)
-        debug_info(f"PORT_FREE?:            {self._port_free.is_set()}{C.ENDC}", debug=self._debug)
-        debug_info_footer(footer=f"VIRTUAL PORT {self._port[0]}: HUB_ATTACHED_IO_NOTIFICATION:", debug=self._debug)
+        debug_info("FORMER PORT: {0}", int.from_bytes(former_port, 'little', signed=False), debug=self._debug)
+        debug_info("NEW VIRTUAL PORT: {0}", int.from_bytes(self._port, 'little', signed=False), debug=self._debug)
+        debug_info("PORT A: {0}", int.from_bytes(self._motor_a.port, 'little', signed=False), debug=self._debug)
+        debug_info("PORT B: {0}", int.from_bytes(self._motor_b.port, 'little', signed=False), debug=self._debug)
+        debug_info("EXT_SRV_CONNECTED?:    {0}{1.ENDC}", self._ext_srv_connected.is_set(), C, debug=self._debug)
+        debug_info("EXT_SRV_DISCONNECTED?: {0}{1.ENDC}", self._ext_srv_disconnected.is_set(), C, debug=self._debug)
+        debug_info("PORT2HUB_CONNECTED?:   {0}{1.ENDC}", self._port2hub_connected.is_set(), C, debug=self._debug)
+        debug_info("PORT_FREE?:            {0}{1.ENDC}", self._port_free.is_set(), C, debug=self._debug)
+        debug_info_footer("VIRTUAL PORT {0._port[0]}: HUB_ATTACHED_IO_NOTIFICATION:", self, debug=self._debug)
         return
     
     @property
@@ -873,8 +915,6 @@ class SynchronizedMotor(AMotor):
         
         debug = self._debug if debug is None else debug
         
-        _wcd = None
-        
         if isinstance(speed_a, DIRECTIONAL_VALUE):
             _speed_a = speed_a.value * self._clockwise_direction_a  # normalize speed motor A
         else:
@@ -899,10 +939,9 @@ class SynchronizedMotor(AMotor):
                 use_acc_profile=use_acc_profile,
                 use_dec_profile=use_dec_profile, )
 
-        debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_MOVE_DEGREES_SYNCED", debug=debug)
-        debug_info_begin(
-                f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # WAITING AT THE GATES",
-                debug=debug)
+        debug_info_header("NAME: {0.name} / PORT: {0.port[0]} # START_MOVE_DEGREES_SYNCED", self, debug=debug)
+        debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_MOVE_DEGREES_SYNCED # WAITING AT THE GATES",
+                         self, debug=debug)
         async with self._port_free_condition, self._motor_a.port_free_condition, self._motor_b.port_free_condition:
             await self.port_free.wait()
             self.port_free.clear()
@@ -912,52 +951,42 @@ class SynchronizedMotor(AMotor):
             self._motor_b.port_free.clear()
             self._E_CMD_FINISHED.clear()
         
-            debug_info_end(f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # PASSED THE GATES",
-                           debug=debug)
+            debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_MOVE_DEGREES_SYNCED # PASSED THE GATES",
+                           self, debug=debug)
         
             if delay_before is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # delay_before {delay_before}s",
-                        debug=debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_MOVE_DEGREES_SYNCED # delay_before {1}s",
+                                 self, delay_before, debug=debug)
                 await sleep(delay_before)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # delay_before {delay_before}s",
-                        debug=debug)
+                debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_MOVE_DEGREES_SYNCED # delay_before {1}s",
+                               self, delay_before, debug=debug)
             
-            debug_info_begin(
-                    f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # sending CMD", debug=debug)
+            debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_MOVE_DEGREES_SYNCED # sending CMD",
+                             self, debug=debug)
         
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
         
             s = await self._cmd_send(command)
         
-            debug_info(f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # CMD: {command}",
-                       debug=debug)
-            debug_info_end(
-                    f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # sending CMD", debug=debug)
+            debug_info("NAME: {0.name} / PORT: {0.port[0]} / START_MOVE_DEGREES_SYNCED # CMD: {1}",
+                       self, command, debug=debug)
+            debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_MOVE_DEGREES_SYNCED # sending CMD",
+                           self, debug=debug)
         
             t0 = monotonic()
-            debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=debug)
+            debug_info("WAITING FOR COMMAND END: t0={0}s", t0, debug=debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=debug)
+            debug_info("WAITED {0}s FOR COMMAND TO END...", monotonic() - t0, debug=debug)
         
             if delay_after is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # delay_after {delay_after}s",
-                        debug=debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_MOVE_DEGREES_SYNCED # delay_after {1}s",
+                                 self, delay_after, debug=debug)
                 await sleep(delay_after)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # delay_after {delay_after}s",
-                        debug=debug)
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_MOVE_DEGREES_SYNCED", debug=debug)
+                debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_MOVE_DEGREES_SYNCED # delay_after {1}s",
+                               self, delay_after, debug=debug)
+        debug_info_footer("NAME: {0.name} / PORT: {0.port[0]} # START_MOVE_DEGREES_SYNCED", self, debug=debug)
         return s
 
     async def START_SPEED_TIME_SYNCED(
@@ -1024,8 +1053,6 @@ class SynchronizedMotor(AMotor):
         self.ON_STALLED_ACTION = on_stalled
         debug = self._debug if debug is None else debug
         
-        _wcd = None
-        
         if isinstance(speed_a, DIRECTIONAL_VALUE):
             _speed_a = speed_a.value
         else:
@@ -1055,10 +1082,9 @@ class SynchronizedMotor(AMotor):
         
         _cmd_id = self.START_SPEED_TIME_SYNCED.__qualname__ if cmd_id is None else cmd_id
 
-        debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_SPEED_TIME_SYNCED", debug=debug)
-        debug_info_begin(
-                f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # WAITING AT THE GATES",
-                debug=debug)
+        debug_info_header("NAME: {0.name} / PORT: {0.port[0]} # START_SPEED_TIME_SYNCED", self, debug=debug)
+        debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME_SYNCED # WAITING AT THE GATES",
+                         self, debug=debug)
         async with self.port_free_condition, self._motor_a.port_free_condition, self._motor_b.port_free_condition:
             await self._port_free.wait()
             self._port_free.clear()
@@ -1067,51 +1093,42 @@ class SynchronizedMotor(AMotor):
             await self._motor_b.port_free.wait()
             self._motor_b.port_free.clear()
             self._E_CMD_FINISHED.clear()
-            debug_info_end(f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # PASSED THE GATES",
-                           debug=debug)
+            debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME_SYNCED # PASSED THE GATES",
+                           self, debug=debug)
             
             if delay_before is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # delay_before {delay_before}s",
-                        debug=debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME_SYNCED # delay_before {1}s",
+                                 self, delay_before, debug=debug)
                 await sleep(delay_before)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # delay_before {delay_before}s",
-                        debug=debug)
+                debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME_SYNCED # delay_before {1}s",
+                               self, delay_before, debug=debug)
         
-            debug_info_begin(
-                    f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # sending CMD", debug=debug)
+            debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME_SYNCED # sending CMD",
+                             self, debug=debug)
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
             
             s = await self._cmd_send(command)
             
-            debug_info(f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # CMD: {command}",
-                       debug=debug)
-            debug_info_end(
-                    f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # sending CMD", debug=debug)
+            debug_info("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME_SYNCED # CMD: {1}",
+                       self, command, debug=debug)
+            debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME_SYNCED # sending CMD",
+                           self, debug=debug)
             
             t0 = monotonic()
-            debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=debug)
+            debug_info("WAITING FOR COMMAND END: t0={0}s", t0, debug=debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=debug)
+            debug_info("WAITED {0}s FOR COMMAND TO END...", monotonic() - t0, debug=debug)
 
             if delay_after is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # delay_after {delay_after}s",
-                        debug=debug)
+                debug_info_begin("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME_SYNCED # delay_after {1}s",
+                                 self, delay_after, debug=debug)
                 await sleep(delay_after)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # delay_after {delay_after}s",
-                        debug=debug)
+                debug_info_end("NAME: {0.name} / PORT: {0.port[0]} / START_SPEED_TIME_SYNCED # delay_after {1}s",
+                               self, delay_after, debug=debug)
 
-        try:
-            _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_SPEED_TIME_SYNCED", debug=debug)
+        debug_info_footer("NAME: {0.name} / PORT: {0.port[0]} # START_SPEED_TIME_SYNCED", self, debug=debug)
         return s
     
     async def GOTO_ABS_POS_SYNCED(self,
@@ -1178,7 +1195,6 @@ class SynchronizedMotor(AMotor):
         
         debug = self._debug if debug is None else debug
 
-        _wcd = None
         if isinstance(speed, DIRECTIONAL_VALUE):
             _speed = speed.value
         else:
@@ -1202,8 +1218,9 @@ class SynchronizedMotor(AMotor):
                 use_dec_profile=use_dec_profile,
                 )
 
-        debug_info_header(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]", debug=self.debug)
-        debug_info_begin(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: AT THE GATES >> >> >> WAITING", debug=self.debug)
+        debug_info_header("{0.GOTO_ABS_POS_SYNCED.__name__} +*+ [{0._name}:{0.port}]", self, debug=self.debug)
+        debug_info_begin("{0.GOTO_ABS_POS_SYNCED.__name__} +*+ [{0._name}:{0.port}]: AT THE GATES >> >> >> WAITING",
+                         self, debug=self.debug)
         async with self._port_free_condition, self._motor_a.port_free_condition, self._motor_b.port_free_condition:
             await self.port_free.wait()
             self.port_free.clear()
@@ -1212,45 +1229,44 @@ class SynchronizedMotor(AMotor):
             await self._motor_b.port_free.wait()
             self._motor_b.port_free.clear()
             self._set_cmd_running(False)
-            debug_info_begin(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: AT THE GATES >> >> >> PASSED THE GATES",
-                             debug=self.debug)
+            debug_info_begin("{0.GOTO_ABS_POS_SYNCED.__name__} +*+ [{0._name}:{0.port}]: AT THE GATES >> >> >> PASSED "
+                             "THE GATES", self, debug=self.debug)
             
             if delay_before is not None:
-                debug_info_begin(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]:  DELAY_BEFORE >> >> >> WAITING FOR", debug=self.debug)
+                debug_info_begin("{0.GOTO_ABS_POS_SYNCED.__name__} +*+ [{0._name}:{0.port}]:  DELAY_BEFORE >> >> >> "
+                                 "WAITING FOR", self, debug=self.debug)
                 
                 await sleep(delay_before)
                 
-                debug_info_end(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]:  DELAY_BEFORE >> >> >> WAITING DONE", debug=self.debug)
+                debug_info_end("{0.GOTO_ABS_POS_SYNCED.__name__} +*+ [{0._name}:{0.port}]:  DELAY_BEFORE >> >> >> "
+                               "WAITING DONE", self, debug=self.debug)
                 
-            debug_info_begin(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]:  >> >> >> sending CMD {command.COMMAND.hex()}", debug=debug)
+            debug_info_begin("{0.GOTO_ABS_POS_SYNCED.__name__} +*+ [{0._name}:{0.port}]:  >> >> >> sending CMD "
+                             "{1.COMMAND!h}", self, command, debug=debug)
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond, timeout=wait_cond_timeout)
                 
             s = await self._cmd_send(command)
 
-            debug_info_end(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]:  >> >> >> DONE sending CMD {command.COMMAND.hex()}",
-                           debug=debug)
+            debug_info_end("{0.GOTO_ABS_POS_SYNCED.__name__} +*+ [{0._name}:{0.port}]:  >> >> >> DONE sending CMD "
+                           "{1.COMMAND!h}", self, command, debug=debug)
             
             t0 = monotonic()
-            debug_info_begin(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: t0={t0}s", debug=debug)
+            debug_info_begin("{0.GOTO_ABS_POS_SYNCED.__name__} +*+ [{0._name}:{0.port}]: t0={1}s",
+                             self, t0, debug=debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info_end(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: WAITED {monotonic() - t0}s FOR COMMAND TO END", debug=debug)
+            debug_info_end("{0.GOTO_ABS_POS_SYNCED.__name__} +*+ [{0._name}:{0.port}]: WAITED {1}s FOR COMMAND TO END",
+                           self, monotonic() - t0, debug=debug)
             
             if delay_after is not None:
-                debug_info_begin(
-                        f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: DELAY_AFTER >> >> >> WAITING {delay_after}s",
-                        debug=debug)
+                debug_info_begin("{0.GOTO_ABS_POS_SYNCED.__name__} +*+ [{0._name}:{0.port}]: DELAY_AFTER >> >> >> "
+                                 "WAITING {1}s", self, delay_after, debug=debug)
                 await sleep(delay_after)
-                debug_info_end(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: DELAY_AFTER >> >> >> WAITING DONE {delay_after}s", debug=debug)
+                debug_info_end("{0.GOTO_ABS_POS_SYNCED.__name__} +*+ [{0._name}:{0.port}]: DELAY_AFTER >> >> >> "
+                               "WAITING DONE {1}s", self, delay_after, debug=debug)
                 
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # CMD_GOTO_ABS_POS_DEV", debug=debug)
+        debug_info_footer("NAME: {0.name} / PORT: {0.port[0]} # CMD_GOTO_ABS_POS_DEV", self, debug=debug)
         return s
     
     @property
@@ -1258,55 +1274,52 @@ class SynchronizedMotor(AMotor):
         return self._current_cmd_feedback_notification
     
     async def cmd_feedback_notification_set(self, notification: PORT_CMD_FEEDBACK):
-        debug_info_header(f"<{self.name}:{self.port[0]}> - CMD_FEEDBACK", debug=self._debug)
-        debug_info_begin(f"<{self.name}:{self.port[0]}> - CMD_FEEDBACK: NOTIFICATION-MSG-DETAILS", debug=self._debug)
-        debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: PORT: {notification.m_port[0]}", debug=self._debug)
-        debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: MSG_CONTENT: {notification.COMMAND.hex()}",
-                   debug=self._debug)
+        debug_info_header("<{0.name}:{0.port[0]}> - CMD_FEEDBACK", self, debug=self._debug)
+        debug_info_begin("<{0.name}:{0.port[0]}> - CMD_FEEDBACK: NOTIFICATION-MSG-DETAILS", self, debug=self._debug)
+        debug_info("<{0.name}:{0.port[0]}> - <CMD_FEEDBACK]: PORT: {1.m_port[0]}",
+                   self, notification, debug=self._debug)
+        debug_info("<{0.name}:{0.port[0]}> - <CMD_FEEDBACK]: MSG_CONTENT: {1.COMMAND!h}",
+                   self, notification, debug=self._debug)
         
         if notification.COMMAND[len(notification.COMMAND) - 1] == int.from_bytes(b'\x01', 'little'):
         
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS: CMD STARTED",
-                       debug=self._debug)
-            debug_info(
-                f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {notification.COMMAND[len(notification.COMMAND) - 1]}",
-                debug=self._debug)
+            debug_info("[{0.name}:{1.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS: CMD STARTED",
+                       self, notification, debug=self._debug)
+            debug_info("[{0.name}:{1.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {2}",
+                       self, notification, notification.COMMAND[len(notification.COMMAND) - 1], debug=self._debug)
         
             self._set_cmd_running(True)
             self._port_free.clear()
             self._motor_a.port_free.clear()
             self._motor_b.port_free.clear()
             
-            debug_info_end(
-                f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
-                debug=self._debug)
+            debug_info_end("[{0.name}:{0.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{1.m_port[0]}",
+                           self, notification, debug=self._debug)
 
         elif notification.COMMAND[len(notification.COMMAND) - 1] == int.from_bytes(b'\x0a', 'little'):
-            debug_info(f"PORT {notification.m_port[0]}: RECEIVED CMD_STATUS: CMD FINISHED ", debug=self._debug)
-            debug_info(f"STATUS: {notification.COMMAND[len(notification.COMMAND) - 1]}", debug=self._debug)
+            debug_info("PORT {0.m_port[0]}: RECEIVED CMD_STATUS: CMD FINISHED ", notification, debug=self._debug)
+            debug_info("STATUS: {0}", notification.COMMAND[len(notification.COMMAND) - 1], debug=self._debug)
             
             self._set_cmd_running(False)
             self._port_free.set()
             self._motor_a.port_free.set()
             self._motor_b.port_free.set()
 
-            debug_info_end(
-                    f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
-                    debug=self._debug)
+            debug_info_end("[{0.name}:{0.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{1.m_port[0]}",
+                           self, notification, debug=self._debug)
         else:
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:REPORTED CMD-STATUS: CMD DISCARDED",
-                       debug=self._debug)
-            debug_info(
-                    f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:CMD-STATUS CODE: {notification.COMMAND[len(notification.COMMAND) - 1]}",
-                    debug=self._debug)
+            debug_info("[{0.name}:{1.m_port[0]}]-[CMD_FEEDBACK]:REPORTED CMD-STATUS: CMD DISCARDED",
+                       self, notification, debug=self._debug)
+            debug_info("[{0.name}:{1.m_port[0]}]-[CMD_FEEDBACK]:CMD-STATUS CODE: {2}",
+                       self, notification, notification.COMMAND[len(notification.COMMAND) - 1], debug=self._debug)
             
             self._set_cmd_running(False)
             self._port_free.set()
             self._motor_a.port_free.set()
             self._motor_b.port_free.set()
 
-        debug_info_end(f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS", debug=self._debug)
-        debug_info_footer(f"<{self.name}:{self.port[0]}> -[CMD_FEEDBACK]", debug=self._debug)
+        debug_info_end("[{0.name}:{0.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS", self, debug=self._debug)
+        debug_info_footer("<{0.name}:{0.port[0]}> -[CMD_FEEDBACK]", self, debug=self._debug)
         self._cmd_feedback_log.append((datetime.timestamp(datetime.now()), notification.m_cmd_status))
         self._current_cmd_feedback_notification = notification
         return
@@ -1324,13 +1337,13 @@ class SynchronizedMotor(AMotor):
         return self._last_cmd_failed
     
     @property
-    def connection(self) -> [StreamReader, StreamWriter]:
+    def connection(self) -> [ClientFrameProtocol, StreamWriter]:
         return self._connection
     
-    def connection_set(self, connection: Tuple[asyncio.StreamReader, asyncio.StreamWriter]) -> None:
+    def connection_set(self, connection: Tuple[ClientFrameProtocol, asyncio.StreamWriter]) -> None:
         self._ext_srv_connected.set()
         self._connection = connection
-        debug_info(f"[{self._name}:{self._port[0]}]-[MSG]: RECEIVED CONNECTION", debug=self._debug)
+        debug_info("[{0._name}:{0._port[0]}]-[MSG]: RECEIVED CONNECTION", self, debug=self._debug)
         return
     
     @property
@@ -0,0 +1,233 @@
+"""
+legoBTLE.device.Watchers
+========================
+
+This module contains the watchers that let code wait for the state of the devices without polling it.
+
+:data:`WATCHERS` holds the conditions, i.e., callables returning a truthy value once the state is as wanted, that
+are waited for with :meth:`PredicateWatchers.wait`. The conditions are evaluated when they are registered and then
+again only after a device has processed a port value, a command feedback or an attached io message from the server,
+so waiting costs nothing between two messages. A condition is kept with the devices it is waited for on and is
+evaluated only after messages of these devices; a condition waited for without naming devices may look at the
+state of any device and is evaluated after the messages of all devices. Code changing state the conditions depend
+on other than by messages calls :meth:`PredicateWatchers.notify`.
+
+The `wait_cond` of the command methods is waited for without naming devices. To wait for the state of one device
+only, pass the future instead, e.g., ``wait_cond=WATCHERS.wait(lambda: motor_a.port_value..., motor_a)``.
+
+Waiting for a port value to reach a threshold, e.g., "angle >= 90", doesn't need a condition: every device keeps a
+:class:`ThresholdIndex`, see :meth:`ADevice.watch_value` and :meth:`AMotor.watch_angle`, in which the thresholds are
+sorted, so that a port value looks only at the lowest rising and the highest falling threshold.
+
+"""
+import asyncio
+from asyncio import Future
+from bisect import bisect_left
+from bisect import bisect_right
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+class PredicateWatchers:
+    """Conditions waited for, evaluated after the messages of the devices they are waited for on.
+
+    Examples
+    --------
+    >>> async def demo():
+    ...     watchers, state = PredicateWatchers(), {'a': 0, 'b': 0}
+    ...     on_a, on_any = watchers.wait(lambda: state['a'], 'a'), watchers.wait(lambda: state['a'] + state['b'])
+    ...     state['a'] = 1
+    ...     watchers.notify('b')
+    ...     return on_a.done(), on_any.result()
+    >>> asyncio.run(demo())
+    (False, 1)
+
+    """
+
+    def __init__(self):
+        # device -> (future -> condition), the conditions waited for without naming devices are kept under None
+        self._watchers: Dict[Any, Dict[Future, Callable[[], Any]]] = {}
+        return
+
+    def __bool__(self) -> bool:
+        return bool(self._watchers)
+
+    def __len__(self) -> int:
+        return len(set().union(*self._watchers.values()))
+
+    def wait(self, cond: Callable[[], Any], *devices: Any) -> Future:
+        """Waits for `cond` to return a truthy value.
+
+        Parameters
+        ----------
+        cond : Callable[[], Any]
+            The condition.
+        *devices : ADevice
+            The devices whose state `cond` looks at. Without devices `cond` is evaluated after the messages of
+            any device.
+
+        Returns
+        -------
+        Future
+            Done with the truthy value, or with the exception raised by `cond`. Cancelling the future, e.g., by
+            :func:`asyncio.wait_for`, stops the watching.
+
+        """
+        fut = asyncio.get_running_loop().create_future()
+        try:
+            result = cond()
+        except Exception as e:
+            fut.set_exception(e)
+            return fut
+        if result:
+            fut.set_result(result)
+            return fut
+        keys: Tuple[Any, ...] = devices or (None, )
+        for key in keys:
+            self._watchers.setdefault(key, {})[fut] = cond
+        fut.add_done_callback(lambda f: self._discard(f, keys))
+        return fut
+
+    def _discard(self, fut: Future, keys: Tuple[Any, ...]) -> None:
+        for key in keys:
+            watchers = self._watchers.get(key)
+            if watchers is not None:
+                watchers.pop(fut, None)
+                if not watchers:
+                    del self._watchers[key]
+        return
+
+    def notify(self, device: Any = None) -> None:
+        """Evaluates the conditions waited for, called when the state of a device may have changed.
+
+        Parameters
+        ----------
+        device : ADevice, optional
+            The device whose state may have changed. The conditions waited for on other devices are left alone. If
+            not given, all conditions are evaluated.
+
+        """
+        if device is None:
+            registries = list(self._watchers.values())
+        else:
+            registries = [w for w in (self._watchers.get(device), self._watchers.get(None)) if w]
+        for watchers in registries:
+            for fut, cond in list(watchers.items()):
+                if fut.done():
+                    continue
+                try:
+                    result = cond()
+                except Exception as e:
+                    fut.set_exception(e)
+                    continue
+                if result:
+                    fut.set_result(result)
+        return
+
+
+class ThresholdIndex:
+    """Futures waiting for a value to reach a threshold, sorted by threshold.
+
+    A rising threshold is reached by values ``>=`` the threshold, a falling threshold by values ``<=`` it. The
+    thresholds are kept in sorted lists: :meth:`update` compares a value with the lowest rising and the highest
+    falling threshold and only if thresholds are reached searches the position up to which they are by bisection.
+
+    Examples
+    --------
+    >>> async def demo():
+    ...     index = ThresholdIndex()
+    ...     above, below = index.add(90.0), index.add(-10.0, rising=False)
+    ...     for value in (10.0, 45.0, 95.0):
+    ...         index.update(value)
+    ...     return above.result(), below.done(), len(index)
+    >>> asyncio.run(demo())
+    (95.0, False, 1)
+
+    """
+
+    def __init__(self):
+        self._rising_keys: List[float] = []
+        self._rising: List[Future] = []
+        self._falling_keys: List[float] = []
+        self._falling: List[Future] = []
+        return
+
+    def __len__(self) -> int:
+        return len(self._rising) + len(self._falling)
+
+    def add(self, threshold: float, rising: bool = True, value: Optional[float] = None) -> Future:
+        """Waits for a value to reach `threshold`.
+
+        Parameters
+        ----------
+        threshold : float
+            The threshold.
+        rising : bool
+            If ``True``, values ``>= threshold`` reach the threshold, otherwise values ``<= threshold``.
+        value : float, optional
+            The current value, if it reaches the threshold already the future is done right away.
+
+        Returns
+        -------
+        Future
+            Done with the value that reached the threshold. Cancelling the future removes the threshold.
+
+        """
+        fut = asyncio.get_running_loop().create_future()
+        if (value is not None) and ((value >= threshold) if rising else (value <= threshold)):
+            fut.set_result(value)
+            return fut
+        keys, futs = (self._rising_keys, self._rising) if rising else (self._falling_keys, self._falling)
+        i = bisect_right(keys, threshold)
+        keys.insert(i, threshold)
+        futs.insert(i, fut)
+        fut.add_done_callback(lambda f: self._discard(f, threshold, keys, futs))
+        return fut
+
+    @staticmethod
+    def _discard(fut: Future, threshold: float, keys: List[float], futs: List[Future]) -> None:
+        if not fut.cancelled():
+            return
+        for i in range(bisect_left(keys, threshold), bisect_right(keys, threshold)):
+            if futs[i] is fut:
+                del keys[i]
+                del futs[i]
+                return
+        return
+
+    def update(self, value: float) -> None:
+        """Completes the futures of all thresholds `value` reaches.
+
+        Parameters
+        ----------
+        value : float
+            The new value.
+
+        """
+        keys = self._rising_keys
+        if keys and (keys[0] <= value):
+            i = bisect_right(keys, value)
+            reached = self._rising[:i]
+            del keys[:i]
+            del self._rising[:i]
+            for fut in reached:
+                if not fut.done():
+                    fut.set_result(value)
+        keys = self._falling_keys
+        if keys and (keys[-1] >= value):
+            i = bisect_left(keys, value)
+            reached = self._falling[i:]
+            del keys[i:]
+            del self._falling[i:]
+            for fut in reached:
+                if not fut.done():
+                    fut.set_result(value)
+        return
+
+
+WATCHERS: PredicateWatchers = PredicateWatchers()
+"""The conditions waited for on the state of the devices."""
@@ -14,13 +14,14 @@
 
 # UPS == UPSTREAM === FROM DEVICE
 # DNS == DOWNSTREAM === TO DEVICE
+import struct
 import uuid
 from dataclasses import dataclass
 from dataclasses import field
+from typing import Dict
+from typing import Tuple
 from typing import Union
 
-import bitstring
-
 from legoBTLE.legoWP.types import COMMAND_STATUS
 from legoBTLE.legoWP.types import CONNECTION
 from legoBTLE.legoWP.types import HUB_ACTION
@@ -34,6 +35,109 @@ from legoBTLE.legoWP.types import PORT
 from legoBTLE.legoWP.types import SERVER_SUB_COMMAND
 from legoBTLE.legoWP.types import SUB_COMMAND
 from legoBTLE.legoWP.types import WRITEDIRECT_MODE
+from legoBTLE.networking.framing import FRAMING_V1
+from legoBTLE.networking.framing import FRAMING_V2
+from legoBTLE.networking.framing import encode_frame
+
+
+class CommandEncoder:
+    """Precompiled encoder for one layout of a downstream command.
+    
+    Every command starts with ``handle, length, hub_id, message type``. The encoder packs this prefix together with
+    the variable fields of the layout in one :meth:`struct.Struct.pack_into` call. The resulting bytes are the same
+    as those assembled field by field in the ``__post_init__`` methods of the command dataclasses.
+    
+    Parameters
+    ----------
+    handle : int
+        The characteristic handle the command is sent to.
+    m_type : bytes
+        The message type, see :class:`legoBTLE.legoWP.types.MESSAGE_TYPE`.
+    fmt : str
+        The :mod:`struct` format of the fields following the message type, always little endian.
+    
+    Examples
+    --------
+    Writing commands into a preallocated buffer::
+    
+        buffer = bytearray(64)
+        end = ENC_START_SPEED.encode_into(buffer, 0, 0x01, 0x11, 0x07, -50, 100, 0x03)
+        end = ENC_START_SPEED.encode_into(buffer, end, 0x02, 0x11, 0x07, 50, 100, 0x03)
+    
+    """
+    
+    __slots__ = ('_struct', '_handle', '_length', '_m_type', 'size')
+    
+    def __init__(self, handle: int, m_type: bytes, fmt: str):
+        self._struct: struct.Struct = struct.Struct('<BBBB' + fmt)
+        self.size: int = self._struct.size
+        self._handle: int = handle
+        self._length: int = self.size - 1
+        self._m_type: int = m_type[0]
+        return
+    
+    def encode(self, *values, hub_id: int = 0) -> bytearray:
+        """Encode the command into a new buffer.
+        
+        Parameters
+        ----------
+        values :
+            The fields following the message type in the order of the layout.
+        hub_id : int
+            The hub id, by default 0.
+            
+        Returns
+        -------
+        bytearray
+            The complete command including handle and length.
+        """
+        buffer: bytearray = bytearray(self.size)
+        self._struct.pack_into(buffer, 0, self._handle, self._length, hub_id, self._m_type, *values)
+        return buffer
+    
+    def encode_into(self, buffer: Union[bytearray, memoryview], offset: int, *values, hub_id: int = 0) -> int:
+        """Encode the command into `buffer` starting at `offset`.
+        
+        Returns
+        -------
+        int
+            The offset right behind the command.
+        """
+        self._struct.pack_into(buffer, offset, self._handle, self._length, hub_id, self._m_type, *values)
+        return offset + self.size
+
+
+def _port_bytes(port: Union[PORT, int, bytes]) -> bytes:
+    if isinstance(port, PORT):
+        return port.value
+    elif isinstance(port, int):
+        return int.to_bytes(port, length=1, byteorder='little', signed=False)
+    return port
+
+
+# The layouts following the message type, the port command layouts are
+# port, start/completion condition, sub command, ...
+ENC_SET_ACC_DEACC_PROFILE: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BBBHB')
+ENC_START_PWR: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BBb')
+ENC_START_PWR_SYNC: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BB2sbb')
+ENC_START_SPEED: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBbBB')
+ENC_START_SPEED_SYNC: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBbbBB')
+ENC_START_MOVE_TIME: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBHbBbB')
+ENC_START_MOVE_TIME_SYNC: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBHbbBbB')
+ENC_START_MOVE_DEGREES: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBibbbB')
+ENC_START_MOVE_DEGREES_SYNC: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBibbbbB')
+ENC_GOTO_ABS_POS: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBibbbb')
+ENC_GOTO_ABS_POS_SYNC: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBiibbbb')
+ENC_SET_POSITION_L_R: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBii')
+ENC_WRITE_DIRECT_MODE: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBB')
+ENC_WRITE_DIRECT_MODE_RGB: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbB3sbbb')
+ENC_WRITE_DIRECT_MODE_INT8: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBBb')
+ENC_WRITE_DIRECT_MODE_POSITION: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBBi')
+ENC_WRITE_DIRECT_MODE_POSITION_SYNC: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBBiii')
+ENC_HW_RESET: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_CMD, 'BbBBBB')
+ENC_PORT_NOTIFICATION: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_PORT_NOTIFICATION, 'BB4sB')
+ENC_VIRTUAL_PORT_CONNECT: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_VIRTUAL_PORT_SETUP, 'BBB')
+ENC_VIRTUAL_PORT_DISCONNECT: CommandEncoder = CommandEncoder(0x0e, MESSAGE_TYPE.DNS_VIRTUAL_PORT_SETUP, 'BB')
 
 
 @dataclass
@@ -41,10 +145,18 @@ class CMD_COMMON_MESSAGE_HEADER:
     m_type: bytes = field(init=True)
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
         self.hub_id: bytes = b'\x00'
         self.header: bytearray = bytearray(self.hub_id[:1] + self.m_type[:1])
 
+    @property
+    def id(self) -> bytes:
+        """A unique id of this message, only generated when first asked for."""
+        try:
+            return self._id
+        except AttributeError:
+            self._id: bytes = uuid.uuid4().bytes
+            return self._id
+
 
 @dataclass
 class DOWNSTREAM_MESSAGE:
@@ -56,6 +168,110 @@ class DOWNSTREAM_MESSAGE:
     hub_id: bytes = field(init=False, default=b'\x00')
     COMMAND: bytearray = field(init=False)
 
+    @property
+    def id(self) -> bytes:
+        """A unique id of this message, only generated when first asked for."""
+        try:
+            return self._id
+        except AttributeError:
+            self._id: bytes = uuid.uuid4().bytes
+            return self._id
+
+
+class CommandTemplate:
+    """A command encoded once whose variable fields are patched in place before every send.
+    
+    The template holds the command as it is written to the server in the frame format `framing` (see
+    :mod:`legoBTLE.networking.framing`), for :data:`FRAMING_V1` ``handle, length`` followed by
+    ``length, hub_id, message type, ...``. Setting a field packs the new value into the preallocated buffer; no
+    objects are created per send.
+    
+    Parameters
+    ----------
+    command : DOWNSTREAM_MESSAGE
+        The encoded command providing the initial values.
+    fields : dict[str, tuple[int, str]]
+        The fields that can be patched as name -> (offset in ``command.COMMAND``, :mod:`struct` format).
+    framing : int
+        The frame format of the connection the template is sent over.
+    
+    Examples
+    --------
+    Streaming speed set points::
+    
+        template = CMD_START_SPEED_DEV.template(port=b'\x01', speed=0, abs_max_power=100)
+        template['speed'] = -40
+        writer.write(template.frame)
+    
+    """
+    
+    __slots__ = ('command', 'frame', 'framing', '_buffer', '_fields')
+    
+    def __init__(self, command: DOWNSTREAM_MESSAGE, fields: Dict[str, Tuple[int, str]], framing: int = FRAMING_V1):
+        self.command: DOWNSTREAM_MESSAGE = command
+        self.framing: int = framing
+        self._buffer: bytearray = self._frame(command.COMMAND, framing)
+        self.frame: memoryview = memoryview(self._buffer)
+        shift: int = self._shift(framing)
+        self._fields: Dict[str, Tuple[int, struct.Struct]] = {
+                name: (offset + shift, struct.Struct('<' + fmt)) for name, (offset, fmt) in fields.items()
+                }
+        return
+    
+    @staticmethod
+    def _frame(command: bytearray, framing: int) -> bytearray:
+        if framing == FRAMING_V2:
+            return bytearray(encode_frame(command))
+        return bytearray(command[:2] + command[1:])
+    
+    @staticmethod
+    def _shift(framing: int) -> int:
+        return 2 if framing == FRAMING_V2 else 1
+    
+    def reframe(self, framing: int) -> None:
+        """Change the frame format, the current field values are kept.
+        
+        Parameters
+        ----------
+        framing : int
+            The frame format of the connection the template is sent over.
+            
+        """
+        if framing == self.framing:
+            return
+        if self.framing == FRAMING_V2:
+            command: bytearray = self._buffer[2:]
+        else:
+            command: bytearray = self._buffer[0:1] + self._buffer[2:]
+        delta: int = self._shift(framing) - self._shift(self.framing)
+        self._buffer = self._frame(command, framing)
+        self.frame = memoryview(self._buffer)
+        self._fields = {name: (offset + delta, packer) for name, (offset, packer) in self._fields.items()}
+        self.framing = framing
+        return
+    
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(self._fields)
+    
+    @property
+    def hub_id(self) -> int:
+        return self._buffer[self._shift(self.framing) + 2]
+    
+    @hub_id.setter
+    def hub_id(self, hub_id: int) -> None:
+        self._buffer[self._shift(self.framing) + 2] = hub_id
+        return
+    
+    def __getitem__(self, name: str) -> int:
+        offset, packer = self._fields[name]
+        return packer.unpack_from(self._buffer, offset)[0]
+    
+    def __setitem__(self, name: str, value: int) -> None:
+        offset, packer = self._fields[name]
+        packer.pack_into(self._buffer, offset, value)
+        return
+
 
 @dataclass
 class CMD_SET_ACC_DEACC_PROFILE(DOWNSTREAM_MESSAGE):
@@ -72,28 +288,17 @@ class CMD_SET_ACC_DEACC_PROFILE(DOWNSTREAM_MESSAGE):
     profile_nr: int = 0
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
+        self.port: bytes = _port_bytes(self.port)
         if self.time_to_full_zero_speed in range(0, 10000):
-            if isinstance(self.port, PORT):
-                self.port: bytes = self.port.value
-            elif isinstance(self.port, int):
-                self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
-            else:
-                self.port: bytes = self.port
-            
-            self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.DNS_PORT_CMD).header
-            self.COMMAND: bytearray = bytearray(
-                    self.header +
-                    self.port +
-                    bitstring.Bits(uintle=(self.start_cond & self.completion_cond), length=8).bytes +
-                    self.profile_type +
-                    self.time_to_full_zero_speed.to_bytes(2, 'little', signed=False) +
-                    self.profile_nr.to_bytes(1, 'little', signed=False)
+            self.COMMAND: bytearray = ENC_SET_ACC_DEACC_PROFILE.encode(
+                    self.port[0],
+                    self.start_cond & self.completion_cond,
+                    self.profile_type[0],
+                    self.time_to_full_zero_speed,
+                    self.profile_nr
                     )
-            self.m_length = (1 + len(self.COMMAND)).to_bytes(1, 'little', signed=False)
-            self.COMMAND = bytearray(self.handle
-                                     + self.m_length
-                                     + self.COMMAND)
+            self.header: bytearray = self.COMMAND[2:4]
+            self.m_length: bytes = bytes(self.COMMAND[1:2])
         else:
             raise ValueError(f"[{self.port[0]}:CMD_SET_ACC_DEACC_PROFILE]-[ERR]: time_to_full_zero_speed = "
                              f"{self.time_to_full_zero_speed} exceeds the range limit of [0..10000]...")
@@ -102,10 +307,17 @@ class CMD_SET_ACC_DEACC_PROFILE(DOWNSTREAM_MESSAGE):
     
 @dataclass
 class CMD_EXT_SRV_CONNECT_REQ(DOWNSTREAM_MESSAGE):
+    """Registers the device at the server.
+    
+    With `framing` greater than ``1`` the request additionally asks for the frame format `framing` and the optional
+    frame fields `frame_flags`, see :mod:`legoBTLE.networking.framing`.
+    
+    """
     port: Union[PORT, int, bytes] = field(init=True)
+    framing: int = field(init=True, default=1)
+    frame_flags: int = field(init=True, default=0)
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
         self.handle: bytes = b'\x00'
         self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD[:1]).header
         self.subCMD = SERVER_SUB_COMMAND.REG_W_SERVER
@@ -121,8 +333,10 @@ class CMD_EXT_SRV_CONNECT_REQ(DOWNSTREAM_MESSAGE):
         self.COMMAND = (self.header
                         + self.port
                         + self.subCMD)
+        if self.framing > 1:
+            self.COMMAND += bytes((self.framing, self.frame_flags))
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = (1 + len(self.COMMAND)).to_bytes(1, 'little', signed=True)
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -141,14 +355,13 @@ class CMD_EXT_SRV_DISCONNECT_REQ(DOWNSTREAM_MESSAGE):
     port: Union[PORT, int, bytes] = field(init=True, default=b'')
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
         self.handle: bytes = b'\x00'
         self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD[:1]).header
         self.subCMD = SERVER_SUB_COMMAND.DISCONNECT_F_SERVER
         
         self.COMMAND = self.header + self.port + self.subCMD
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = (1 + len(self.COMMAND)).to_bytes(1, 'little', signed=True)
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -163,13 +376,12 @@ class EXT_SRV_CONNECTED_SND(DOWNSTREAM_MESSAGE):
     port: Union[PORT, int, bytes] = field(init=True, default=b'')
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
         self.handle: bytes = b'\xff'
         self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD[:1]).header
         
         self.COMMAND = self.header + self.port + PERIPHERAL_EVENT.EXT_SRV_CONNECTED
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = (1 + len(self.COMMAND)).to_bytes(1, 'little', signed=True)
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -184,13 +396,12 @@ class EXT_SRV_DISCONNECTED_SND(DOWNSTREAM_MESSAGE):
     port: Union[PORT, int, bytes] = field(init=True, default=b'')
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
         self.handle: bytes = b'\xff'
         self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD[:1]).header
         
         self.COMMAND = self.header + self.port + PERIPHERAL_EVENT.EXT_SRV_DISCONNECTED
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = (1 + len(self.COMMAND)).to_bytes(1, 'little', signed=True)
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -205,12 +416,11 @@ class CMD_HUB_ACTION_HUB_SND(DOWNSTREAM_MESSAGE):
     hub_action: bytes = field(init=True, default=HUB_ACTION.DNS_HUB_FAST_SHUTDOWN)
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
         self.handle: bytes = b'\x0f'
         self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.UPS_DNS_HUB_ACTION[:1]).header
         self.COMMAND = self.header + bytearray(self.hub_action)
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = (1 + len(self.COMMAND)).to_bytes(1, 'little', signed=True)
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -225,7 +435,6 @@ class HUB_ALERT_UPDATE_REQ(DOWNSTREAM_MESSAGE):
     hub_alert: bytes = field(init=True, default=HUB_ALERT_TYPE.LOW_V)
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
         self.handle: bytes = b'\x0f'
         self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.UPS_DNS_HUB_ALERT[:1]).header
         self.hub_alert_op: bytes = HUB_ALERT_OP.DNS_UPDATE_REQUEST
@@ -236,7 +445,7 @@ class HUB_ALERT_UPDATE_REQ(DOWNSTREAM_MESSAGE):
                 self.hub_alert_op
                 )
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = (1 + len(self.COMMAND)).to_bytes(1, 'little', signed=True)
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -252,7 +461,6 @@ class HUB_ALERT_NOTIFICATION_REQ(DOWNSTREAM_MESSAGE):
     hub_alert_op: bytes = field(init=True, default=HUB_ALERT_OP.DNS_UPDATE_ENABLE)
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
         self.handle: bytes = b'\x0f'
         self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.UPS_DNS_HUB_ALERT[:1]).header
         
@@ -262,7 +470,7 @@ class HUB_ALERT_NOTIFICATION_REQ(DOWNSTREAM_MESSAGE):
                 self.hub_alert_op
                 )
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = (1 + len(self.COMMAND)).to_bytes(1, 'little', signed=True)
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -286,22 +494,14 @@ class CMD_PORT_NOTIFICATION_DEV_REQ(DOWNSTREAM_MESSAGE):
     notif_enabled: bytes = field(init=True, default=COMMAND_STATUS.ENABLED)
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
-        self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.DNS_PORT_NOTIFICATION[:1]).header
-        self.COMMAND = bytearray(self.header +
-                                 self.port +
-                                 self.hub_action +
-                                 self.delta_interval +
-                                 b'\x00' * (4 - len(self.delta_interval)) +
-                                 self.notif_enabled)
-        
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
-        
-        self.COMMAND = bytearray(
-                self.handle +
-                self.m_length +
-                self.COMMAND
+        self.COMMAND: bytearray = ENC_PORT_NOTIFICATION.encode(
+                self.port[0],
+                self.hub_action[0],
+                self.delta_interval,
+                self.notif_enabled[0]
                 )
+        self.header: bytearray = self.COMMAND[2:4]
+        self.m_length: bytes = bytes(self.COMMAND[1:2])
         return
     
     # a: CMD_PORT_NOTIFICATION_DEV_REQ = CMD_PORT_NOTIFICATION_DEV_REQ(port=b'\x02', delta_interval=b'\x00')
@@ -342,39 +542,24 @@ class CMD_START_PWR_DEV(DOWNSTREAM_MESSAGE):
     use_dec_profile: int = MOVEMENT.USE_DEC_PROFILE
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
-        self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.DNS_PORT_CMD[:1]).header
-        ports = [self.port, ]
-        ports = list(map(lambda x: x.value if isinstance(x, PORT) else x, ports))
-        [self.port, ] = list(
-                map(lambda x: x.to_bytes(1, 'little', signed=False) if isinstance(x, int) else x, ports))
-        
-        self.COMMAND: bytearray = bytearray(
-                self.header +
-                self.port +
-                bitstring.Bits(uintle=(self.start_cond & self.completion_cond), length=8).bytes
-                )
-                
+        self.port: bytes = _port_bytes(self.port)
+        
         if self.synced:
-            self.COMMAND += bytearray(
-                    SUB_COMMAND.START_PWR_UNREGULATED_SYNC +
-                    (
-                            bitstring.Bits(intle=(self.power_a), length=8).bytes +
-                            bitstring.Bits(intle=(self.power_b), length=8).bytes
-                        )
+            self.COMMAND: bytearray = ENC_START_PWR_SYNC.encode(
+                    self.port[0],
+                    self.start_cond & self.completion_cond,
+                    SUB_COMMAND.START_PWR_UNREGULATED_SYNC,
+                    self.power_a,
+                    self.power_b
                     )
-            self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
         else:
-            self.COMMAND += bytearray(
-                    bitstring.Bits(intle=(self.power), length=8).bytes
+            self.COMMAND: bytearray = ENC_START_PWR.encode(
+                    self.port[0],
+                    self.start_cond & self.completion_cond,
+                    self.power
                     )
-            self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
-
-        self.COMMAND: bytearray = bytearray(
-                self.handle +
-                self.m_length +
-                self.COMMAND
-                )
+        self.header: bytearray = self.COMMAND[2:4]
+        self.m_length: bytes = bytes(self.COMMAND[1:2])
         return
     
     # a: CMD_START_PWR_DEV = CMD_START_PWR_DEV(port=PORT.LED, direction=MOVEMENT.HOLD, power=-90)
@@ -416,45 +601,54 @@ class CMD_START_SPEED_DEV(DOWNSTREAM_MESSAGE):
     use_dec_profile: int = MOVEMENT.USE_DEC_PROFILE
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
-        self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.DNS_PORT_CMD[:1]).header
-        ports = [self.port, ]
-        ports = list(map(lambda x: x.value if isinstance(x, PORT) else x, ports))
-        [self.port, ] = list(
-                map(lambda x: x.to_bytes(1, 'little', signed=False) if isinstance(x, int) else x, ports))
+        self.port: bytes = _port_bytes(self.port)
         
         if self.synced:
             self.subCmd: bytes = SUB_COMMAND.TURN_SPD_UNLIMITED_SYNC
-            maxSpdEff_CCWCW: bytearray = bytearray(
-                    bitstring.Bits(intle=(self.speed_a), length=8).bytes +
-                    bitstring.Bits(intle=(self.speed_b), length=8).bytes
+            self.COMMAND: bytearray = ENC_START_SPEED_SYNC.encode(
+                    self.port[0],
+                    self.start_cond & self.completion_cond,
+                    self.subCmd[0],
+                    self.speed_a,
+                    self.speed_b,
+                    self.abs_max_power,
+                    (self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile
                     )
         else:
             self.subCmd: bytes = SUB_COMMAND.TURN_SPD_UNLIMITED
-            maxSpdEff_CCWCW: bytearray = bytearray(
-                    bitstring.Bits(intle=(self.speed), length=8).bytes
+            self.COMMAND: bytearray = ENC_START_SPEED.encode(
+                    self.port[0],
+                    self.start_cond & self.completion_cond,
+                    self.subCmd[0],
+                    self.speed,
+                    self.abs_max_power,
+                    (self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile
                     )
-        
-        self.COMMAND: bytearray = bytearray(
-                self.header +
-                self.port +
-                bitstring.Bits(intle=(self.start_cond & self.completion_cond), length=8).bytes +
-                self.subCmd +
-                maxSpdEff_CCWCW +
-                bitstring.Bits(uintle=self.abs_max_power, length=8).bytes +
-                bitstring.Bits(uintle=((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile),
-                               length=8).bytes
-                )
-        
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
-        
-        self.COMMAND: bytearray = bytearray(
-                self.handle +
-                self.m_length +
-                self.COMMAND
-                )
+        self.header: bytearray = self.COMMAND[2:4]
+        self.m_length: bytes = bytes(self.COMMAND[1:2])
         return
     
+    @classmethod
+    def template(cls, **kwargs) -> CommandTemplate:
+        """Encode the command once for streaming speed set points.
+        
+        Parameters
+        ----------
+        kwargs :
+            The fields of :class:`CMD_START_SPEED_DEV`, unset speeds default to 0.
+            
+        Returns
+        -------
+        CommandTemplate
+            The template with the fields ``speed`` (``speed_a`` and ``speed_b`` if synced) and ``abs_max_power``.
+        """
+        if kwargs.get('synced', False):
+            kwargs.setdefault('speed_a', 0)
+            kwargs.setdefault('speed_b', 0)
+            return CommandTemplate(cls(**kwargs), {'speed_a': (7, 'b'), 'speed_b': (8, 'b'), 'abs_max_power': (9, 'B')})
+        kwargs.setdefault('speed', 0)
+        return CommandTemplate(cls(**kwargs), {'speed': (7, 'b'), 'abs_max_power': (8, 'B')})
+    
     # a: CMD_START_SPEED_DEV = CMD_START_SPEED_DEV(synced=False, speed=-90, abs_max_power=100, port=b'\x03')
     # a: CMD_START_SPEED_DEV = CMD_START_SPEED_DEV(synced=True, speed_a=-90, speed_b=64, abs_max_power=100, port=b'\x03')
 
@@ -476,46 +670,35 @@ class CMD_START_MOVE_DEV_TIME(DOWNSTREAM_MESSAGE):
     use_dec_profile: int = MOVEMENT.USE_DEC_PROFILE
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
-        self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.DNS_PORT_CMD[:1]).header
-        ports = [self.port, ]
-        ports = list(map(lambda x: x.value if isinstance(x, PORT) else x, ports))
-        [self.port, ] = list(
-                map(lambda x: x.to_bytes(1, 'little', signed=False) if isinstance(x, int) else x, ports))
-        
-        self.subCMD: bytes
-        speedEff: bytes
+        self.port: bytes = _port_bytes(self.port)
+        
         if self.synced:
             self.subCMD: bytes = SUB_COMMAND.TURN_FOR_TIME_SYNC
-            speedEff: bytearray = bytearray(
-                    bitstring.Bits(intle=self.speed_a, length=8).bytes +
-                    bitstring.Bits(intle=self.speed_b, length=8).bytes
+            self.COMMAND: bytearray = ENC_START_MOVE_TIME_SYNC.encode(
+                    self.port[0],
+                    self.start_cond & self.completion_cond,
+                    self.subCMD[0],
+                    self.time,
+                    self.speed_a,
+                    self.speed_b,
+                    self.power,
+                    self.on_completion,
+                    (self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile
                     )
         else:
             self.subCMD: bytes = SUB_COMMAND.TURN_FOR_TIME
-            speedEff: bytearray = bytearray(
-                    bitstring.Bits(intle=self.speed, length=8).bytes
+            self.COMMAND: bytearray = ENC_START_MOVE_TIME.encode(
+                    self.port[0],
+                    self.start_cond & self.completion_cond,
+                    self.subCMD[0],
+                    self.time,
+                    self.speed,
+                    self.power,
+                    self.on_completion,
+                    (self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile
                     )
-        
-        self.COMMAND = bytearray(
-                self.header +
-                self.port +
-                bitstring.Bits(intle=(self.start_cond & self.completion_cond), length=8).bytes +
-                self.subCMD +
-                bitstring.Bits(uintle=self.time, length=16).bytes +
-                speedEff +
-                bitstring.Bits(uintle=self.power, length=8).bytes +
-                bitstring.Bits(intle=self.on_completion, length=8).bytes +
-                bitstring.Bits(uintle=((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile),
-                               length=8).bytes
-                )
-        
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
-        
-        self.COMMAND = bytearray(self.handle +
-                                 self.m_length +
-                                 self.COMMAND
-                                 )
+        self.header: bytearray = self.COMMAND[2:4]
+        self.m_length: bytes = bytes(self.COMMAND[1:2])
         return
     
     # a: CMD_START_MOVE_DEV_TIME = CMD_START_MOVE_DEV_TIME(port=b'\x03', synced=False, speed=23, time=2560,
@@ -541,26 +724,33 @@ class CMD_START_MOVE_DEV_DEGREES(DOWNSTREAM_MESSAGE):
     use_dec_profile: int = MOVEMENT.USE_DEC_PROFILE
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
-        self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.DNS_PORT_CMD[:1]).header
+        self.port: bytes = _port_bytes(self.port)
         
-        if isinstance(self.port, PORT):
-            self.port: bytes = self.port.value
-        elif isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
-        else:
-            self.port: bytes = self.port
-            
-        speedEff: bytes
         if self.synced:
             self.subCMD: bytes = SUB_COMMAND.TURN_FOR_DEGREES_SYNC
-            speedEff: bytearray = bytearray(
-                    bitstring.Bits(intle=self.speed_a, length=8).bytes +
-                    bitstring.Bits(intle=self.speed_b, length=8).bytes
+            self.COMMAND: bytearray = ENC_START_MOVE_DEGREES_SYNC.encode(
+                    self.port[0],
+                    self.start_cond & self.completion_cond,
+                    self.subCMD[0],
+                    self.degrees,
+                    self.speed_a,
+                    self.speed_b,
+                    self.abs_max_power,
+                    self.on_completion,
+                    (self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile
                     )
         else:
             self.subCMD: bytes = SUB_COMMAND.TURN_FOR_DEGREES
-            speedEff: bytearray = bytearray(int.to_bytes(self.speed, 1, 'little', signed=True))
+            self.COMMAND: bytearray = ENC_START_MOVE_DEGREES.encode(
+                    self.port[0],
+                    self.start_cond & self.completion_cond,
+                    self.subCMD[0],
+                    self.degrees,
+                    self.speed,
+                    self.abs_max_power,
+                    self.on_completion,
+                    (self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile
+                    )
         
         # tachoL: int = ((self.degrees * 2) * abs(self.speed_a) * _sign(self.speed_a)) / \
         #              (abs(self.speed_a) + abs(self.speed_b))
@@ -568,25 +758,8 @@ class CMD_START_MOVE_DEV_DEGREES(DOWNSTREAM_MESSAGE):
         # tachoR: int = ((self.degrees * 2) * abs(self.speed_b) * _sign(self.speed_b)) / \
         #              (abs(self.speed_a) + abs(self.speed_b))
         
-        self.COMMAND = bytearray(
-                self.header +
-                self.port +
-                bitstring.Bits(intle=(self.start_cond & self.completion_cond), length=8).bytes +
-                self.subCMD +
-                bitstring.Bits(intle=self.degrees, length=32).bytes +
-                speedEff +
-                bitstring.Bits(intle=self.abs_max_power, length=8).bytes +
-                bitstring.Bits(intle=self.on_completion, length=8).bytes +
-                bitstring.Bits(uintle=((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile),
-                               length=8).bytes
-                )
-        
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
-        
-        self.COMMAND = bytearray(self.handle
-                                 + self.m_length
-                                 + self.COMMAND
-                                 )
+        self.header: bytearray = self.COMMAND[2:4]
+        self.m_length: bytes = bytes(self.COMMAND[1:2])
         return
         
         # a: CMD_START_MOVE_DEV_DEGREES = CMD_START_MOVE_DEV_DEGREES(synced=False, port=b'\x05', speed=72,
@@ -648,47 +821,35 @@ class CMD_GOTO_ABS_POS_DEV(DOWNSTREAM_MESSAGE):
         #
         # tachoR: int = ((self.degrees * 2) * abs(self.speed_b) * _sign(self.speed_b)) / \
         #               (abs(self.speed_a) + abs(self.speed_b))
-        self.id: bytes = uuid.uuid4().bytes
-        self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.DNS_PORT_CMD[:1]).header
-        
-        if isinstance(self.port, PORT):
-            self.port: bytes = self.port.value
-        elif isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
-        else:
-            self.port: bytes = self.port
+        self.port: bytes = _port_bytes(self.port)
         
         if self.synced:
             self.subCMD: bytes = SUB_COMMAND.GOTO_ABSOLUTE_POS_SYNC
-            absPosEff: bytearray = bytearray(
-                    bitstring.Bits(intle=(int(round(self.abs_pos_a * self.gearRatio))), length=32).bytes +
-                    bitstring.Bits(intle=(int(round(self.abs_pos_b * self.gearRatio))), length=32).bytes
+            self.COMMAND: bytearray = ENC_GOTO_ABS_POS_SYNC.encode(
+                    self.port[0],
+                    self.start_cond & self.completion_cond,
+                    self.subCMD[0],
+                    int(round(self.abs_pos_a * self.gearRatio)),
+                    int(round(self.abs_pos_b * self.gearRatio)),
+                    self.speed,
+                    self.abs_max_power,
+                    self.on_completion,
+                    (self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile
                     )
         else:
             self.subCMD: bytes = SUB_COMMAND.GOTO_ABSOLUTE_POS
-            absPosEff: bytearray = bytearray(
-                    bitstring.Bits(intle=(int(round(self.abs_pos * self.gearRatio))), length=32).bytes
+            self.COMMAND: bytearray = ENC_GOTO_ABS_POS.encode(
+                    self.port[0],
+                    self.start_cond & self.completion_cond,
+                    self.subCMD[0],
+                    int(round(self.abs_pos * self.gearRatio)),
+                    self.speed,
+                    self.abs_max_power,
+                    self.on_completion,
+                    (self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile
                     )
-        self.COMMAND = bytearray(
-                self.header +
-                self.port +
-                bitstring.Bits(intle=(self.start_cond & self.completion_cond), length=8).bytes +
-                self.subCMD +
-                absPosEff +
-                bitstring.Bits(intle=self.speed, length=8).bytes +
-                bitstring.Bits(intle=self.abs_max_power, length=8).bytes +
-                bitstring.Bits(intle=self.on_completion, length=8).bytes +
-                bitstring.Bits(intle=((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile),
-                               length=8).bytes
-                )
-        
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
-        
-        self.COMMAND = bytearray(
-                self.handle +
-                self.m_length +
-                self.COMMAND
-                )
+        self.header: bytearray = self.COMMAND[2:4]
+        self.m_length: bytes = bytes(self.COMMAND[1:2])
         return
 
 
@@ -708,45 +869,23 @@ class CMD_SETUP_DEV_VIRTUAL_PORT(DOWNSTREAM_MESSAGE):
     port_b: Union[PORT, int, bytes] = None
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
-        self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.DNS_VIRTUAL_PORT_SETUP[:1]).header
-        if isinstance(self.port_a, PORT):
-            self.port_a: bytes = self.port_a.value
-        if isinstance(self.port_b, PORT):
-            self.port_b: bytes = self.port_b.value
-        if isinstance(self.port, PORT):
-            self.port: bytes = self.port.value
-
-        if isinstance(self.port_a, int):
-            self.port_a: bytes = int.to_bytes(self.port_a, 1, 'little', signed=False)
-        if isinstance(self.port_b, int):
-            self.port_b: bytes = int.to_bytes(self.port_b, 1, 'little', signed=False)
-        if isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, 1, 'little', signed=False)
-            
-        self.COMMAND = bytearray(
-                self.header +
-                self.connection
-                )
+        self.port_a: bytes = _port_bytes(self.port_a)
+        self.port_b: bytes = _port_bytes(self.port_b)
+        self.port: bytes = _port_bytes(self.port)
         
         if self.connection == CONNECTION.CONNECT:
-            self.COMMAND = bytearray(
-                    self.COMMAND +
-                    self.port_a +
-                    self.port_b
+            self.COMMAND: bytearray = ENC_VIRTUAL_PORT_CONNECT.encode(
+                    self.connection[0],
+                    self.port_a[0],
+                    self.port_b[0]
                     )
         elif self.connection == CONNECTION.DISCONNECT:
-            self.COMMAND = bytearray(
-                    self.COMMAND +
-                    self.port
+            self.COMMAND: bytearray = ENC_VIRTUAL_PORT_DISCONNECT.encode(
+                    self.connection[0],
+                    self.port[0]
                     )
-        
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
-        
-        self.COMMAND = bytearray(self.handle +
-                                 self.m_length +
-                                 self.COMMAND
-                                 )
+        self.header: bytearray = self.COMMAND[2:4]
+        self.m_length: bytes = bytes(self.COMMAND[1:2])
         print(f"VIRT SETUP COMMAND: {self.COMMAND.hex()}")
         return
 
@@ -775,7 +914,6 @@ class CMD_SET_POSITION_L_R(DOWNSTREAM_MESSAGE):
     dev_value_b: int = 0  # stops and sets to zero
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
         """The values for the attributes for this command are set.
         
         Returns
@@ -784,32 +922,18 @@ class CMD_SET_POSITION_L_R(DOWNSTREAM_MESSAGE):
             Nothing, setter.
 
         """
-        self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.DNS_PORT_CMD[:1]).header
         self.sub_cmd: bytes = SUB_COMMAND.SET_VALUE_L_R
-        start_cond: int = MOVEMENT.ONSTART_EXEC_IMMEDIATELY
-        completion_cond: int = MOVEMENT.ONCOMPLETION_UPDATE_STATUS
-
-        if isinstance(self.port, PORT):
-            self.port: bytes = self.port.value
-        elif isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
-        else:
-            self.port: bytes = self.port
+        self.port: bytes = _port_bytes(self.port)
         
-        self.COMMAND: bytearray = bytearray(
-                self.header +
-                self.port +
-                bitstring.Bits(intle=(start_cond & completion_cond), length=8).bytes +
-                self.sub_cmd +
-                bitstring.Bits(intle=self.dev_value_a, length=32).bytes +
-                bitstring.Bits(intle=self.dev_value_b, length=32).bytes
+        self.COMMAND: bytearray = ENC_SET_POSITION_L_R.encode(
+                self.port[0],
+                MOVEMENT.ONSTART_EXEC_IMMEDIATELY & MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
+                self.sub_cmd[0],
+                self.dev_value_a,
+                self.dev_value_b
                 )
-        
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
-        
-        self.COMMAND = bytearray(self.handle +
-                                 self.m_length +
-                                 self.COMMAND)
+        self.header: bytearray = self.COMMAND[2:4]
+        self.m_length: bytes = bytes(self.COMMAND[1:2])
         return
 
 
@@ -846,65 +970,73 @@ class CMD_MODE_DATA_DIRECT(DOWNSTREAM_MESSAGE):
     color: int = HUB_COLOR.BLUE
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
-        # same as MESSAGE_TYPE.DNS_PORT_CMD[:1] but we got MESSAGE_TYPE initialized on the way.
-        self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.DNS_PORT_CMD[:1]).header
         self.sub_cmd: bytes = SUB_COMMAND.WRITE_DIRECT_MODE_DATA
-
-        if isinstance(self.port, PORT):
-            self.port: bytes = self.port.value
-        elif isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
-        else:
-            self.port: bytes = self.port
-        
-        self.COMMAND: bytearray = bytearray(
-                self.header +
-                self.port +
-                bitstring.Bits(intle=(self.start_cond & self.completion_cond), length=8).bytes +
-                self.sub_cmd +
-                self.preset_mode
-                )
+        self.port: bytes = _port_bytes(self.port)
         
+        fields: tuple = (self.port[0], self.start_cond & self.completion_cond, self.sub_cmd[0], self.preset_mode[0])
         if self.preset_mode == WRITEDIRECT_MODE.SET_LED_RGB:
-            self.COMMAND: bytearray = bytearray(
-                    self.COMMAND +
-                    bitstring.Bits(intle=self.red, length=8).bytes +
-                    bitstring.Bits(intle=self.green, length=8).bytes +
-                    bitstring.Bits(intle=self.blue, length=8).bytes
+            self.COMMAND: bytearray = ENC_WRITE_DIRECT_MODE_RGB.encode(
+                    *fields[:3],
+                    self.preset_mode,
+                    self.red,
+                    self.green,
+                    self.blue
                     )
         elif self.preset_mode == WRITEDIRECT_MODE.SET_LED_COLOR:
-            self.COMMAND: bytearray = bytearray(
-                    self.COMMAND +
-                    bitstring.Bits(intle=self.color, length=8).bytes
-                    )
+            self.COMMAND: bytearray = ENC_WRITE_DIRECT_MODE_INT8.encode(*fields, self.color)
         elif self.preset_mode == WRITEDIRECT_MODE.SET_POSITION:
             if self.synced:
-                self.COMMAND: bytearray = bytearray(
-                        self.COMMAND +
-                        bitstring.Bits(intle=int(round(self.motor_position * self.gearRatio)), length=32).bytes +
-                        bitstring.Bits(intle=int(round(self.motor_position_a * self.gearRatio)), length=32).bytes +
-                        bitstring.Bits(intle=int(round(self.motor_position_b * self.gearRatio)), length=32).bytes
+                self.COMMAND: bytearray = ENC_WRITE_DIRECT_MODE_POSITION_SYNC.encode(
+                        *fields,
+                        int(round(self.motor_position * self.gearRatio)),
+                        int(round(self.motor_position_a * self.gearRatio)),
+                        int(round(self.motor_position_b * self.gearRatio))
                         )
             else:
-                self.COMMAND: bytearray = bytearray(
-                        self.COMMAND +
-                        bitstring.Bits(intle=int(round(self.motor_position * self.gearRatio)), length=32).bytes
+                self.COMMAND: bytearray = ENC_WRITE_DIRECT_MODE_POSITION.encode(
+                        *fields,
+                        int(round(self.motor_position * self.gearRatio))
                         )
         elif self.preset_mode == WRITEDIRECT_MODE.SET_MOTOR_POWER:
-            self.COMMAND: bytearray = bytearray(
-                    self.COMMAND +
-                    bitstring.Bits(intle=self.motor_power, length=8).bytes
-                    )
-        
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
-        
-        self.COMMAND = bytearray(self.handle +
-                                 self.m_length +
-                                 self.COMMAND
-                                 )
-        print(self.COMMAND.hex())
+            self.COMMAND: bytearray = ENC_WRITE_DIRECT_MODE_INT8.encode(*fields, self.motor_power)
+        else:
+            self.COMMAND: bytearray = ENC_WRITE_DIRECT_MODE.encode(*fields)
+        self.header: bytearray = self.COMMAND[2:4]
+        self.m_length: bytes = bytes(self.COMMAND[1:2])
         return
+    
+    @classmethod
+    def template(cls, **kwargs) -> CommandTemplate:
+        """Encode the command once for streaming positions or power values.
+        
+        Parameters
+        ----------
+        kwargs :
+            The fields of :class:`CMD_MODE_DATA_DIRECT`, unset positions default to 0.
+            
+        Returns
+        -------
+        CommandTemplate
+            For :attr:`WRITEDIRECT_MODE.SET_POSITION` the template has the field ``motor_position`` (and
+            ``motor_position_a``, ``motor_position_b`` if synced), for :attr:`WRITEDIRECT_MODE.SET_MOTOR_POWER` the
+            field ``motor_power``. The positions are patched as given, i.e., without applying :attr:`gearRatio`.
+        """
+        preset_mode: bytes = kwargs.setdefault('preset_mode', WRITEDIRECT_MODE.SET_POSITION)
+        if preset_mode == WRITEDIRECT_MODE.SET_POSITION:
+            kwargs.setdefault('motor_position', 0)
+            if kwargs.get('synced', False):
+                kwargs.setdefault('motor_position_a', 0)
+                kwargs.setdefault('motor_position_b', 0)
+                return CommandTemplate(cls(**kwargs), {'motor_position': (8, 'i'),
+                                                       'motor_position_a': (12, 'i'),
+                                                       'motor_position_b': (16, 'i'),
+                                                       })
+            return CommandTemplate(cls(**kwargs), {'motor_position': (8, 'i')})
+        elif preset_mode == WRITEDIRECT_MODE.SET_MOTOR_POWER:
+            template: CommandTemplate = CommandTemplate(cls(**kwargs), {'motor_power': (8, 'b')})
+            template['motor_power'] = kwargs.get('motor_power', 0)
+            return template
+        raise ValueError(f"[CMD_MODE_DATA_DIRECT]-[ERR]: NO TEMPLATE FOR PRESET MODE {preset_mode.hex()}...")
 
 
 # a: CMD_MODE_DATA_DIRECT = CMD_MODE_DATA_DIRECT(port=b'\x01', synced=True, preset_mode=WRITEDIRECT_MODE.SET_POSITION,
@@ -923,7 +1055,6 @@ class CMD_GENERAL_NOTIFICATION_HUB_REQ(DOWNSTREAM_MESSAGE):
     COMMAND: bytearray = bytearray(b'\x0f\x04\x00\x01\x00')
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
         self.handle = b'\x0f'
         self.length = b'\x04'
         self.header = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.UPS_DNS_GENERAL_HUB_NOTIFICATIONS[:1]).header
@@ -935,34 +1066,17 @@ class CMD_HW_RESET(DOWNSTREAM_MESSAGE):
     port: Union[PORT, int, bytes]
     
     def __post_init__(self):
-        self.id: bytes = uuid.uuid4().bytes
-        self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.DNS_PORT_CMD[:1]).header
         self.sub_cmd: bytes = SUB_COMMAND.WRITE_DIRECT
-        start_cond: int = MOVEMENT.ONSTART_EXEC_IMMEDIATELY
-        completion_cond: int = MOVEMENT.ONCOMPLETION_UPDATE_STATUS
-
-        if isinstance(self.port, PORT):
-            self.port: bytes = self.port.value
-        elif isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
-        else:
-            self.port: bytes = self.port
+        self.port: bytes = _port_bytes(self.port)
         
-        self.COMMAND: bytearray = bytearray(
-                self.header +
-                self.port +
-                bitstring.Bits(intle=(start_cond & completion_cond), length=8).bytes +
-                self.sub_cmd +
-                b'\xd4' +
-                b'\x11'
+        self.COMMAND: bytearray = ENC_HW_RESET.encode(
+                self.port[0],
+                MOVEMENT.ONSTART_EXEC_IMMEDIATELY & MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
+                self.sub_cmd[0],
+                0xd4,
+                0x11,
+                0x11 ^ 0xd4 ^ 0xff
                 )
-
-        self.COMMAND += (self.COMMAND[-1] ^ self.COMMAND[-2] ^ 0xff).to_bytes(1, 'little', signed=False)
-
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
-
-        self.COMMAND = bytearray(self.handle +
-                                 self.m_length +
-                                 self.COMMAND
-                                 )
+        self.header: bytearray = self.COMMAND[2:4]
+        self.m_length: bytes = bytes(self.COMMAND[1:2])
         return
@@ -15,9 +15,16 @@
 # DNS == DOWNSTREAM === TO DEVICE
 
 import math
+import struct
 from collections import defaultdict
 from dataclasses import dataclass
 from dataclasses import field
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
 import numpy as np
 from sphinx.ext.autodoc import deprecated
@@ -25,23 +32,83 @@ from sphinx.ext.autodoc import deprecated
 import legoBTLE
 from legoBTLE.legoWP import types
 from legoBTLE.legoWP.common_message_header import COMMON_MESSAGE_HEADER
-from legoBTLE.legoWP.types import CMD_FEEDBACK
+from legoBTLE.legoWP.types import CMD_FEEDBACK_STR
+from legoBTLE.legoWP.types import CMD_FEEDBACK_TABLE
 from legoBTLE.legoWP.types import CMD_RETURN_CODE
 from legoBTLE.legoWP.types import DEVICE_TYPE
 from legoBTLE.legoWP.types import HUB_ACTION
 from legoBTLE.legoWP.types import MESSAGE_TYPE
 from legoBTLE.legoWP.types import PERIPHERAL_EVENT
-from legoBTLE.networking.prettyprint.debug import debug_info
+
+
+_DECODERS: Dict[int, Callable[[bytearray], 'UPSTREAM_MESSAGE']] = {}
+"""The registry message type -> decoder used by :func:`build_upstream_message`."""
+
+
+def register_decoder(m_type: bytes) -> Callable:
+    """Register a decoder for upstream messages of type `m_type`.
+    
+    The decorated class or function is called with the raw message and has to return an
+    :class:`UPSTREAM_MESSAGE`. A decoder registered later for the same type replaces the earlier one.
+    
+    Parameters
+    ----------
+    m_type : bytes
+        The message type, see :class:`legoBTLE.legoWP.types.MESSAGE_TYPE`.
+    
+    Examples
+    --------
+    Decoding hub property messages::
+    
+        @register_decoder(MESSAGE_TYPE.UPS_DNS_GENERAL_HUB_NOTIFICATIONS)
+        @dataclass
+        class HUB_PROPERTY_NOTIFICATION(UPSTREAM_MESSAGE):
+            COMMAND: bytearray = field(init=True)
+    
+    """
+    def register(decoder: Callable) -> Callable:
+        _DECODERS[m_type[0]] = decoder
+        return decoder
+    return register
+
+
+def build_upstream_message(data: bytearray) -> 'UPSTREAM_MESSAGE':
+    """Builds the upstream message according to the message type in `data`.
+    
+    Parameters
+    ----------
+    data : bytearray
+        The raw message starting with the length byte.
+    
+    Returns
+    -------
+    UPSTREAM_MESSAGE
+        The upstream message determined by the header.
+    
+    Raises
+    ------
+    TypeError
+        If no decoder is registered for the message type.
+        
+    """
+    try:
+        return _DECODERS[data[2]](data)
+    except KeyError:
+        raise TypeError(f"[build_upstream_message]-[ERR]: NO DECODER FOR MESSAGE TYPE {data[2]:#04x}: "
+                        f"{data.hex()}...") from None
 
 
 class UpStreamMessageBuilder:
     """Generates the various Message types for returned data from the server.
     
+    .. note::
+        The builder is kept for existing code, :func:`build_upstream_message` does the same without creating
+        a builder per message. `debug` is only kept for compatibility, the builder prints nothing.
+    
     """
 
     def __init__(self, data, debug=False):
         self._data: bytearray = data
-        self._header = COMMON_MESSAGE_HEADER(data[:3])
         self._debug: bool = debug
         self._lastBuildPort: int = -1
         return
@@ -55,78 +122,7 @@ class UpStreamMessageBuilder:
             The upstream message determined by the header.
             
         """
-        dispatch = {
-            MESSAGE_TYPE.UPS_DNS_HUB_ACTION: HUB_ACTION_NOTIFICATION,
-            MESSAGE_TYPE.UPS_HUB_ATTACHED_IO: HUB_ATTACHED_IO_NOTIFICATION,
-            MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR: DEV_GENERIC_ERROR_NOTIFICATION,
-            MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK: PORT_CMD_FEEDBACK,
-            MESSAGE_TYPE.UPS_PORT_VALUE: PORT_VALUE,
-            MESSAGE_TYPE.UPS_PORT_NOTIFICATION: DEV_PORT_NOTIFICATION,
-            MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD: EXT_SERVER_CMD_ACK
-            if self._data[-1] == PERIPHERAL_EVENT.EXT_SRV_RECV else EXT_SERVER_NOTIFICATION,
-            MESSAGE_TYPE.UPS_DNS_HUB_ALERT: HUB_ALERT_NOTIFICATION,
-        }
-
-        return dispatch[self._header.m_type](self._data)
-
-        debug_info(f"[{self.__class__.__name__}]-[MSG]: DATA RECEIVED FOR PORT [{self._data[3]}], "
-                   f"STARTING UPSTREAMBUILDING: "
-                   f"{self._data.hex()}, {self._data[2]}\r\n RAW: {self._data}\r\nMESSAGE_TYPE: {self._header.m_type.hex()}",
-                   debug=self._debug)
-        if self._header.m_type == MESSAGE_TYPE.UPS_DNS_HUB_ACTION:
-            debug_info(f"GENERATING HUB_ACTION_NOTIFICATION for PORT {self._data[3]}", debug=self._debug)
-            ret = HUB_ACTION_NOTIFICATION(self._data)
-            self._lastBuildPort = -1
-            return ret
-
-        elif self._header.m_type == MESSAGE_TYPE.UPS_HUB_ATTACHED_IO:
-            debug_info(f"GENERATING HUB_ATTACHED_IO_NOTIFICATION for PORT {self._data[3]}", debug=self._debug)
-            ret = HUB_ATTACHED_IO_NOTIFICATION(self._data)
-            self._lastBuildPort = ret.m_port
-            return ret
-
-        elif self._header.m_type == MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR:
-            debug_info(f"GENERATING DEV_GENERIC_ERROR_NOTIFICATION for PORT {self._data[3]}", debug=self._debug)
-            ret = DEV_GENERIC_ERROR_NOTIFICATION(self._data)
-            self._lastBuildPort = -1
-            return ret
-
-        elif self._header.m_type == MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK:
-            debug_info(f"GENERATING PORT_CMD_FEEDBACK for PORT {self._data[3]}", debug=self._debug)
-            ret = PORT_CMD_FEEDBACK(self._data)
-            self._lastBuildPort = ret.m_port
-            return ret
-
-        elif self._header.m_type == MESSAGE_TYPE.UPS_PORT_VALUE:
-            debug_info(f"GENERATING PORT_VALUE for PORT {self._data[3]}", debug=self._debug)
-            ret = PORT_VALUE(self._data)
-            self._lastBuildPort = ret.m_port
-            return ret
-
-        elif self._header.m_type == MESSAGE_TYPE.UPS_PORT_NOTIFICATION:
-            debug_info(f"GENERATING DEV_PORT_NOTIFICATION for PORT {self._data[3]}", debug=self._debug)
-            ret = DEV_PORT_NOTIFICATION(self._data)
-            self._lastBuildPort = ret.m_port
-            return ret
-
-        elif self._header.m_type == MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD:
-            if self._data[-1] == PERIPHERAL_EVENT.EXT_SRV_RECV:
-                debug_info(f"GENERATING EXT_SERVER_CMD_ACK for PORT {self._data[3]}", debug=self._debug)
-                ret = EXT_SERVER_CMD_ACK(self._data)
-                return ret
-            else:
-                debug_info(f"GENERATING EXT_SERVER_NOTIFICATION for PORT {self._data[3]}", debug=self._debug)
-                ret = EXT_SERVER_NOTIFICATION(self._data)
-                return ret
-
-        elif self._header.m_type == MESSAGE_TYPE.UPS_DNS_HUB_ALERT:
-            debug_info(f"GENERATING HUB_ALERT_NOTIFICATION for PORT {self._data[3]}", debug=self._debug)
-            ret = HUB_ALERT_NOTIFICATION(self._data)
-            self._lastBuildPort = ret.m_port
-            return ret
-        else:
-            debug_info(f"EXCEPTION TypeError PORT {self._data[3]}", debug=self._debug)
-            pass
+        return build_upstream_message(self._data)
 
     @property
     def lastBuildPort(self) -> int:
@@ -143,24 +139,208 @@ class UpStreamMessageBuilder:
         return self._lastBuildPort
 
 
+UPSTREAM_FRAME_DTYPE: np.dtype = np.dtype([('type', 'u1'),
+                                           ('port', 'u1'),
+                                           ('value', '<i4'),
+                                           ('timestamp', '<f8'),
+                                           ])
+"""The row layout of :func:`decode_frames`."""
+
+_PORT_VALUE_TYPE: int = MESSAGE_TYPE.UPS_PORT_VALUE[0]
+_PORT_CMD_FEEDBACK_TYPE: int = MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK[0]
+_PORT_VALUE_LAYOUT: np.dtype = np.dtype([('length', 'u1'),
+                                         ('hub_id', 'u1'),
+                                         ('type', 'u1'),
+                                         ('port', 'u1'),
+                                         ('value', '<i4'),
+                                         ])
+
+
+def _frame_offsets(data: np.ndarray, prefix: int) -> np.ndarray:
+    n: int = data.size
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    stride: int = int(data[0]) + prefix
+    if (stride > prefix) and (n % stride == 0) and (data[prefix::stride] == stride - prefix).all():
+        # all frames have the same length
+        return np.arange(0, n, stride, dtype=np.intp)
+    
+    raw: memoryview = memoryview(data)
+    offsets: List[int] = []
+    offset: int = 0
+    while offset < n:
+        if offset + prefix >= n:
+            break
+        length: int = raw[offset + prefix]
+        if length == 0:
+            raise ValueError(f"[decode_frames]-[ERR]: ZERO LENGTH FRAME AT OFFSET {offset}...")
+        if offset + prefix + length > n:
+            break  # truncated frame at the end of the buffer
+        offsets.append(offset)
+        offset += prefix + length
+    return np.array(offsets, dtype=np.intp)
+
+
+def decode_frames(buffer: Union[bytes, bytearray, memoryview],
+                  timestamps: Optional[np.ndarray] = None,
+                  prefixed: bool = False,
+                  ) -> Tuple[np.ndarray, List[Tuple[float, bytes]]]:
+    """Decode a buffer of consecutive upstream frames at once.
+    
+    ``PORT_VALUE`` frames with 1, 2 or 4 byte values and single port ``PORT_CMD_FEEDBACK`` frames become rows of a
+    structured array with the layout :data:`UPSTREAM_FRAME_DTYPE`. The value of a ``PORT_CMD_FEEDBACK`` row is the
+    feedback byte, see :data:`legoBTLE.legoWP.types.CMD_FEEDBACK_TABLE`. All other frames are returned unchanged
+    in a side list, in the order of the buffer. A truncated frame at the end of the buffer is ignored.
+    
+    Parameters
+    ----------
+    buffer : bytes or bytearray or memoryview
+        The frames, each starting with its length byte.
+    timestamps : np.ndarray, optional
+        The receive time of each frame in the buffer, NaN if not given.
+    prefixed : bool, default False
+        ``True`` if each frame is preceded by an extra length byte, as sent by the server to the clients.
+
+    Returns
+    -------
+    tuple[np.ndarray, list[tuple[float, bytes]]]
+        The decoded rows and the remaining frames as (timestamp, frame).
+    
+    Examples
+    --------
+    >>> rows, other = decode_frames(b'\\x08\\x00\\x45\\x00\\xf7\\xee\\xff\\xff\\x05\\x00\\x82\\x00\\x0a')
+    >>> rows['value']
+    array([-4361,    10], dtype=int32)
+    
+    """
+    data: np.ndarray = np.frombuffer(buffer, dtype=np.uint8)
+    prefix: int = 1 if prefixed else 0
+    offsets: np.ndarray = _frame_offsets(data, prefix)
+    if timestamps is None:
+        timestamps = np.full(offsets.size, np.nan)
+    elif len(timestamps) < offsets.size:
+        raise ValueError(f"[decode_frames]-[ERR]: {len(timestamps)} TIMESTAMPS FOR {offsets.size} FRAMES...")
+    else:
+        timestamps = np.asarray(timestamps, dtype=np.float64)[:offsets.size]
+    
+    if (prefix == 0) and (0 < offsets.size * _PORT_VALUE_LAYOUT.itemsize == data.size) and (data[0] == 8) and \
+            (data[2::_PORT_VALUE_LAYOUT.itemsize] == _PORT_VALUE_TYPE).all():
+        # a pure recording of 4 byte port values maps onto the buffer directly
+        frames: np.ndarray = np.frombuffer(buffer, dtype=_PORT_VALUE_LAYOUT)
+        rows: np.ndarray = np.empty(frames.size, dtype=UPSTREAM_FRAME_DTYPE)
+        rows['type'] = frames['type']
+        rows['port'] = frames['port']
+        rows['value'] = frames['value']
+        rows['timestamp'] = timestamps
+        return rows, []
+    
+    start: np.ndarray = offsets + prefix
+    lengths: np.ndarray = data[start]
+    types: np.ndarray = data[start + 2]
+    is_value: np.ndarray = types == _PORT_VALUE_TYPE
+    value32: np.ndarray = is_value & (lengths == 8)
+    value16: np.ndarray = is_value & (lengths == 6)
+    value8: np.ndarray = is_value & (lengths == 5)
+    feedback: np.ndarray = (types == _PORT_CMD_FEEDBACK_TYPE) & (lengths == 5)
+    
+    values: np.ndarray = np.zeros(offsets.size, dtype=np.int32)
+    values[value32] = data[start[value32, None] + np.arange(4, 8)].view('<i4')[:, 0]
+    values[value16] = data[start[value16, None] + np.arange(4, 6)].view('<i2')[:, 0]
+    values[value8] = data[start[value8] + 4].view(np.int8)
+    values[feedback] = data[start[feedback] + 4]
+    
+    decoded: np.ndarray = value32 | value16 | value8 | feedback
+    rows: np.ndarray = np.empty(int(decoded.sum()), dtype=UPSTREAM_FRAME_DTYPE)
+    rows['type'] = types[decoded]
+    rows['port'] = data[start[decoded] + 3]
+    rows['value'] = values[decoded]
+    rows['timestamp'] = timestamps[decoded]
+    
+    other: List[Tuple[float, bytes]] = [
+            (float(timestamps[i]), bytes(data[start[i]:start[i] + lengths[i]]))
+            for i in np.flatnonzero(~decoded)
+            ]
+    return rows, other
+
+
 def _key_name(cls, value: bytearray):
     return legoBTLE.legoWP.types.key_name(cls, value)
 
 
+_DEG_TO_RAD: float = math.pi / 180
+_PORT_VALUE_FORMATS = {1: struct.Struct('<b'), 2: struct.Struct('<h'), 4: struct.Struct('<i')}
+
+
+def decode_port_value(frame: bytearray) -> float:
+    """Decodes the value of a raw PORT_VALUE frame without building a :class:`PORT_VALUE`.
+    
+    Parameters
+    ----------
+    frame : bytearray
+        The raw PORT_VALUE message starting with the length byte.
+
+    Returns
+    -------
+    float
+        The signed little-endian value following the port byte.
+        
+    """
+    unpacker = _PORT_VALUE_FORMATS.get(len(frame) - 4)
+    if unpacker is None:
+        return float(int.from_bytes(frame[4:], 'little', signed=True))
+    return float(unpacker.unpack_from(frame, 4)[0])
+
+
 @dataclass
 class UPSTREAM_MESSAGE:
     """UPSTREAM_MESSAGE
 
     Absolute base class for all message of type :class:`UPSTREAM_MESSAGE`.
+    
+    The base class declares no instance attributes, so that subclasses can be slotted.
 
     """
+    __slots__ = ()
 
-    def __init__(self):
-        self.m_header = None
 
-    pass
+class _LAZY_UPSTREAM_MESSAGE(UPSTREAM_MESSAGE):
+    """Base class for slotted upstream messages that decode their frame on first access.
+    
+    The frame is kept as received, nothing is copied or decoded when the message is created.
+    
+    """
+    __slots__ = ('COMMAND', '_header')
 
+    def __init__(self, COMMAND: bytearray):
+        self.COMMAND = COMMAND
+        self._header = None
+        return
 
+    @property
+    def m_header(self) -> COMMON_MESSAGE_HEADER:
+        if self._header is None:
+            self._header = COMMON_MESSAGE_HEADER(data=self.COMMAND[:3])
+        return self._header
+
+    @property
+    def m_port(self) -> bytes:
+        return self.COMMAND[3:4]
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is self.__class__:
+            return self.COMMAND == other.COMMAND
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(COMMAND={self.COMMAND!r})"
+
+    def __len__(self):
+        return self.COMMAND[0]
+
+
+@register_decoder(MESSAGE_TYPE.UPS_DNS_HUB_ACTION)
 @dataclass
 class HUB_ACTION_NOTIFICATION(UPSTREAM_MESSAGE):
     COMMAND: bytearray = field(init=True)
@@ -171,6 +351,7 @@ class HUB_ACTION_NOTIFICATION(UPSTREAM_MESSAGE):
         self.m_return_str: str = _key_name(HUB_ACTION, self.m_return)
 
 
+@register_decoder(MESSAGE_TYPE.UPS_HUB_ATTACHED_IO)
 @dataclass
 class HUB_ATTACHED_IO_NOTIFICATION(UPSTREAM_MESSAGE):
     COMMAND: bytearray = field(init=True)
@@ -220,6 +401,14 @@ class EXT_SERVER_CMD_ACK(EXT_SERVER_NOTIFICATION):
     # a: EXT_SERVER_CMD_ACK = EXT_SERVER_CMD_ACK(b'\x06\x00\x5c\x03\x01\x03')
 
 
+@register_decoder(MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD)
+def _ext_server_message(data: bytearray) -> EXT_SERVER_NOTIFICATION:
+    if data[-1] == PERIPHERAL_EVENT.EXT_SRV_RECV:
+        return EXT_SERVER_CMD_ACK(data)
+    return EXT_SERVER_NOTIFICATION(data)
+
+
+@register_decoder(MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR)
 @dataclass
 class DEV_GENERIC_ERROR_NOTIFICATION(UPSTREAM_MESSAGE):
     COMMAND: bytearray = field(init=True)
@@ -235,81 +424,94 @@ class DEV_GENERIC_ERROR_NOTIFICATION(UPSTREAM_MESSAGE):
         return len(self.COMMAND)
 
 
-@dataclass
-class PORT_CMD_FEEDBACK(UPSTREAM_MESSAGE):
+@register_decoder(MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK)
+class PORT_CMD_FEEDBACK(_LAZY_UPSTREAM_MESSAGE):
     """The feedback message for the current running command.
     
-    This dataclass disassembles the byte string sent from the hub brick as command feedback for the status
+    This class disassembles the byte string sent from the hub brick as command feedback for the status
     of the currently processed command.
     
     .. seealso::
         `LEGO: Port Output Command Feedback <https://lego.github.io/lego-ble-wireless-protocol-docs/index.html#port-output-command-feedback>`_.
     
     """
-    COMMAND: bytearray = field(init=True)
+    __slots__ = ('_cmd_status', )
 
-    def __post_init__(self):
-        self.m_cmd_status = defaultdict()
-        self.m_port = defaultdict()
-        fb_code = CMD_FEEDBACK()
-
-        self.m_header: COMMON_MESSAGE_HEADER = COMMON_MESSAGE_HEADER(data=self.COMMAND[:3])
-        self.m_port: bytes = self.COMMAND[3:4]
-        fb_code.asbyte = self.COMMAND[4]
-        self.m_cmd_status[self.COMMAND[3]] = fb_code.MSG
-        if self.COMMAND[0] >= 0x07:
-            self.m_port_a = self.COMMAND[5]
-            fb_code.asbyte = self.COMMAND[6]
-            self.m_cmd_status[self.COMMAND[5]] = fb_code.MSG
-        if self.COMMAND[0] >= 0x09:
-            self.m_port_b = self.COMMAND[7]
-            fb_code.asbyte = self.COMMAND[8]
-            self.m_cmd_status[self.COMMAND[7]] = fb_code.MSG
+    def __init__(self, COMMAND: bytearray):
+        self.COMMAND = COMMAND
+        self._header = None
+        self._cmd_status = None
         return
 
-    # a:PORT_CMD_FEEDBACK = PORT_CMD_FEEDBACK(b'\x05\x00\x82\x10\x0a')
-    # a:PORT_CMD_FEEDBACK = PORT_CMD_FEEDBACK(b'\x09\x00\x82\x10\x0a\x03\x08\x02\x04')
+    @property
+    def m_cmd_status(self) -> defaultdict:
+        if self._cmd_status is None:
+            self._cmd_status = defaultdict()
+            self._cmd_status[self.COMMAND[3]] = CMD_FEEDBACK_TABLE[self.COMMAND[4]]
+            if self.COMMAND[0] >= 0x07:
+                self._cmd_status[self.COMMAND[5]] = CMD_FEEDBACK_TABLE[self.COMMAND[6]]
+            if self.COMMAND[0] >= 0x09:
+                self._cmd_status[self.COMMAND[7]] = CMD_FEEDBACK_TABLE[self.COMMAND[8]]
+        return self._cmd_status
 
-    def __str__(self) -> str:
+    @property
+    def m_port_a(self) -> int:
+        if self.COMMAND[0] < 0x07:
+            raise AttributeError('m_port_a')
+        return self.COMMAND[5]
 
-        def get_status_str(msg) -> str:
-            if msg is None:
-                return 'None'
-            m_cmd_feedback = CMD_FEEDBACK()
-            m_cmd_feedback.asbyte = msg
-            return str((m_cmd_feedback.MSG.IDLE and 'IDLE')
-                       or (m_cmd_feedback.MSG.CURRENT_CMD_DISCARDED and 'CURRENT_CMD_DISCARDED ')
-                       or (m_cmd_feedback.MSG.EMPTY_BUF_CMD_COMPLETED and 'EMPTY_BUF_CMD_COMPLETED')
-                       or (m_cmd_feedback.MSG.EMPTY_BUF_CMD_IN_PROGRESS and 'EMPTY_BUF_CMD_IN_PROGRESS')
-                       or (m_cmd_feedback.MSG.BUSY and 'BUSY'))
+    @property
+    def m_port_b(self) -> int:
+        if self.COMMAND[0] < 0x09:
+            raise AttributeError('m_port_b')
+        return self.COMMAND[7]
 
-        return ','.join([get_status_str(self.COMMAND[4]), get_status_str(self.COMMAND[6]),
-                         get_status_str(self.COMMAND[8])]).strip()
+    # a:PORT_CMD_FEEDBACK = PORT_CMD_FEEDBACK(b'\x05\x00\x82\x10\x0a')
+    # a:PORT_CMD_FEEDBACK = PORT_CMD_FEEDBACK(b'\x09\x00\x82\x10\x0a\x03\x08\x02\x04')
 
-    def __len__(self):
-        return self.COMMAND[0]
+    def __str__(self) -> str:
+        return ','.join(CMD_FEEDBACK_STR[self.COMMAND[i]] for i in range(4, len(self.COMMAND), 2)).strip()
 
 
-@dataclass
-class PORT_VALUE(UPSTREAM_MESSAGE):
+@register_decoder(MESSAGE_TYPE.UPS_PORT_VALUE)
+class PORT_VALUE(_LAZY_UPSTREAM_MESSAGE):
     """The last reported value of the device.
     
+    The value is decoded from the frame on first access, DEG, RAD and direction are derived from it on demand.
+    
     Methods
     -------
     get_port_value_EFF
         Returns the port value weighted against the gear ratio.
         
     """
+    __slots__ = ('_value', )
 
-    COMMAND: bytearray = field(init=True)
+    def __init__(self, COMMAND: bytearray):
+        self.COMMAND = COMMAND
+        self._header = None
+        self._value = None
+        return
 
-    def __post_init__(self):
-        self.m_header: COMMON_MESSAGE_HEADER = COMMON_MESSAGE_HEADER(data=self.COMMAND[:3])
-        self.m_port: bytes = self.COMMAND[3:4]
-        self.m_port_value: float = float(int.from_bytes(self.COMMAND[4:], 'little', signed=True))
-        self.m_port_value_DEG: float = self.m_port_value
-        self.m_port_value_RAD: float = math.pi / 180 * self.m_port_value
-        self.m_direction = np.sign(self.m_port_value)
+    @property
+    def m_port_value(self) -> float:
+        value = self._value
+        if value is None:
+            value = self._value = decode_port_value(self.COMMAND)
+        return value
+
+    @property
+    def m_port_value_DEG(self) -> float:
+        return self.m_port_value
+
+    @property
+    def m_port_value_RAD(self) -> float:
+        return _DEG_TO_RAD * self.m_port_value
+
+    @property
+    def m_direction(self) -> float:
+        value = self.m_port_value
+        return float((value > 0) - (value < 0))
 
     def get_port_value_EFF(self, gearRatio: float = 1.0) -> defaultdict:
         """Returns the port value adjusted by the installed gear train (currently a single set is supported).
@@ -332,14 +534,12 @@ class PORT_VALUE(UPSTREAM_MESSAGE):
         r['rad'] = self.m_port_value_RAD / gearRatio
         return r
 
-    def __len__(self):
-        return self.COMMAND[0]
-
     # a: PORT_VALUE= PORT_VALUE(b'\x08\x00\x45\x00\xf7\xee\xff\xff')
     # a: PORT_VALUE= PORT_VALUE(b'\x08\x00\x45\x00\xff\xff\xff\xff')
     # a: PORT_VALUE= PORT_VALUE(b'\x08\00\x45\x00\xd5\x02\x00\x00')
 
 
+@register_decoder(MESSAGE_TYPE.UPS_PORT_NOTIFICATION)
 @dataclass
 class DEV_PORT_NOTIFICATION(UPSTREAM_MESSAGE):
     COMMAND: bytearray = field(init=True)
@@ -358,6 +558,7 @@ class DEV_PORT_NOTIFICATION(UPSTREAM_MESSAGE):
     # a: DEV_PORT_NOTIFICATION = a: DEV_PORT_NOTIFICATION(b'\x0a\x00\x47\x00\x02\x01\x00\x00\x00\x01')
 
 
+@register_decoder(MESSAGE_TYPE.UPS_DNS_HUB_ALERT)
 @dataclass
 class HUB_ALERT_NOTIFICATION(UPSTREAM_MESSAGE):
     """Models the Alert Notifcation sent by the HUB.
@@ -24,17 +24,29 @@
 # UPS == UPSTREAM === FROM DEVICE
 # DNS == DOWNSTREAM === TO DEVICE
 import ctypes
+from collections import namedtuple
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
+from typing import Dict
+from typing import Tuple
 
 import numpy as np
 
 
+_KEY_NAMES: Dict[type, Dict[bytes, str]] = {}
+
+
+def _reverse_index(cls) -> Dict[bytes, str]:
+    return {v.default[0:1]: k for k, v in cls.__dataclass_fields__.items()}
+
+
 def key_name(cls, value: bytearray):
     """key_name
     
     internel helper function.
     
+    The reverse indexes value -> field name are built once, for the classes in this module at import time.
+    
     Parameters
     ----------
     cls :
@@ -44,7 +56,10 @@ def key_name(cls, value: bytearray):
     -------
 
     """
-    rev = {v.default[0:1]: k for k, v in cls.__new__(cls).__dataclass_fields__.items()}
+    try:
+        rev = _KEY_NAMES[cls]
+    except KeyError:
+        rev = _KEY_NAMES[cls] = _reverse_index(cls)
     return rev.get(bytes(value), 'NIL')
 
 
@@ -198,6 +213,31 @@ class CMD_FEEDBACK(ctypes.Union):
                 ("asbyte", c_uint8)]
 
 
+CMD_FEEDBACK_STATUS = namedtuple('CMD_FEEDBACK_STATUS',
+                                 [name for name, _, _ in CMD_FEEDBACK_MSG._fields_])
+
+
+def _cmd_feedback_status(code: int) -> CMD_FEEDBACK_STATUS:
+    fb_code = CMD_FEEDBACK()
+    fb_code.asbyte = code
+    return CMD_FEEDBACK_STATUS(*(getattr(fb_code.MSG, name) for name in CMD_FEEDBACK_STATUS._fields))
+
+
+def _cmd_feedback_str(status: CMD_FEEDBACK_STATUS) -> str:
+    return str((status.IDLE and 'IDLE')
+               or (status.CURRENT_CMD_DISCARDED and 'CURRENT_CMD_DISCARDED ')
+               or (status.EMPTY_BUF_CMD_COMPLETED and 'EMPTY_BUF_CMD_COMPLETED')
+               or (status.EMPTY_BUF_CMD_IN_PROGRESS and 'EMPTY_BUF_CMD_IN_PROGRESS')
+               or (status.BUSY and 'BUSY'))
+
+
+CMD_FEEDBACK_TABLE: Tuple[CMD_FEEDBACK_STATUS, ...] = tuple(_cmd_feedback_status(code) for code in range(256))
+"""The decoded flags of every possible feedback byte, i.e., ``CMD_FEEDBACK_TABLE[0x0a].IDLE == 1``."""
+
+CMD_FEEDBACK_STR: Tuple[str, ...] = tuple(_cmd_feedback_str(status) for status in CMD_FEEDBACK_TABLE)
+"""The most significant flag of every possible feedback byte as text, e.g., ``'IDLE'``."""
+
+
 @dataclass(frozen=True)
 class CMD_RETURN_CODE:
     RFR: bytes = field(init=False, default=b'\x00')
@@ -624,3 +664,8 @@ class MESSAGE_STATUS(IntEnum):
     INFO = 1
     WARNING = 2
     FAILED = 3
+
+
+for _cls in (DEVICE_TYPE, MESSAGE_TYPE, HUB_ALERT_TYPE, HUB_ALERT_OP, ALERT_STATUS, HUB_ACTION, PERIPHERAL_EVENT,
+             SUB_COMMAND, SERVER_SUB_COMMAND, CMD_RETURN_CODE, COMMAND_STATUS, CONNECTION):
+    _KEY_NAMES[_cls] = _reverse_index(_cls)
@@ -0,0 +1,304 @@
+# coding=utf-8
+"""
+    legoBTLE.networking.framing
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module contains the protocols that cut the byte stream between server and devices into messages.
+
+    :class:`ClientFrameProtocol` buffers what arrives at a device, splits all complete messages out of every
+    received chunk and hands them to the device's listener as one batch, so a burst of notifications costs one
+    wake-up of the listener instead of two reads per message.
+
+    Two frame formats are in use, a connection starts with :data:`FRAMING_V1`:
+
+    ``FRAMING_V1``
+        Server to device: ``[length, message]``, the message's own length byte is repeated in front of it.
+        Device to server: ``[handle, length, message]``.
+
+    ``FRAMING_V2``
+        ``[size, flags, body, trailer]`` in both directions, `size` counts all bytes after itself. The body is the
+        message, from device to server preceded by the handle. The trailer holds the optional fields announced in
+        `flags`: a sequence number (:data:`FRAME_SEQUENCE`, ``uint16``) followed by a timestamp
+        (:data:`FRAME_TIMESTAMP`, ``float64`` seconds since the epoch), both little-endian.
+
+    A device asks for :data:`FRAMING_V2` by appending the version and the flags it wants on the server's frames to
+    its ``EXT_SRV_CONNECT_REQ``. A server that understands the request echoes the granted version and flags behind
+    the event of its acknowledgement, which is still sent as :data:`FRAMING_V1`; all later frames of the connection
+    use the granted version. Servers that answer without them keep the connection at :data:`FRAMING_V1`.
+
+    Example
+    -------
+    Opening a framed connection to the server::
+
+        protocol, writer = await open_framed_connection(host='127.0.0.1', port=8888)
+        for frame in await protocol.read_frames():
+            ...
+
+    :copyright: Copyright 2020-2021 by Dietrich Christopeit, see AUTHORS.rst.
+    :license: MIT, see LICENSE.rst for details
+"""
+
+import asyncio
+import struct
+from asyncio import Future
+from asyncio import StreamWriter
+from asyncio.streams import FlowControlMixin
+from collections import deque
+from typing import Deque
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from legoBTLE.networking.transport import open_connection
+
+FRAMING_V1: int = 1
+"""The original frame format, the length byte is sent twice."""
+FRAMING_V2: int = 2
+"""Length-prefixed frames with flags, sent in one write."""
+FRAMING_VERSION: int = FRAMING_V2
+"""The highest frame format this module understands."""
+
+FRAME_SEQUENCE: int = 0x01
+"""Flag: the frame carries a sequence number."""
+FRAME_TIMESTAMP: int = 0x02
+"""Flag: the frame carries a timestamp."""
+FRAME_FLAGS: int = FRAME_SEQUENCE | FRAME_TIMESTAMP
+"""All flags this module understands."""
+
+_SEQUENCE: struct.Struct = struct.Struct('<H')
+_TIMESTAMP: struct.Struct = struct.Struct('<d')
+_EXT_SERVER_CMD: int = 0x5c
+_EXT_SRV_CONNECTED: int = 0x03
+
+
+def trailer_size(flags: int) -> int:
+    """The number of trailer bytes of a :data:`FRAMING_V2` frame with `flags`."""
+    return (_SEQUENCE.size if flags & FRAME_SEQUENCE else 0) + (_TIMESTAMP.size if flags & FRAME_TIMESTAMP else 0)
+
+
+def encode_frame(body: Union[bytes, bytearray, memoryview], flags: int = 0, sequence: int = 0,
+                 timestamp: float = 0.0) -> bytes:
+    """Frames `body` in :data:`FRAMING_V2`.
+
+    Parameters
+    ----------
+    body : bytes
+        The message, from device to server preceded by the handle.
+    flags : int
+        The optional fields to append, :data:`FRAME_SEQUENCE` and/or :data:`FRAME_TIMESTAMP`.
+    sequence : int
+        The sequence number, taken modulo 2**16.
+    timestamp : float
+        The timestamp.
+
+    Returns
+    -------
+    bytes
+        The frame, ready for one write.
+
+    Examples
+    --------
+    >>> encode_frame(b'\\x05\\x00\\x5c\\x00\\x03').hex()
+    '060005005c0003'
+    >>> encode_frame(b'\\x05\\x00\\x5c\\x00\\x03', flags=FRAME_SEQUENCE, sequence=258).hex()
+    '080105005c00030201'
+
+    """
+    if not flags:
+        return bytes((1 + len(body), 0)) + body
+    trailer = b''
+    if flags & FRAME_SEQUENCE:
+        trailer += _SEQUENCE.pack(sequence & 0xffff)
+    if flags & FRAME_TIMESTAMP:
+        trailer += _TIMESTAMP.pack(timestamp)
+    return bytes((1 + len(body) + len(trailer), flags)) + body + trailer
+
+
+class ClientFrameProtocol(FlowControlMixin, asyncio.Protocol):
+    """Splits the length-prefixed messages the server sends to a device.
+
+    The protocol takes the place of the :class:`asyncio.StreamReader` in a device's connection. Complete messages
+    are collected in the order of arrival, without the framing. The frame format switches to the version the
+    server grants in its acknowledgement of ``EXT_SRV_CONNECT_REQ``, see :mod:`legoBTLE.networking.framing`.
+
+    Of the optional frame fields, the latest sequence number and timestamp are kept in :attr:`last_sequence`
+    and :attr:`last_timestamp`. Gaps in the sequence, e.g., port values the server conflated or dropped for a
+    slow device, are counted in :attr:`missed`.
+
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop = None):
+        super().__init__(loop=loop)
+        self._buffer: bytearray = bytearray()
+        self._frames: Deque[bytearray] = deque()
+        self._waiter: Optional[Future] = None
+        self._exception: Optional[BaseException] = None
+        self._transport: Optional[asyncio.Transport] = None
+        self._closed: Future = self._loop.create_future()
+        self._framing: int = FRAMING_V1
+        self._flags: int = 0
+        self.last_sequence: Optional[int] = None
+        self.last_timestamp: Optional[float] = None
+        self.missed: int = 0
+        return
+
+    @property
+    def framing(self) -> int:
+        """The frame format of the connection."""
+        return self._framing
+
+    @property
+    def flags(self) -> int:
+        """The optional fields the server was asked for and granted."""
+        return self._flags
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self._transport = transport
+        return
+
+    def data_received(self, data: bytes) -> None:
+        buffer = self._buffer
+        buffer += data
+        end = len(buffer)
+        start = 0
+        frames = self._frames
+        while start < end:
+            if self._framing == FRAMING_V2:
+                stop = start + 1 + buffer[start]
+                if stop > end:
+                    break
+                flags = buffer[start + 1] if stop > start + 1 else 0
+                if flags:
+                    frames.append(buffer[start + 2:stop - self._trailer(buffer, stop, flags)])
+                else:
+                    frames.append(buffer[start + 2:stop])
+            else:
+                stop = start + 1 + buffer[start]
+                if stop > end:
+                    break
+                frame = buffer[start + 1:stop]
+                frames.append(frame)
+                if (len(frame) > 6) and (frame[2] == _EXT_SERVER_CMD) and (frame[4] == _EXT_SRV_CONNECTED):
+                    self._framing, self._flags = frame[5], frame[6]
+            start = stop
+        if start:
+            del buffer[:start]
+            self._wakeup()
+        return
+
+    def _trailer(self, buffer: bytearray, stop: int, flags: int) -> int:
+        size = 0
+        if flags & FRAME_TIMESTAMP:
+            size += _TIMESTAMP.size
+            self.last_timestamp = _TIMESTAMP.unpack_from(buffer, stop - size)[0]
+        if flags & FRAME_SEQUENCE:
+            size += _SEQUENCE.size
+            sequence = _SEQUENCE.unpack_from(buffer, stop - size)[0]
+            if self.last_sequence is not None:
+                self.missed += (sequence - self.last_sequence - 1) & 0xffff
+            self.last_sequence = sequence
+        return size
+
+    def eof_received(self) -> bool:
+        self._exception = asyncio.IncompleteReadError(bytes(self._buffer), None)
+        self._wakeup()
+        return False
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        super().connection_lost(exc)
+        if self._exception is None:
+            self._exception = exc if exc is not None else asyncio.IncompleteReadError(bytes(self._buffer), None)
+        self._wakeup()
+        if not self._closed.done():
+            self._closed.set_result(None)
+        return
+
+    def _get_close_waiter(self, stream: StreamWriter) -> Future:
+        return self._closed
+
+    def _wakeup(self) -> None:
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
+        return
+
+    async def _wait(self) -> None:
+        if self._exception is not None:
+            raise self._exception
+        if self._waiter is not None:
+            raise RuntimeError('read_frame() called while another coroutine is already waiting for incoming data')
+        self._waiter = self._loop.create_future()
+        try:
+            await self._waiter
+        finally:
+            self._waiter = None
+        return
+
+    async def read_frames(self) -> List[bytearray]:
+        """Returns all messages received so far, waits if there are none.
+
+        This method is a coroutine.
+
+        Returns
+        -------
+        list[bytearray]
+            The messages in the order of arrival.
+
+        Raises
+        ------
+        ConnectionError, IncompleteReadError
+            If the connection was lost and no messages are left.
+
+        """
+        while not self._frames:
+            await self._wait()
+        frames = list(self._frames)
+        self._frames.clear()
+        return frames
+
+    async def read_frame(self) -> bytearray:
+        """Returns the next message, waits if there is none.
+
+        This method is a coroutine.
+
+        Returns
+        -------
+        bytearray
+            The oldest message not yet read.
+
+        Raises
+        ------
+        ConnectionError, IncompleteReadError
+            If the connection was lost and no messages are left.
+
+        """
+        while not self._frames:
+            await self._wait()
+        return self._frames.popleft()
+
+
+async def open_framed_connection(host: str, port: int) -> Tuple[ClientFrameProtocol, StreamWriter]:
+    """Opens a connection to the server with a :class:`ClientFrameProtocol` for the reading side.
+
+    This method is a coroutine.
+
+    Parameters
+    ----------
+    host : str
+        The IP Address of the Server, optionally prefixed with the transport, see
+        :func:`legoBTLE.networking.transport.parse_address`.
+    port : int
+        The port to connect to on the Server.
+
+    Returns
+    -------
+    tuple[ClientFrameProtocol, StreamWriter]
+        The protocol delivering the messages and the writer for sending commands.
+
+    """
+    loop = asyncio.get_running_loop()
+    transport, protocol = await open_connection((host, port), lambda: ClientFrameProtocol(loop=loop))
+    return protocol, StreamWriter(transport, protocol, None, loop)
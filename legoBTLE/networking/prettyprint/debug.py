@@ -4,17 +4,32 @@
     ~~~~~~~~~~~~~~~~~~~~~~~
     
     This module is an attempt to make the possible output of all the data flowing to and fro more readable.
+    
+    The messages are rendered lazily: a call site passes a :meth:`str.format` template and the objects it refers
+    to, e.g.::
+    
+        debug_info("[{0.name}:{0.port[0]}]-[MSG]: SENDING {1.COMMAND!h}", self, command, debug=self._debug)
+    
+    and the template is only formatted, attributes and items are only looked up, if `debug` is ``True``. The
+    conversion ``!h`` renders :class:`bytes` as hex. Running Python with ``-O`` compiles the output out
+    altogether, the functions then return right away.
+    
+    The output goes through :func:`legoBTLE.networking.prettyprint.tracelog.emit`, i.e., to the writer thread of
+    an installed :class:`legoBTLE.networking.prettyprint.tracelog.FrameLog`.
 
     :copyright: Copyright 2020-2021 by Dietrich Christopeit, see AUTHORS.rst.
     :license: MIT, see LICENSE.rst for details
 """
 
+from string import Formatter
+
 from colorama import Fore
 from colorama import Style
 from colorama import init
 
 from legoBTLE.legoWP.types import C
 from legoBTLE.legoWP.types import MESSAGE_STATUS
+from legoBTLE.networking.prettyprint.tracelog import emit
 
 init(autoreset=True)
 
@@ -23,22 +38,42 @@ H2 = f'{Style.BRIGHT}{Fore.GREEN}'
 UL = f'\033[4m'
 
 
-def debug_info_header(header: str, debug: bool):
-    header_len = len(header)
-    if debug:
-        print(f"{Style.BRIGHT}{Fore.BLUE}{' ' * (64 + header_len)}")
-        print(f"{Style.BRIGHT}{Fore.BLUE}{3 * '*'}{29 * ' '} {header} {Style.RESET_ALL}{Style.BRIGHT}{Fore.BLUE}{29 * ' '}{3 * '*'}")
+class _TraceFormatter(Formatter):
+    
+    def convert_field(self, value, conversion):
+        if conversion == 'h':
+            return value.hex()
+        return super().convert_field(value, conversion)
+
+
+_FORMATTER: _TraceFormatter = _TraceFormatter()
+
+
+def _render(info: str, args: tuple) -> str:
+    if args:
+        info = _FORMATTER.vformat(info, args, {})
+    return info.replace('\t', 4 * ' ')
+
+
+def debug_info_header(header: str, *args, debug: bool = False):
+    if __debug__ and debug:
+        header = _render(header, args)
+        header_len = len(header)
+        emit(f"{Style.BRIGHT}{Fore.BLUE}{' ' * (64 + header_len)}")
+        emit(f"{Style.BRIGHT}{Fore.BLUE}{3 * '*'}{29 * ' '} {header} {Style.RESET_ALL}{Style.BRIGHT}{Fore.BLUE}{29 * ' '}{3 * '*'}")
     return
 
 
-def debug_info_footer(footer: str, debug: bool):
+def debug_info_footer(footer: str, *args, debug: bool = False):
     """:meth:`legoBTLE.debug.messages.debug_info_footer`
     Sets the footer of a debug info message when this message is not atomic.
     
     Parameters
     ----------
     footer : str
-        the footer text
+        the footer text, a :meth:`str.format` template if `args` are given
+    args :
+        the values for the template
     debug : bool
         True if text should be display, False otherwise.
         
@@ -46,32 +81,32 @@ def debug_info_footer(footer: str, debug: bool):
     -------
     
     """
-    _footer = footer.replace('\t', 4 * ' ')
-    if debug:
-        print(f"{C.BOLD}{C.OKBLUE}{C.UNDERLINE}{' ' * (64 + len(_footer))}")
-        print(
+    if __debug__ and debug:
+        _footer = _render(footer, args)
+        emit(f"{C.BOLD}{C.OKBLUE}{C.UNDERLINE}{' ' * (64 + len(_footer))}")
+        emit(
             f"{C.BOLD}{C.OKBLUE}{C.UNDERLINE}<< < END +.+.+.+.+ END << << << {C.UNDERLINE}{C.WARNING}{_footer}{C.OKBLUE} << < END +.+.+.+.+ END << << <<")
     return
 
 
-def debug_info_begin(info: str, debug: bool):
-    _info = info.replace('\t', 4 * ' ')
-    if debug:
-        print(f"{C.BOLD}{C.OKBLUE}**    ", _info, f"{C.BOLD} >> >> BEGIN")
+def debug_info_begin(info: str, *args, debug: bool = False):
+    if __debug__ and debug:
+        _info = _render(info, args)
+        emit(f"{C.BOLD}{C.OKBLUE}**    ", _info, f"{C.BOLD} >> >> BEGIN")
     return
 
 
-def debug_info(info: str, debug: bool):
-    _info = info.replace('\t', 4 * ' ')
-    if debug:
-        print(f"{C.BOLD}{C.OKBLUE}**        ", _info)
+def debug_info(info: str, *args, debug: bool = False):
+    if __debug__ and debug:
+        _info = _render(info, args)
+        emit(f"{C.BOLD}{C.OKBLUE}**        ", _info)
     return
 
 
-def debug_info_end(info: str, debug: bool):
-    _info = info.replace('\t', 4 * ' ')
-    if debug:
-        print(f"{C.BOLD}{C.OKBLUE}**    {C.OKBLUE}", _info, f"{C.BOLD} << << END")
+def debug_info_end(info: str, *args, debug: bool = False):
+    if __debug__ and debug:
+        _info = _render(info, args)
+        emit(f"{C.BOLD}{C.OKBLUE}**    {C.OKBLUE}", _info, f"{C.BOLD} << << END")
     return
 
 
@@ -86,5 +121,5 @@ def prg_out_msg(msg: str, m_type: MESSAGE_STATUS = MESSAGE_STATUS.INFO):
         _status = C.FAIL
     else:
         _status = C.OKBLUE
-    print(f"{C.BOLD}{_status}** PROGRAM MESSAGE:    {_status}", msg, f"{C.BOLD} +.+.+.+")
+    emit(f"{C.BOLD}{_status}** PROGRAM MESSAGE:    {_status}", msg, f"{C.BOLD} +.+.+.+")
     return
@@ -0,0 +1,278 @@
+# coding=utf-8
+"""
+    legoBTLE.networking.prettyprint.tracelog
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module contains :class:`FrameLog`, a log of the messages passing the server and the devices that never
+    blocks the code writing to it.
+
+    Messages are recorded as binary records, i.e., a sequence number, a timestamp, the kind of record, the hub_id,
+    the port and the raw message. Recording a message appends one tuple to an in-memory ring; a writer thread
+    takes the records out of the ring and writes them to a binary file and/or renders them as colored text to a
+    stream. If the writer cannot keep up, the oldest records are overwritten and counted in
+    :attr:`FrameLog.dropped`, so a flood of notifications costs the routing nothing but the appends.
+
+    Once a log is installed with :meth:`FrameLog.install`, the server, the devices and
+    :mod:`legoBTLE.networking.prettyprint.debug` send their messages to it as well as their text output
+    (see :func:`emit`), which otherwise is printed right away.
+
+    Example
+    -------
+    Recording to a file while the server runs::
+
+        log = FrameLog(path='trace.bin').install()
+        ...
+        log.stop()
+
+    and rendering the file later::
+
+        python -m legoBTLE.networking.prettyprint.tracelog trace.bin
+
+    :copyright: Copyright 2020-2021 by Dietrich Christopeit, see AUTHORS.rst.
+    :license: MIT, see LICENSE.rst for details
+"""
+
+import itertools
+import re
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import BinaryIO
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
+
+from legoBTLE.legoWP.types import C
+from legoBTLE.legoWP.types import MESSAGE_TYPE
+
+UPSTREAM: int = 0
+"""A notification the server received from a hub."""
+DOWNSTREAM: int = 1
+"""A message the server received from a device."""
+DEVICE_SEND: int = 2
+"""A message a device sent to the server."""
+DEVICE_RECEIVE: int = 3
+"""A message a device received from the server."""
+TEXT: int = 4
+"""A line of text output, see :func:`emit`."""
+
+_KINDS: Dict[int, Tuple[str, str]] = {
+        UPSTREAM:       ('HUB    >> SERVER', C.OKGREEN),
+        DOWNSTREAM:     ('DEVICE >> SERVER', C.OKBLUE),
+        DEVICE_SEND:    ('DEVICE >>       ', C.OKBLUE),
+        DEVICE_RECEIVE: ('DEVICE <<       ', C.OKGREEN),
+        TEXT:           ('                ', C.ENDC),
+        }
+
+_MESSAGE_TYPES: Dict[int, str] = {}
+for _name, _value in vars(MESSAGE_TYPE).items():
+    if isinstance(_value, bytes):
+        _MESSAGE_TYPES.setdefault(_value[0], _name)
+
+_RECORD: struct.Struct = struct.Struct('<IdBBBH')
+_ANSI: re.Pattern = re.compile(r'\x1b\[[0-9;]*m')
+
+Record = Tuple[int, float, int, int, int, bytes]
+"""``(sequence, timestamp, kind, hub_id, port, data)``, `data` is text for :data:`TEXT` records in the ring."""
+
+TRACE: Optional['FrameLog'] = None
+"""The installed log, ``None`` if output is printed right away."""
+
+
+def emit(*values, end: str = '\n') -> None:
+    """Prints `values` like :func:`print`, or hands them to the installed :class:`FrameLog` as one line of text.
+
+    """
+    log = TRACE
+    if log is None:
+        print(*values, end=end)
+    else:
+        log.text(' '.join(str(value) for value in values))
+    return
+
+
+def render(record: Record, color: bool = True) -> str:
+    """Renders a record as one line of text.
+
+    Parameters
+    ----------
+    record : Record
+        The record.
+    color : bool
+        If ``False``, without ANSI color codes.
+
+    Returns
+    -------
+    str
+        The line, without line break.
+
+    """
+    sequence, timestamp, kind, hub_id, port, data = record
+    stamp = datetime.fromtimestamp(timestamp).strftime('%H:%M:%S.%f')
+    label, code = _KINDS.get(kind, (f'KIND {kind}', C.ENDC))
+    if kind == TEXT:
+        line = data if isinstance(data, str) else data.decode('utf-8', 'replace')
+        line = f"{stamp} {line}"
+    else:
+        m_type = _MESSAGE_TYPES.get(data[2], hex(data[2])) if len(data) > 2 else ''
+        line = (f"{stamp} {code}[{label}]{C.ENDC} HUB [{hub_id}] PORT [{port}] {C.BOLD}{m_type}{C.ENDC} "
+                f"{data.hex()}")
+    if not color:
+        line = _ANSI.sub('', line)
+    return line
+
+
+def read_records(stream: BinaryIO) -> Iterator[Record]:
+    """Reads the records of a binary log written by :class:`FrameLog`.
+
+    """
+    while True:
+        header = stream.read(_RECORD.size)
+        if len(header) < _RECORD.size:
+            return
+        sequence, timestamp, kind, hub_id, port, size = _RECORD.unpack(header)
+        yield sequence, timestamp, kind, hub_id, port, stream.read(size)
+
+
+class FrameLog:
+    """A ring of message records, emptied by a writer thread.
+
+    :meth:`frame` and :meth:`text` can be called from any thread, they neither take a lock nor wait: the ring is a
+    :class:`collections.deque` with a maximum length, whose appends and pops are atomic.
+
+    """
+
+    def __init__(self, path: Optional[str] = None, stream: Optional[TextIO] = None, capacity: int = 8192,
+                 interval: float = .05, color: bool = True):
+        """
+
+        Parameters
+        ----------
+        path : str, optional
+            The file to append the binary records to.
+        stream : TextIO, optional
+            The stream to write the rendered records to, e.g., ``sys.stdout``.
+        capacity : int
+            The number of records the ring holds before the oldest ones are overwritten.
+        interval : float
+            Seconds between two runs of the writer.
+        color : bool
+            If ``False``, `stream` gets the records without ANSI color codes.
+        """
+        self._path: Optional[str] = path
+        self._stream: Optional[TextIO] = stream
+        self._interval: float = interval
+        self._color: bool = color
+        self._ring: Deque[Record] = deque(maxlen=capacity)
+        self._sequence: Iterator[int] = itertools.count()
+        self._last_sequence: int = -1
+        self._file: Optional[BinaryIO] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped: threading.Event = threading.Event()
+        self.dropped: int = 0
+        self.written: int = 0
+        return
+
+    def frame(self, kind: int, hub_id: int, port: int, data) -> None:
+        """Records a message.
+
+        Parameters
+        ----------
+        kind : int
+            Where the message was seen, :data:`UPSTREAM`, :data:`DOWNSTREAM`, :data:`DEVICE_SEND` or
+            :data:`DEVICE_RECEIVE`.
+        hub_id : int
+            The hub_id of the message.
+        port : int
+            The port of the message.
+        data : bytes or bytearray or memoryview
+            The message, starting with its length byte. Buffers other than :class:`bytes` are copied.
+
+        """
+        self._ring.append((next(self._sequence), time.time(), kind, hub_id, port, bytes(data)))
+        return
+
+    def text(self, line: str) -> None:
+        """Records a line of text output."""
+        self._ring.append((next(self._sequence), time.time(), TEXT, 0, 0, line))
+        return
+
+    def start(self) -> 'FrameLog':
+        """Starts the writer thread."""
+        if self._thread is None:
+            if self._path is not None:
+                self._file = open(self._path, 'ab')
+            self._thread = threading.Thread(target=self._run, name='FrameLogWriter', daemon=True)
+            self._thread.start()
+        return self
+
+    def install(self) -> 'FrameLog':
+        """Starts the writer and makes this log the one the server, the devices and :func:`emit` write to."""
+        global TRACE
+        TRACE = self.start()
+        return self
+
+    def stop(self) -> None:
+        """Writes the records left and stops the writer, the log is uninstalled if installed."""
+        global TRACE
+        if TRACE is self:
+            TRACE = None
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self._write()
+        self._write()
+        return
+
+    def _write(self) -> None:
+        ring = self._ring
+        records = []
+        try:
+            while True:
+                records.append(ring.popleft())
+        except IndexError:
+            pass
+        if not records:
+            return
+        for record in records:
+            gap = record[0] - self._last_sequence - 1
+            if gap >= 0:
+                self.dropped += gap
+                self._last_sequence = record[0]
+            else:
+                # taken from the counter before a record that was appended first
+                self.dropped -= 1
+        if self._file is not None:
+            chunks = []
+            for sequence, timestamp, kind, hub_id, port, data in records:
+                if kind == TEXT:
+                    data = data.encode('utf-8')[:0xffff]
+                chunks.append(_RECORD.pack(sequence & 0xffffffff, timestamp, kind, hub_id, port, len(data)))
+                chunks.append(data)
+            self._file.write(b''.join(chunks))
+            self._file.flush()
+        if self._stream is not None:
+            self._stream.write(''.join(render(record, self._color) + '\n' for record in records))
+            self._stream.flush()
+        self.written += len(records)
+        return
+
+
+if __name__ == '__main__':
+    with open(sys.argv[1], 'rb') as trace:
+        for rec in read_records(trace):
+            print(render(rec, color=('--no-color' not in sys.argv)))
@@ -7,343 +7,1175 @@ and route message from and to the bluetooth sender/receiver.
 
 """
 import asyncio
-import os
-from asyncio import AbstractEventLoop, StreamReader, StreamWriter, IncompleteReadError
+import queue
+import threading
+import time
+from asyncio import AbstractEventLoop, StreamReader, StreamWriter
+from asyncio.streams import FlowControlMixin
 from collections import defaultdict
+from collections import deque
 from datetime import datetime
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
 
-from legoBTLE.exceptions.Exceptions import ServerClientRegisterError
-from legoBTLE.legoWP.message.upstream import EXT_SERVER_NOTIFICATION
-from legoBTLE.legoWP.message.upstream import UpStreamMessageBuilder
+from legoBTLE.legoWP.message.upstream import build_upstream_message
 from legoBTLE.legoWP.types import C
 from legoBTLE.legoWP.types import MESSAGE_TYPE
 from legoBTLE.legoWP.types import PERIPHERAL_EVENT
 from legoBTLE.legoWP.types import SERVER_SUB_COMMAND
+from legoBTLE.networking.framing import FRAME_FLAGS
+from legoBTLE.networking.framing import FRAME_SEQUENCE
+from legoBTLE.networking.framing import FRAME_TIMESTAMP
+from legoBTLE.networking.framing import FRAMING_V1
+from legoBTLE.networking.framing import FRAMING_V2
+from legoBTLE.networking.framing import FRAMING_VERSION
+from legoBTLE.networking.framing import encode_frame
+from legoBTLE.networking.framing import trailer_size
+from legoBTLE.networking.prettyprint import tracelog
+from legoBTLE.networking.prettyprint.tracelog import DOWNSTREAM
+from legoBTLE.networking.prettyprint.tracelog import UPSTREAM
+from legoBTLE.networking.prettyprint.tracelog import emit
+from legoBTLE.networking.simulation import SimulatedHub
+from legoBTLE.networking.transport import parse_address
+from legoBTLE.networking.transport import start_server
 
-if os.name == 'posix':
-    from bluepy import btle
-    from bluepy.btle import BTLEInternalError, Peripheral
+_BTLE_TRANSIENT_ERRORS: tuple = ()
+"""The errors of the bluetooth stack a :class:`BTLEWorker` ignores, set by :func:`connectBTLE` once bluepy is loaded."""
 
 global host
 global port
-if os.name == 'posix':
-    global Future_BTLEDevice
 
-connectedDevices: defaultdict = defaultdict()
+
+class ClientOutbox:
+    """Bounded outbound queue of a client, served by a single writer task.
+    
+    Notifications are queued by :meth:`put` and written to the client by one task that awaits
+    :meth:`StreamWriter.drain` after each frame. If the client falls behind, ``PORT_VALUE`` frames for a port
+    that still has a value waiting are conflated, i.e., the waiting value is replaced by the newest one while
+    keeping its place in the queue. A value is never moved ahead of a frame that was queued after it. Once `maxsize` frames are waiting, ``PORT_VALUE`` frames for further ports
+    are dropped. Command feedback and control frames are never conflated nor dropped.
+    
+    The frames are written in the frame format `framing` with the optional fields `flags` (see
+    :mod:`legoBTLE.networking.framing`). Sequence numbers are counted per queued notification, so conflated and
+    dropped values show up as gaps at the client.
+    
+    """
+    
+    def __init__(self, writer: StreamWriter, maxsize: int = 64, framing: int = FRAMING_V1, flags: int = 0):
+        self._writer: StreamWriter = writer
+        self._maxsize: int = maxsize
+        self._framing: int = framing
+        self._flags: int = flags
+        self._sequence: int = 0
+        self._frames: deque = deque()
+        self._port_values: Dict[int, list] = {}
+        self._ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed: bool = False
+        self.conflated: int = 0
+        self.dropped: int = 0
+        return
+    
+    def __len__(self) -> int:
+        return len(self._frames)
+    
+    @property
+    def writer(self) -> StreamWriter:
+        return self._writer
+    
+    def put(self, data: bytes) -> None:
+        """Queue a notification for the client.
+        
+        Parameters
+        ----------
+        data : bytes
+            The notification, starting with the length byte. Dropped once the outbox is closed.
+            
+        """
+        if self._closed:
+            self.dropped += 1
+            return
+        self._sequence += 1
+        timestamp: float = time.time() if self._flags & FRAME_TIMESTAMP else 0.0
+        if data[2] == MESSAGE_TYPE.UPS_PORT_VALUE[0]:
+            port: int = data[3]
+            cell: Optional[list] = self._port_values.get(port)
+            if cell is not None:
+                cell[0], cell[2], cell[3] = data, self._sequence, timestamp
+                self.conflated += 1
+                return
+            if len(self._frames) >= self._maxsize:
+                self.dropped += 1
+                return
+            cell = [data, port, self._sequence, timestamp]
+            self._port_values[port] = cell
+            self._frames.append(cell)
+        else:
+            # values queued before this frame must not overtake it
+            self._port_values.clear()
+            self._frames.append((data, None, self._sequence, timestamp))
+        if self._task is None:
+            self._ready = asyncio.Event()
+            self._task = asyncio.ensure_future(self._write_frames())
+        self._ready.set()
+        return
+    
+    def close(self) -> None:
+        """Stop the writer task; frames still waiting and frames put later are discarded.
+        
+        """
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._frames.clear()
+        self._port_values.clear()
+        return
+    
+    async def _write_frames(self) -> None:
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            while self._frames:
+                entry = self._frames.popleft()
+                if isinstance(entry, list) and (self._port_values.get(entry[1]) is entry):
+                    del self._port_values[entry[1]]
+                frame, _, sequence, timestamp = entry
+                try:
+                    if self._framing == FRAMING_V2:
+                        self._writer.write(encode_frame(frame, self._flags, sequence, timestamp))
+                    else:
+                        self._writer.writelines((frame[0:1], frame))
+                    await self._writer.drain()
+                except (ConnectionError, ConnectionResetError, ConnectionAbortedError):
+                    # the client is gone, drop what is put until remove_client closes the outbox
+                    self._closed = True
+                    self._task = None
+                    self._frames.clear()
+                    self._port_values.clear()
+                    return
+
+
+class RoutingTable:
+    """Routes the notifications of the LEGO\ |copy| Hubs to the clients registered at the respective port.
+    
+    The table has one slot per possible (hub_id, port) pair, so looking up the client of a notification is a
+    plain list index. A reverse index from each client's :class:`StreamWriter` to its ports allows removing a single
+    client without touching the registrations of the other clients. Each registered client gets its
+    :class:`ClientOutbox`.
+    
+    Notifications for ports without a registered client are not an error, they are counted in
+    :attr:`unroutable`.
+    
+    """
+    
+    def __init__(self, outbox_size: int = 64):
+        self._slots: List[Optional[Tuple[StreamReader, StreamWriter]]] = [None] * (256 * 256)
+        self._ports: Dict[StreamWriter, Set[int]] = {}
+        self._outboxes: Dict[StreamWriter, ClientOutbox] = {}
+        self._outbox_size: int = outbox_size
+        self.unroutable: int = 0
+        return
+    
+    @staticmethod
+    def _index(key: Union[int, Tuple[int, int]]) -> int:
+        if isinstance(key, tuple):
+            return (key[0] << 8) | key[1]
+        return key
+    
+    def __contains__(self, key: Union[int, Tuple[int, int]]) -> bool:
+        return self._slots[self._index(key)] is not None
+    
+    def __getitem__(self, key: Union[int, Tuple[int, int]]) -> Optional[Tuple[StreamReader, StreamWriter]]:
+        return self._slots[self._index(key)]
+    
+    def __len__(self) -> int:
+        return sum(len(ports) for ports in self._ports.values())
+    
+    def __repr__(self) -> str:
+        return f"RoutingTable({dict(self.items())!r}, unroutable={self.unroutable})"
+    
+    def items(self) -> Iterator[Tuple[Tuple[int, int], Tuple[StreamReader, StreamWriter]]]:
+        for ports in self._ports.values():
+            for index in sorted(ports):
+                yield divmod(index, 256), self._slots[index]
+    
+    def ports(self, writer: StreamWriter) -> Set[Tuple[int, int]]:
+        """The (hub_id, port) pairs registered by a client.
+        
+        """
+        return {divmod(index, 256) for index in self._ports.get(writer, ())}
+    
+    def outbox(self, writer: StreamWriter) -> Optional[ClientOutbox]:
+        """The outbound queue of a registered client.
+        
+        """
+        return self._outboxes.get(writer)
+    
+    def register(self, port: int, reader: StreamReader, writer: StreamWriter, hub_id: int = 0,
+                 framing: int = FRAMING_V1, flags: int = 0) -> None:
+        """Route the notifications for `port` of hub `hub_id` to the client (`reader`, `writer`).
+        
+        An existing registration of the port is replaced. `framing` and `flags` set the frame format of a new
+        client's :class:`ClientOutbox`.
+        
+        """
+        self.unregister(port, hub_id=hub_id)
+        index: int = (hub_id << 8) | port
+        self._slots[index] = (reader, writer)
+        self._ports.setdefault(writer, set()).add(index)
+        if writer not in self._outboxes:
+            self._outboxes[writer] = ClientOutbox(writer, maxsize=self._outbox_size, framing=framing, flags=flags)
+        return
+    
+    def unregister(self, port: int, hub_id: int = 0) -> Optional[Tuple[StreamReader, StreamWriter]]:
+        """Remove the registration of `port` of hub `hub_id`.
+        
+        The client's outbound queue is closed with its last port.
+        
+        Returns
+        -------
+        tuple[StreamReader, StreamWriter] or None
+            The removed entry, ``None`` if the port was not registered.
+            
+        """
+        index: int = (hub_id << 8) | port
+        entry = self._slots[index]
+        if entry is None:
+            return None
+        self._slots[index] = None
+        ports = self._ports[entry[1]]
+        ports.discard(index)
+        if not ports:
+            del self._ports[entry[1]]
+            self._outboxes.pop(entry[1]).close()
+        return entry
+    
+    def move(self, src: int, dst: int, hub_id: int = 0) -> bool:
+        """Re-register the client at port `src` under port `dst`, e.g., when a virtual port has been set up.
+        
+        Returns
+        -------
+        bool
+            ``True`` if a client was registered at `src`, ``False`` otherwise.
+            
+        """
+        src_index: int = (hub_id << 8) | src
+        dst_index: int = (hub_id << 8) | dst
+        entry = self._slots[src_index]
+        if entry is None:
+            return False
+        if src == dst:
+            return True
+        if self._slots[dst_index] is not None:
+            self.unregister(dst, hub_id=hub_id)
+        self._slots[src_index] = None
+        self._slots[dst_index] = entry
+        ports = self._ports[entry[1]]
+        ports.discard(src_index)
+        ports.add(dst_index)
+        return True
+    
+    def remove_client(self, writer: StreamWriter) -> Set[Tuple[int, int]]:
+        """Remove all registrations of the client with `writer`.
+        
+        Returns
+        -------
+        set[tuple[int, int]]
+            The (hub_id, port) pairs that were registered by the client.
+            
+        """
+        ports = self._ports.pop(writer, set())
+        for index in ports:
+            self._slots[index] = None
+        outbox = self._outboxes.pop(writer, None)
+        if outbox is not None:
+            outbox.close()
+        return {divmod(index, 256) for index in ports}
+    
+    def route(self, port: int, hub_id: int = 0) -> Optional[ClientOutbox]:
+        """The outbound queue of the client registered at `port` of hub `hub_id`.
+        
+        Returns
+        -------
+        ClientOutbox or None
+            The client's outbound queue, ``None`` (and the packet counted as unroutable) if no client is
+            registered.
+            
+        """
+        entry = self._slots[(hub_id << 8) | port]
+        if entry is None:
+            self.unroutable += 1
+            return None
+        return self._outboxes[entry[1]]
+
+
+connectedDevices: RoutingTable = RoutingTable()
 internalDevices: defaultdict = defaultdict()
 
-if os.name == 'posix':
-    class BTLEDelegate(btle.DefaultDelegate):
-        """Delegate class that initially handles the raw data coming from the Lego(c) Model.
+PIPELINED_WRITES: bool = False
+"""If ``True``, port output commands are sent as write-without-response, see :class:`CommandWindow`."""
+PIPELINE_WINDOW: int = 2
+"""Maximum number of unacknowledged port output commands per port in pipelined mode."""
+PIPELINE_PORT_WINDOWS: Dict[int, int] = {}
+"""Per port overrides of :data:`PIPELINE_WINDOW`, e.g., ``{0x10: 1}``."""
+
+SERVERS: List[Tuple[str, int]] = [('127.0.0.1', 8888), ]
+"""Addresses to serve clients on, the transport is selected by the address, e.g., ``('unix:/tmp/legoBTLE.sock', 0)``
+or ``('shm:/tmp/legoBTLE.shm', 0)``, see :func:`legoBTLE.networking.transport.parse_address`."""
+
+HUBS: List[str] = ['90:84:2B:5E:CF:1F', ]
+"""MAC Addresses of the LEGO\ |copy| Hubs to serve, the hub_id of each hub is its index in this list."""
+
+SIMULATED_HUBS: bool = False
+"""If ``True``, each entry of :data:`HUBS` is served by a :class:`legoBTLE.networking.simulation.SimulatedHub`."""
+
+connectedHubs: Dict[int, 'HubConnection'] = {}
+
+_CONTROL_MESSAGE_TYPES = frozenset((MESSAGE_TYPE.UPS_HUB_ATTACHED_IO[0], MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR[0], ))
+"""Notification types the server decodes itself; all other notifications are routed on the raw port byte."""
+
+
+class BTLEDelegate:
+    """Delegate class that initially handles the raw data coming from the Lego(c) Model.
+    
+    The delegate offers the interface of :class:`bluepy.btle.DefaultDelegate` without depending on bluepy, so it
+    serves a :class:`legoBTLE.networking.simulation.SimulatedHub` on systems without a bluetooth stack as well.
+    """
+    def __init__(self, loop: AbstractEventLoop, remoteHost=('127.0.0.1', 8888), hub_id: int = 0,
+                 debug: bool = False):
+        
+        self._loop = loop
+        self._remoteHost = remoteHost
+        self._hub_id: int = hub_id
+        self._debug: bool = debug
+        return
+    
+    def handleNotification(self, cHandle, data):  # actual Callback function
+        """Hand a received notification over to the event loop.
+        
+        This callback runs on the :class:`BTLEWorker` thread. The routing to the clients is done in
+        :meth:`_route_notification` on the event loop thread, as the client streams are not thread safe. An
+        installed :class:`legoBTLE.networking.prettyprint.tracelog.FrameLog` records the notification here.
+
+        Parameters
+        ----------
+        cHandle :
+            Handle of the data
+        data : bytearray
+            Notifications from the bluetooth device as bytearray.
+            
+        Returns
+        -------
+        None
+            Nothing
         """
-        def __init__(self, loop: AbstractEventLoop, remoteHost=('127.0.0.1', 8888)):
+        data = bytes(data)
+        trace = tracelog.TRACE
+        if trace is not None:
+            trace.frame(UPSTREAM, self._hub_id, data[3] if len(data) > 3 else 0, data)
+        self._loop.call_soon_threadsafe(self._route_notification, data)
+        return
+    
+    def _route_notification(self, data: bytes):
+        """Distribute received notifications to the respective device.
+
+        Parameters
+        ----------
+        data : bytes
+            Notifications from the bluetooth device.
             
-            super().__init__()
-            self._loop = loop
-            self._remoteHost = remoteHost
+        Returns
+        -------
+        None
+            Nothing
+        """
+        if len(data) < 4:
+            connectedDevices.unroutable += 1
+            emit(f"[BTLEDelegate]-[MSG]: WRONG ANSWER\r\n\t\t{data.hex()}\r\nFROM BTLE... {C.FAIL}IGNORING...{C.ENDC}")
+            return
+        
+        m_type: int = data[2]
+        if m_type not in _CONTROL_MESSAGE_TYPES:
+            # fast path: PORT_VALUE, PORT_CMD_FEEDBACK etc. are routed on the raw port byte
+            if m_type == MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK[0]:
+                hub: Optional[HubConnection] = connectedHubs.get(self._hub_id)
+                if (hub is not None) and (hub.command_window is not None):
+                    hub.command_window.acknowledge(data)
+            self._forward(data[3], data)
             return
         
-        def handleNotification(self, cHandle, data):  # actual Callback function
-            """Distribute received notifications to the respective device.
-
-            Parameters
-            ----------
-            cHandle :
-                Handle of the data
-            data : bytearray
-                Notifications from the bluetooth device as bytearray.
-                
-            Returns
-            -------
-            None
-                Nothing
-            """
-            print(f"[BTLEDelegate]-[MSG]: Returned NOTIFICATION = {data.hex()}")
-            M_RET = UpStreamMessageBuilder(data, debug=True).build()
+        emit(f"[BTLEDelegate]-[MSG]: Returned NOTIFICATION = {data.hex()}")
+        if m_type == MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR[0]:
+            hub: Optional[HubConnection] = connectedHubs.get(self._hub_id)
+            if (hub is not None) and (hub.command_window is not None):
+                hub.command_window.reject(data)
+        M_RET = build_upstream_message(data)
+        
+        if (M_RET is not None) and (M_RET.m_header.m_type == MESSAGE_TYPE.UPS_HUB_ATTACHED_IO) and (M_RET.m_io_event == PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED):
+            if self._debug:
+                emit(f"{C.BOLD}{C.FAIL}RAW:\tCOMMAND         -->  {M_RET.COMMAND}{C.ENDC}")
+                emit(f"{C.BOLD}{C.FAIL}RAW:\tHEADER          -->  {M_RET.m_header}{C.ENDC}")
+                emit(f"{C.BOLD}{C.FAIL}RAW:\tM_TYPE          -->  {M_RET.m_header.m_type}{C.ENDC}")
+                emit(f"{C.BOLD}{C.FAIL}RAW:\tM_TYPE ==       -->  {M_RET.m_header.m_type == MESSAGE_TYPE.UPS_HUB_ATTACHED_IO}{C.ENDC}")
+                emit(f"{C.BOLD}{C.FAIL}RAW:\tM_IO_EVENT      -->  {M_RET.m_io_event}{C.ENDC}")
+                emit(f"{C.BOLD}{C.FAIL}RAW:\tM_IO_EVENT ==   -->  {M_RET.m_io_event == PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED}{C.ENDC}")
+                emit(f"{C.BOLD}{C.FAIL}RAW:\tM_PORT          -->  {M_RET.m_port}{C.ENDC}")
+                emit(f"{C.BOLD}{C.FAIL}RAW:\tM_PORT_A        -->  {M_RET.m_port_a}{C.ENDC}")
+                emit(f"{C.BOLD}{C.FAIL}RAW:\tM_PORT_B        -->  {M_RET.m_port_b}{C.ENDC}")
+            # we search for the setup port with which the combined device first registered
+            setup_port: int = (110 +
+                               1 * int.from_bytes(M_RET.m_port_a, 'little', signed=False) +
+                               2 * int.from_bytes(M_RET.m_port_b, 'little', signed=False)
+                               )
+            if self._debug:
+                emit(f"*****************************************************SETUPPORT: {setup_port}")
+            if self._forward(setup_port, data):
+                # change initial port value of motor_a.port + motor_b.port to virtual port
+                connectedDevices.move(setup_port, data[3], hub_id=self._hub_id)
+        elif (M_RET is not None) and (M_RET.m_header.m_type == MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR) and (M_RET.m_error_cmd == MESSAGE_TYPE.DNS_VIRTUAL_PORT_SETUP):
+            if self._debug:
+                emit("*" * 10, f"[BTLEDelegate.handleNotification()]-[MSG]:  {C.BOLD}{C.OKBLUE}VIRTUAL PORT SETUP: ACK -- BEGIN\r\n")
+                emit("*" * 10,
+                         f"[BTLEDelegate.handleNotification()]-[MSG]:  {C.BOLD}{C.OKBLUE}RECEIVED GENERIC_ERROR_NOTIFICATION: OK, see\r\n")
+                emit("*" * 10,
+                         f"[BTLEDelegate.handleNotification()]-[MSG]:  {C.BOLD}{C.OKBLUE}https://lego.github.io/lego-ble-wireless-protocol-docs/index.html#hub-attached-i-o\r\n")
+                emit("*" * 10,
+                         f"[BTLEDelegate.handleNotification()]-[MSG]:  {C.BOLD}{C.OKBLUE}VIRTUAL PORT SETUP: ACK -- END \r\n")
+        else:
+            self._forward(data[3], data)
+        return
+    
+    def _forward(self, port: int, data: bytes) -> bool:
+        """Send the notification to the client registered at `port` of this delegate's hub.
+        
+        The hub itself always reports hub_id ``0``, so for any other hub the notification's hub_id is
+        replaced by the hub_id the client registered with.
+        
+        Returns
+        -------
+        bool
+            ``True`` if a client was found, ``False`` otherwise.
+        """
+        client: Optional[ClientOutbox] = connectedDevices.route(port, hub_id=self._hub_id)
+        if client is None:
+            self._not_connected(port)
+            return False
+        if self._hub_id:
+            data = data[:1] + bytes((self._hub_id, )) + data[2:]
+        client.put(data)
+        if self._debug:
+            emit(f"[BTLEDelegate]-[MSG]: {C.BOLD}{C.OKBLUE}FOUND PORT {port} / {C.UNDERLINE}MESSAGE SENT...{C.ENDC}\n-----------------------")
+        return True
+    
+    def _not_connected(self, port: int):
+        emit(f"[BTLEDelegate]-[MSG]: DEVICE CLIENT AT HUB [{self._hub_id}] PORT [{port}] {C.BOLD}{C.WARNING}NOT CONNECTED{C.ENDC} "
+             f"TO SERVER [{self._remoteHost[0]}:{self._remoteHost[1]}]... {C.WARNING}Ignoring Notification from BTLE "
+             f"({connectedDevices.unroutable} unroutable so far)...{C.ENDC}")
+        return
+
+
+async def connectBTLE(loop: AbstractEventLoop, deviceaddr: str = '90:84:2B:5E:CF:1F', host: str = '127.0.0.1',
+                      btleport: int = 9999, hub_id: int = 0) -> 'Peripheral':
+    """
+    Establish the LEGO\ |copy| Hub <-> Computer bluetooth connection.
+    
+    bluepy is imported only here, so the server runs simulated hubs without it.
+
+    Parameters
+    ----------
+    loop : `AbstractEventLoop`
+        A reference to the event lopp.
+    btleport : int
+        The server port.
+    host : str
+        The hostname.
+    deviceaddr : str
+        The MAC Address of the LEGO\ |copy| Hub.
+    hub_id : int
+        The hub_id under which the clients address this hub.
+    
+    Raises
+    ------
+    Exception
+    
+    """
+    global _BTLE_TRANSIENT_ERRORS
+    
+    from bluepy.btle import BTLEInternalError
+    from bluepy.btle import Peripheral
+    _BTLE_TRANSIENT_ERRORS = (BTLEInternalError, )
+    
+    emit(f"[BTLE]-[MSG]: {C.HEADER}{C.BLINK}COMMENCE CONNECT TO [{deviceaddr}]{C.ENDC}...")
+    try:
+        BTLE_DEVICE: Peripheral = Peripheral(deviceaddr)
+        BTLE_DEVICE.withDelegate(BTLEDelegate(loop=loop, remoteHost=(host, 8888), hub_id=hub_id))
+    except Exception as btle_ex:
+        raise
+    else:
+        emit(f"[{deviceaddr}]-[MSG]: {C.OKBLUE}CONNECTION TO [{deviceaddr}] {C.BOLD}{C.UNDERLINE}COMPLETE{C.ENDC}...")
+        return BTLE_DEVICE
+
+
+class BTLEWorker(threading.Thread):
+    """Dedicated thread that owns the bluetooth connection to the LEGO\ |copy| Hub.
+    
+    The blocking calls into the bluetooth stack are kept off the event loop: the worker blocks on
+    :meth:`waitForNotifications` and, between two waits, drains the queue of pending writes. Received
+    notifications are delivered by the peripheral's delegate, which hands them back to the event loop with
+    :meth:`AbstractEventLoop.call_soon_threadsafe`.
+    
+    No other thread must access the peripheral once the worker has been started.
+    
+    """
+    
+    def __init__(self, btledevice, name: str = 'BTLEWorker', timeout: float = .001, debug: bool = False):
+        """
+        
+        Parameters
+        ----------
+        btledevice : Peripheral
+            The connected bluetooth device (with its delegate already set).
+        name : str
+            The thread name.
+        timeout : float
+            Maximum time in seconds to block for notifications before pending writes are served.
+        debug : bool
+            If ``True``, verbose messages to stdout.
+        """
+        super().__init__(name=name, daemon=True)
+        self._btledevice = btledevice
+        self._timeout: float = timeout
+        self._debug: bool = debug
+        self._writes: queue.SimpleQueue = queue.SimpleQueue()
+        self._stopped: threading.Event = threading.Event()
+        return
+    
+    @property
+    def btledevice(self):
+        return self._btledevice
+    
+    def write(self, handle: int, data: bytes, withResponse: bool = True) -> None:
+        """Queue a write to the bluetooth device.
+        
+        This method is thread safe and does not block; the write is carried out by the worker thread.
+        
+        Parameters
+        ----------
+        handle : int
+            The characteristic's handle.
+        data : bytes or memoryview
+            The message to write. Immutable data is queued as is, anything else is copied.
+        withResponse : bool
+            If ``True``, the write is acknowledged by the bluetooth device.
             
+        """
+        if not (isinstance(data, bytes) or (isinstance(data, memoryview) and data.readonly)):
+            data = bytes(data)
+        self._writes.put((handle, data, withResponse))
+        return
+    
+    def stop(self) -> None:
+        """Request the worker to terminate after the current wait.
+        
+        """
+        self._stopped.set()
+        return
+    
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            self._drain_writes()
             try:
-                if (M_RET is not None) and (M_RET.m_header.m_type == MESSAGE_TYPE.UPS_HUB_ATTACHED_IO) and (M_RET.m_io_event == PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED):
-                    print(f"{C.BOLD}{C.FAIL}RAW:\tCOMMAND         -->  {M_RET.COMMAND}{C.ENDC}", end="\r\n")
-                    print(f"{C.BOLD}{C.FAIL}RAW:\tHEADER          -->  {M_RET.m_header}{C.ENDC}", end="\r\n")
-                    print(f"{C.BOLD}{C.FAIL}RAW:\tM_TYPE          -->  {M_RET.m_header.m_type}{C.ENDC}", end="\r\n")
-                    print(f"{C.BOLD}{C.FAIL}RAW:\tM_TYPE ==       -->  {M_RET.m_header.m_type == MESSAGE_TYPE.UPS_HUB_ATTACHED_IO}{C.ENDC}", end="\r\n")
-                    print(f"{C.BOLD}{C.FAIL}RAW:\tM_IO_EVENT      -->  {M_RET.m_io_event}{C.ENDC}", end="\r\n")
-                    print(f"{C.BOLD}{C.FAIL}RAW:\tM_IO_EVENT ==   -->  {M_RET.m_io_event == PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED}{C.ENDC}", end="\r\n")
-                    print(f"{C.BOLD}{C.FAIL}RAW:\tM_PORT          -->  {M_RET.m_port}{C.ENDC}", end="\r\n")
-                    print(f"{C.BOLD}{C.FAIL}RAW:\tM_PORT_A        -->  {M_RET.m_port_a}{C.ENDC}", end="\r\n")
-                    print(f"{C.BOLD}{C.FAIL}RAW:\tM_PORT_B        -->  {M_RET.m_port_b}{C.ENDC}", end="\r\n")
-                if (M_RET is not None) and (M_RET.m_header.m_type == MESSAGE_TYPE.UPS_HUB_ATTACHED_IO) and (
-                        M_RET.m_io_event == PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED):
-                    # we search for the setup port with which the combined device first registered
-                    setup_port: int = (110 +
-                                       1 * int.from_bytes(M_RET.m_port_a, 'little', signed=False) +
-                                       2 * int.from_bytes(M_RET.m_port_b, 'little', signed=False)
-                                       )
-                    print(f"*****************************************************SETUPPORT: {setup_port}")
-                    connectedDevices[setup_port][1].write(data[0:1])
-                    asyncio.create_task(connectedDevices[setup_port][1].drain())
-                    connectedDevices[setup_port][1].write(data)
-                    asyncio.create_task(connectedDevices[setup_port][1].drain())
-                    
-                    # change initial port value of motor_a.port + motor_b.port to virtual port
-                    connectedDevices[data[3]] = connectedDevices[setup_port][0], connectedDevices[setup_port][1]
-                    del connectedDevices[setup_port]
-                elif (M_RET.m_header.m_type == MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR) and (M_RET.m_error_cmd == MESSAGE_TYPE.DNS_VIRTUAL_PORT_SETUP):
-                    print("*" * 10, f"[BTLEDelegate.handleNotification()]-[MSG]:  {C.BOLD}{C.OKBLUE}VIRTUAL PORT SETUP: ACK -- BEGIN\r\n")
-                    print("*" * 10,
-                          f"[BTLEDelegate.handleNotification()]-[MSG]:  {C.BOLD}{C.OKBLUE}RECEIVED GENERIC_ERROR_NOTIFICATION: OK, see\r\n")
-                    print("*" * 10,
-                          f"[BTLEDelegate.handleNotification()]-[MSG]:  {C.BOLD}{C.OKBLUE}https://lego.github.io/lego-ble-wireless-protocol-docs/index.html#hub-attached-i-o\r\n")
-                    print("*" * 10,
-                          f"[BTLEDelegate.handleNotification()]-[MSG]:  {C.BOLD}{C.OKBLUE}VIRTUAL PORT SETUP: ACK -- END \r\n")
-                else:
-                    print(f"To PORT: {data[3]}")
-                    connectedDevices[data[3]][1].write(data[0:1])
-                    connectedDevices[data[3]][1].write(data)
-                    asyncio.create_task(connectedDevices[data[3]][1].drain())
-            except TypeError as te:
-                print(
-                        f"[BTLEDelegate]-[MSG]: WRONG ANSWER\r\n\t\t{data.hex()}\r\nFROM BTLE... {C.FAIL}IGNORING...{C.ENDC}\r\n\t{te.args}")
+                if self._btledevice.waitForNotifications(self._timeout):
+                    if self._debug:
+                        emit(f"[BTLEWorker]-[MSG]: NOTIFICATION RECEIVED... [T: {datetime.timestamp(datetime.now())}]")
+            except _BTLE_TRANSIENT_ERRORS:
+                pass
+        return
+    
+    def _drain_writes(self) -> None:
+        while True:
+            try:
+                handle, data, withResponse = self._writes.get_nowait()
+            except queue.Empty:
                 return
-            except KeyError as ke:
-                print(f"[BTLEDelegate]-[MSG]: DEVICE CLIENT AT PORT [{data[3]}] {C.BOLD}{C.WARNING}NOT CONNECTED{C.ENDC} "
-                      f"TO SERVER [{self._remoteHost[0]}:{self._remoteHost[1]}]... {C.WARNING}Ignoring Notification from BTLE...{C.ENDC}")
-            else:
-                print(f"[BTLEDelegate]-[MSG]: {C.BOLD}{C.OKBLUE}FOUND PORT {data[3]} / {C.UNDERLINE}MESSAGE SENT...{C.ENDC}\n-----------------------")
+            try:
+                self._btledevice.writeCharacteristic(handle, data, withResponse)
+            except _BTLE_TRANSIENT_ERRORS as btle_ex:
+                emit(f"[BTLEWorker]-[MSG]: {C.FAIL}WRITING [{data.hex()}] TO HANDLE {handle} FAILED... "
+                     f"IGNORING...{C.ENDC}\r\n\t{btle_ex.args}")
+
+
+class CommandWindow:
+    """Pipelined sending of port output commands with a bounded number of commands in flight per port.
+    
+    Instead of waiting for the bluetooth acknowledgement of every single write, port output commands are sent as
+    write-without-response. The acknowledgement is taken from the ``PORT_CMD_FEEDBACK`` notifications of the hub:
+    a command counts as in flight from the moment it is written until the hub reports it as completed or
+    discarded. Once ``window`` commands are in flight at a port, further commands to that port are held back
+    until feedback frees a slot.
+    
+    Only commands that request feedback (bit 0 of the startup and completion byte) take part; all other
+    commands are written with response as before. While commands are held back at a port, those without feedback
+    wait in line behind them, so the commands to a port always reach the hub in the order they were sent.
+    
+    A slot is released as well if the hub rejects the command with a ``GENERIC_ERROR`` notification, see
+    :meth:`reject`, or if no feedback has arrived `timeout` seconds after the command was written, so that a lost
+    notification can't block the port.
+    
+    All methods must be called from the event loop thread.
+    
+    See Also
+    --------
+    `PORT OUTPUT COMMAND FEEDBACK <https://lego.github.io/lego-ble-wireless-protocol-docs/index.html#port-output-command-feedback>`_
+    
+    """
+    
+    def __init__(self, worker: BTLEWorker, window: int = 2, port_windows: Optional[Dict[int, int]] = None,
+                 timeout: float = 1.0, debug: bool = False):
+        """
+        
+        Parameters
+        ----------
+        worker : BTLEWorker
+            The worker that carries out the writes.
+        window : int
+            Default number of commands that may be in flight per port.
+        port_windows : dict[int, int], optional
+            Per port overrides of ``window``.
+        timeout : float
+            Seconds after which a command without feedback no longer counts as in flight.
+        debug : bool
+            If ``True``, verbose messages to stdout.
+        """
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self._worker: BTLEWorker = worker
+        self._window: int = window
+        self._port_windows: Dict[int, int] = dict(port_windows or {})
+        self._timeout: float = timeout
+        # the times the commands in flight were written, oldest first
+        self._in_flight: Dict[int, deque] = defaultdict(deque)
+        self._pending: Dict[int, deque] = defaultdict(deque)
+        self._deadlines: Dict[int, asyncio.TimerHandle] = {}
+        self._last_port: Optional[int] = None
+        self._debug: bool = debug
+        return
+    
+    def window(self, port: int) -> int:
+        return self._port_windows.get(port, self._window)
+    
+    def in_flight(self, port: int) -> int:
+        return len(self._in_flight[port])
+    
+    def submit(self, data) -> None:
+        """Send a downstream message to the hub.
+        
+        Parameters
+        ----------
+        data : bytes or memoryview
+            The message, starting with the length byte.
+            
+        """
+        if data[2] != MESSAGE_TYPE.DNS_PORT_CMD[0]:
+            self._worker.write(0x0e, data, True)
+            return
+        
+        port: int = data[3]
+        if not (data[4] & 0x01) and not self._pending[port]:
+            self._worker.write(0x0e, data, True)
+            return
+        if self._pending[port] or (len(self._in_flight[port]) >= self.window(port)):
+            self._pending[port].append(bytes(data))
+            if self._debug:
+                emit(f"[CommandWindow]-[MSG]: PORT {port} WINDOW FULL, HOLDING BACK [{data.hex()}]...")
             return
+        self._send(port, data)
+        return
     
+    def acknowledge(self, feedback: bytearray) -> None:
+        """Release in flight commands according to a ``PORT_CMD_FEEDBACK`` notification.
+        
+        Parameters
+        ----------
+        feedback : bytearray
+            The raw notification, which can hold several (port, feedback) pairs.
+            
+        """
+        for i in range(3, len(feedback) - 1, 2):
+            port: int = feedback[i]
+            msg: int = feedback[i + 1]
+            in_flight: deque = self._in_flight[port]
+            if msg & 0x08:
+                # IDLE: nothing is executing or buffered at the port anymore
+                in_flight.clear()
+            elif (msg & 0x06) and in_flight:
+                # EMPTY_BUF_CMD_COMPLETED or CURRENT_CMD_DISCARDED
+                in_flight.popleft()
+            self._release(port)
+        return
     
-    async def connectBTLE(loop: AbstractEventLoop, deviceaddr: str = '90:84:2B:5E:CF:1F', host: str = '127.0.0.1',
-                          btleport: int = 9999) -> Peripheral:
+    def reject(self, error: bytearray) -> None:
+        """Release the slot of a command the hub rejected with a ``GENERIC_ERROR`` notification.
+        
+        The notification doesn't name the port. The hub rejects a command as soon as it receives it, so the error
+        is taken to belong to the port the last command was written to.
+        
+        Parameters
+        ----------
+        error : bytearray
+            The raw notification.
+            
         """
-        Establish the LEGO\ |copy| Hub <-> Computer bluetooth connection.
+        if (len(error) < 4) or (error[3] != MESSAGE_TYPE.DNS_PORT_CMD[0]) or (self._last_port is None):
+            return
+        port: int = self._last_port
+        if self._in_flight[port]:
+            self._in_flight[port].pop()
+        if self._debug:
+            emit(f"[CommandWindow]-[MSG]: PORT {port} COMMAND REJECTED [{error.hex()}], RELEASING SLOT...")
+        self._release(port)
+        return
+    
+    def _release(self, port: int) -> None:
+        pending: deque = self._pending[port]
+        while pending:
+            if not (pending[0][4] & 0x01):
+                self._worker.write(0x0e, pending.popleft(), True)
+            elif len(self._in_flight[port]) < self.window(port):
+                self._send(port, pending.popleft())
+            else:
+                break
+        return
+    
+    def _send(self, port: int, data) -> None:
+        loop = asyncio.get_running_loop()
+        in_flight: deque = self._in_flight[port]
+        in_flight.append(loop.time())
+        self._last_port = port
+        if port not in self._deadlines:
+            self._deadlines[port] = loop.call_later(in_flight[0] + self._timeout - loop.time(), self._expire, port)
+        self._worker.write(0x0e, data, False)
+        return
+    
+    def _expire(self, port: int) -> None:
+        # releases the commands that got no feedback in time, runs at the deadline of the oldest command in flight
+        del self._deadlines[port]
+        in_flight: deque = self._in_flight[port]
+        loop = asyncio.get_running_loop()
+        stale: float = loop.time() - self._timeout
+        expired: int = 0
+        while in_flight and (in_flight[0] <= stale):
+            in_flight.popleft()
+            expired += 1
+        if expired and self._debug:
+            emit(f"[CommandWindow]-[MSG]: PORT {port} NO FEEDBACK FOR {expired} COMMAND(S), RELEASING SLOTS...")
+        if in_flight:
+            self._deadlines[port] = loop.call_later(in_flight[0] + self._timeout - loop.time(), self._expire, port)
+        self._release(port)
+        return
+
 
+class HubConnection:
+    """The connection to one LEGO\ |copy| Hub: the peripheral, its :class:`BTLEWorker` and, in pipelined mode,
+    its :class:`CommandWindow`.
+    
+    Each hub has its own worker thread, so the hubs are served concurrently. Any object that offers the
+    ``waitForNotifications`` and ``writeCharacteristic`` methods of :class:`bluepy.btle.Peripheral` and delivers its
+    notifications to a :class:`BTLEDelegate` can be used as peripheral.
+    
+    """
+    
+    def __init__(self, hub_id: int, btledevice, pipelined: bool = False, window: int = 2,
+                 port_windows: Optional[Dict[int, int]] = None, debug: bool = False):
+        """
+        
         Parameters
         ----------
-        loop : `AbstractEventLoop`
-            A reference to the event lopp.
-        btleport : int
-            The server port.
-        host : str
-            The hostname.
-        deviceaddr : str
-            The MAC Address of the LEGO\ |copy| Hub.
-        
-        Raises
-        ------
-        Exception
+        hub_id : int
+            The hub_id under which the clients address this hub.
+        btledevice : Peripheral
+            The connected bluetooth device with a :class:`BTLEDelegate` for `hub_id` set.
+        pipelined : bool
+            If ``True``, port output commands are sent through a :class:`CommandWindow`.
+        window : int
+            The in flight window per port in pipelined mode.
+        port_windows : dict[int, int], optional
+            Per port overrides of `window`.
+        debug : bool
+            If ``True``, verbose messages to stdout.
+        """
+        self._hub_id: int = hub_id
+        self._btledevice = btledevice
+        self._worker: BTLEWorker = BTLEWorker(btledevice, name=f"BTLEWorker-{hub_id}", debug=debug)
+        self._command_window: Optional[CommandWindow] = None
+        if pipelined:
+            self._command_window = CommandWindow(self._worker, window=window, port_windows=port_windows,
+                                                 debug=debug)
+        return
+    
+    @property
+    def hub_id(self) -> int:
+        return self._hub_id
+    
+    @property
+    def btledevice(self):
+        return self._btledevice
+    
+    @property
+    def worker(self) -> BTLEWorker:
+        return self._worker
+    
+    @property
+    def command_window(self) -> Optional[CommandWindow]:
+        return self._command_window
+    
+    def start(self) -> None:
+        self._worker.start()
+        return
+    
+    def stop(self) -> None:
+        """Stop the worker and disconnect the peripheral.
         
         """
+        self._worker.stop()
+        self._worker.join()
+        self._btledevice.disconnect()
+        return
+    
+    def write(self, handle: int, data: bytearray) -> None:
+        """Send a downstream message to the hub.
         
-        print(f"[BTLE]-[MSG]: {C.HEADER}{C.BLINK}COMMENCE CONNECT TO [{deviceaddr}]{C.ENDC}...")
-        try:
-            BTLE_DEVICE: Peripheral = Peripheral(deviceaddr)
-            BTLE_DEVICE.withDelegate(BTLEDelegate(loop=loop, remoteHost=(host, 8888)))
-        except Exception as btle_ex:
-            raise
+        The hub_id of messages written to handle ``0x0e`` is reset to ``0``, as the hub expects. Messages that
+        already carry hub_id ``0`` are passed on without copying.
+        
+        Parameters
+        ----------
+        handle : int
+            The characteristic's handle.
+        data : bytes or memoryview
+            The message.
+            
+        """
+        if handle != 0x0e:
+            self._worker.write(handle, data, withResponse=True)
+            return
+        if data[1]:
+            data = bytes(data[0:1]) + b'\x00' + bytes(data[2:])
+        if self._command_window is not None:
+            self._command_window.submit(data)
         else:
-            print(f"[{deviceaddr}]-[MSG]: {C.OKBLUE}CONNECTION TO [{deviceaddr}] {C.BOLD}{C.UNDERLINE}COMPLETE{C.ENDC}...")
-            return BTLE_DEVICE
+            self._worker.write(handle, data, withResponse=True)
+        return
+
+
+class ClientProtocol(FlowControlMixin, asyncio.Protocol):
+    """The server side of a client connection.
     
+    The protocol receives the messages (the commands) from a device. Once a message has been received it is - if not
+    the initial connection request - sent to the BTLE device.
     
-    def _listenBTLE(btledevice: Peripheral, loop, debug: bool = False):
-        try:
-            if btledevice.waitForNotifications(.001):
+    A connection starts in :data:`FRAMING_V1`, i.e., each message from the client is preceded by two bytes, the
+    handle and the message length. A client can switch the connection to :data:`FRAMING_V2` with its registration
+    request (see :mod:`legoBTLE.networking.framing`). The messages are cut out of each received chunk as
+    :class:`memoryview` slices and handed to the hub without copying; only a message that arrives in several chunks
+    is assembled in a buffer first. Registration, acknowledgement and disconnect requests are answered directly on
+    the transport.
+    
+    """
+    
+    def __init__(self, debug: bool = True):
+        """
+        
+        Parameters
+        ----------
+        debug : bool
+            If ``True``:
+                Verbose Messages to stdout
+            else:
+                don't show.
+        """
+        super().__init__()
+        self._debug: bool = debug
+        self._buffer: bytearray = bytearray()
+        self._transport: Optional[asyncio.Transport] = None
+        self._writer: Optional[StreamWriter] = None
+        self._conn_info: Tuple[str, int] = ('', 0)
+        self._framing: int = FRAMING_V1
+        self._flags: int = 0
+        return
+    
+    @property
+    def framing(self) -> int:
+        return self._framing
+    
+    @property
+    def writer(self) -> Optional[StreamWriter]:
+        return self._writer
+    
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self._transport = transport
+        self._writer = StreamWriter(transport, self, None, self._loop)
+        peername = transport.get_extra_info('peername')
+        if not isinstance(peername, tuple):
+            peername = (transport.get_extra_info('sockname') or 'local', 0)
+        self._conn_info = peername
+        return
+    
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        super().connection_lost(exc)
+        if isinstance(exc, ConnectionAbortedError):
+            emit(f"[{host}:{port}]-[MSG]: CLIENT [{self._conn_info[0]}:{self._conn_info[1]}] ABORTED CONNECTION... "
+                 f"DISCONNECTED...")
+        else:
+            emit(f"[{host}:{port}]-[MSG]: CLIENT [{self._conn_info[0]}:{self._conn_info[1]}] RESET CONNECTION... "
+                 f"DISCONNECTED...")
+        self._loop.call_later(.05, connectedDevices.remove_client, self._writer)
+        return
+    
+    def _get_close_waiter(self, stream: StreamWriter) -> asyncio.Future:
+        waiter = self._loop.create_future()
+        if self._transport.is_closing():
+            waiter.set_result(None)
+        else:
+            self._loop.call_soon(self._transport.close)
+            self._loop.call_soon(waiter.set_result, None)
+        return waiter
+    
+    def data_received(self, data: bytes) -> None:
+        if self._buffer:
+            self._buffer += data
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        view: memoryview = memoryview(data)
+        end: int = len(data)
+        start: int = 0
+        while start + 2 <= end:
+            if self._framing == FRAMING_V2:
+                # size, flags, handle, message, trailer
+                stop: int = start + 1 + data[start]
+                if stop > end:
+                    break
+                if stop >= start + 3:
+                    self._handle_message(data[start + 2], view[start + 3:stop - trailer_size(data[start + 1])])
+            else:
+                stop: int = start + 2 + data[start + 1]
+                if stop > end:
+                    break
+                self._handle_message(data[start], view[start + 2:stop])
+            start = stop
+        if start < end:
+            self._buffer += view[start:]
+        return
+    
+    def _send(self, message: bytearray) -> None:
+        if self._framing == FRAMING_V2:
+            # answers are not counted in the client's sequence of notifications
+            self._transport.write(encode_frame(message, self._flags & ~FRAME_SEQUENCE, 0, time.time()))
+        else:
+            self._transport.write(message[0:1] + message)
+        return
+    
+    def _handle_message(self, handle: int, CLIENT_MSG_DATA: memoryview) -> None:
+        """Process one message of the client.
+        
+        Parameters
+        ----------
+        handle : int
+            The handle the message is destined for.
+        CLIENT_MSG_DATA : memoryview
+            The message, starting with the length byte.
+            
+        """
+        debug: bool = self._debug
+        conn_info = self._conn_info
+        if debug:
+            emit(f"[{host}:{port}]-[MSG]: {C.OKGREEN}CARRIER SIGNAL DETECTED: handle={handle}, "
+                  f"size={len(CLIENT_MSG_DATA)}...{C.ENDC}")
+        if len(CLIENT_MSG_DATA) < 4:
+            emit(f"[{host}:{port}]-[MSG]: {C.WARNING}MALFORMED MESSAGE [{CLIENT_MSG_DATA.hex()}] FROM "
+                  f"[{conn_info[0]}:{conn_info[1]}], DISCARDING...{C.ENDC}")
+            return
+        hub_id: int = CLIENT_MSG_DATA[1]
+        hub: Optional[HubConnection] = connectedHubs.get(hub_id)
+        trace = tracelog.TRACE
+        if trace is not None:
+            trace.frame(DOWNSTREAM, hub_id, CLIENT_MSG_DATA[3], CLIENT_MSG_DATA)
+        
+        if CLIENT_MSG_DATA[2] == MESSAGE_TYPE.UPS_DNS_GENERAL_HUB_NOTIFICATIONS[0]:
+            if debug:
+                emit(
+                        f"[{host}:{port}]-[MSG]: {C.BOLD}{C.UNDERLINE}{C.OKBLUE}SENDING{C.ENDC}: "
+                        f"{C.OKGREEN}{C.BOLD}{handle}, {CLIENT_MSG_DATA[2:].hex()}{C.ENDC} {C.BOLD}{C.UNDERLINE}{C.OKBLUE} "
+                        f"FROM{C.ENDC}{C.BOLD}{C.OKBLUE} DEVICE [{conn_info[0]}:{conn_info[1]}]{C.UNDERLINE} "
+                        f"TO{C.ENDC}{C.BOLD}{C.OKBLUE} BTLE device{C.ENDC}")
+            if hub is not None:
+                hub.write(0x0f, CLIENT_MSG_DATA[2:])
+            return
+        if debug:
+            emit(
+                    f"[{host}:{port}]-[MSG]: {C.BOLD}{C.OKBLUE}{C.UNDERLINE}RECEIVED "
+                    f"CLIENTMESSAGE{C.ENDC}{C.BOLD}{C.OKBLUE}: {CLIENT_MSG_DATA.hex()} FROM DEVICE "
+                    f"[{conn_info[0]}:{conn_info[1]}]{C.ENDC}")
+        
+        con_key_index: int = CLIENT_MSG_DATA[3]
+        
+        if (hub_id, con_key_index) not in connectedDevices:
+            # wait until Connection Request from client
+            if ((CLIENT_MSG_DATA[2] != MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD[0])
+                    or (len(CLIENT_MSG_DATA) < 5)
+                    or (CLIENT_MSG_DATA[4] != SERVER_SUB_COMMAND.REG_W_SERVER[0])):
+                return
+            framing: int = self._framing
+            flags: int = self._flags
+            if (len(CLIENT_MSG_DATA) > 6) and (self._framing == FRAMING_V1):
+                framing = max(FRAMING_V1, min(CLIENT_MSG_DATA[5], FRAMING_VERSION))
+                flags = CLIENT_MSG_DATA[6] & FRAME_FLAGS if framing == FRAMING_V2 else 0
+            if debug:
+                emit("*"*10, f" {C.BOLD}{C.OKBLUE}NEW DEVICE: {con_key_index} DETECTED", end="*" * 10+f"{C.ENDC}\r\n")
+            connectedDevices.register(con_key_index, self, self._writer, hub_id=hub_id, framing=framing, flags=flags)
+            if debug:
+                emit("**", " " * 8, f"\t\t{C.BOLD}{C.OKBLUE}DEVICE: {con_key_index} REGISTERED",
+                      end="*" * 10 + f"{C.ENDC}\r\n")
+                emit(f"{C.BOLD}{C.OKBLUE}*"*20, end=f"{C.ENDC}\r\n")
+
+                emit("*" * 10, f" {C.BOLD}{C.OKBLUE}[{host}:{port}]-[MSG]: SUMMARY CONNECTED DEVICES:{C.ENDC}")
+                for con_dev_k, con_dev_v in connectedDevices.items():
+                    emit(f"{C.BOLD}{C.OKBLUE}**[{host}:{port}]-[MSG]: \t"
+                          f"HUB, PORT: {con_dev_k} / DEVICE: {con_dev_v[1]}{C.ENDC}")
+                emit(f"{C.BOLD}{C.OKBLUE}*" * 20, end=f"{C.ENDC}\r\n")
+            
+            ACK_MSG_DATA: bytearray = bytearray(CLIENT_MSG_DATA)
+            ACK_MSG_DATA[4:5] = PERIPHERAL_EVENT.EXT_SRV_CONNECTED
+            if len(ACK_MSG_DATA) > 6:
+                ACK_MSG_DATA[5:7] = bytes((framing, flags))
+            self._send(ACK_MSG_DATA)
+            # the acknowledgement is the last frame in the format the client asked with
+            self._framing, self._flags = framing, flags
+            if debug:
+                emit(f"[{host}:{port}]-[MSG]: SENT ACKNOWLEDGEMENT TO DEVICE AT [{conn_info[0]}:{conn_info[1]}]...")
+            return
+        
+        if debug:
+            emit(f"[{host}:{port}]-[MSG]: [{conn_info[0]}:{conn_info[1]}]: CONNECTION FOUND IN DICTIONARY...")
+            emit(
+                    f"[{host}:{port}]-[MSG]: RECEIVED [{CLIENT_MSG_DATA.hex()!r}] FROM "
+                    f"[{conn_info[0]}:{conn_info[1]}]")
+        
+        if CLIENT_MSG_DATA[2] == MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD[0]:
+            if CLIENT_MSG_DATA[-1] == SERVER_SUB_COMMAND.DISCONNECT_F_SERVER[0]:
+                emit(
+                        f"[{host}:{port}]-[MSG]: RECEIVED REQ FOR DISCONNECTING DEVICE: "
+                        f"[{conn_info[0]}:{conn_info[1]}]...")
+                disconnect: bytearray = bytearray(
+                        CLIENT_MSG_DATA[1:2].tobytes() +
+                        MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD +
+                        CLIENT_MSG_DATA[3:4].tobytes() +
+                        SERVER_SUB_COMMAND.DISCONNECT_F_SERVER +
+                        PERIPHERAL_EVENT.EXT_SRV_DISCONNECTED
+                        )
+                disconnect = bytearray((len(disconnect) + 1, )) + disconnect
+                self._send(disconnect)
+                connectedDevices.unregister(con_key_index, hub_id=hub_id)
+                if debug:
+                    emit(f"[{host}:{port}]-[MSG]: DEVICE [{conn_info[0]}:{conn_info[1]}] DISCONNECTED FROM SERVER...")
+                    emit(f"connected Devices: {connectedDevices}")
+                return
+            if CLIENT_MSG_DATA[4] == SERVER_SUB_COMMAND.REG_W_SERVER[0]:
                 if debug:
-                    print(f"[SERVER]-[MSG]: NOTIFICATION RECEIVED... [T: {datetime.timestamp(datetime.now())}]")
-        except BTLEInternalError:
-            pass
-        finally:
-            loop.call_later(.0015, _listenBTLE, btledevice, loop, debug)
+                    emit(
+                        f"[{host}:{port}]-[MSG]: [{conn_info[0]}:{conn_info[1]}] ALREADY CONNECTED, IGNORING REQUEST...")
+                return
+        if debug:
+            if CLIENT_MSG_DATA[2] == MESSAGE_TYPE.DNS_VIRTUAL_PORT_SETUP[0]:
+                emit(f"[{host}:{port}]-[MSG]: [{conn_info[0]}:{conn_info[1]}] RECEIVED VIRTUAL PORT SETUP REQUEST...")
+            else:
+                emit(f"[{host}:{port}]-[MSG]: SENDING [{CLIENT_MSG_DATA.hex()}]:[{con_key_index!r}] "
+                      f"FROM {conn_info!r}")
+        if hub is not None:
+            hub.write(0x0e, CLIENT_MSG_DATA)
+        else:
+            emit(f"[{host}:{port}]-[MSG]: {C.WARNING}NO HUB WITH HUB_ID {hub_id} CONNECTED, "
+                  f"DISCARDING [{CLIENT_MSG_DATA.hex()}]...{C.ENDC}")
         return
 
 
-async def _listen_clients(reader: StreamReader, writer: StreamWriter, debug: bool = True) -> bool:
-    """This is the central message receiving function.
+async def serve(addresses: Optional[List[Tuple[str, int]]] = None, debug: bool = True) -> list:
+    """Starts the server in the running event loop: listens on `addresses` and connects the hubs in :data:`HUBS`.
+    
+    Besides running this module as a program, the server can be embedded in the program controlling the devices.
+    With an in-process address (``mem:``, see :mod:`legoBTLE.networking.transport`) the devices then exchange
+    their frames with the server through in-memory queues instead of sockets::
+        
+        servers = await serve([('mem:legoBTLE', 0)])
+        motor = SingleMotor(server=('mem:legoBTLE', 0), port=0)
+        await motor.EXT_SRV_CONNECT_REQ()
+        ...
+        shutdown(servers)
     
-    The function listens for incoming message (the commands) from the devices.
-    Once a message has been received it is - if not the initial connection request - sent to the BTLE device.
+    This method is a coroutine.
     
     Parameters
     ----------
-    reader : StreamReader
-        The reader instance
-    writer : StreamWriter
-        The write instance.
+    addresses : list[tuple[str, int]], optional
+        The addresses to serve clients on, :data:`SERVERS` if not given.
     debug : bool
-        If ``True``:
-            Verbose Messages to stdout
-        else:
-            don't show.
-
+        If ``True``, verbose messages of the client connections to stdout.
+        
     Returns
     -------
-    bool
-        ``True`` if everything is good, ``False`` otherwise.
+    list
+        The listening servers, to be passed to :func:`shutdown`.
         
     """
-    
     global host
     global port
-    global Future_BTLEDevice
-    conn_info = writer.get_extra_info('peername')
-    
-    size: int = 0
-    handle: int = -1
-    
-    while True:
-        try:
-            carrier_info: bytearray = bytearray(await reader.readexactly(n=2))
-            size: int = carrier_info[1]
-            handle: int = carrier_info[0]
-            print(f"[{host}:{port}]-[MSG]: {C.OKGREEN}CARRIER SIGNAL DETECTED: handle={handle}, size={size}...{C.ENDC}")
-            CLIENT_MSG_DATA: bytearray = bytearray(await reader.readexactly(n=size))
-            
-            if CLIENT_MSG_DATA[2] == MESSAGE_TYPE.UPS_DNS_GENERAL_HUB_NOTIFICATIONS[0]:
-                print(f"{C.BOLD}{C.FAIL}{CLIENT_MSG_DATA.hex()}{C.ENDC}")
-                if debug:
-                    print(
-                            f"[{host}:{port}]-[MSG]: {C.BOLD}{C.UNDERLINE}{C.OKBLUE}SENDING{C.ENDC}: "
-                            f"{C.OKGREEN}{C.BOLD}{handle}, {CLIENT_MSG_DATA[2:].hex()}{C.ENDC} {C.BOLD}{C.UNDERLINE}{C.OKBLUE} "
-                            f"FROM{C.ENDC}{C.BOLD}{C.OKBLUE} DEVICE [{conn_info[0]}:{conn_info[1]}]{C.UNDERLINE} "
-                            f"TO{C.ENDC}{C.BOLD}{C.OKBLUE} BTLE device{C.ENDC}")
-                if os.name == 'posix':
-                    print(f"HANDLE: {handle} / DATA: {CLIENT_MSG_DATA[2:]}")
-                    Future_BTLEDevice.writeCharacteristic(0x0f, val=CLIENT_MSG_DATA[2:], withResponse=True)
-                continue
-            if debug:
-                print(
-                        f"[{host}:{port}]-[MSG]: {C.BOLD}{C.OKBLUE}{C.UNDERLINE}RECEIVED "
-                        f"CLIENTMESSAGE{C.ENDC}{C.BOLD}{C.OKBLUE}: {CLIENT_MSG_DATA.hex()} FROM DEVICE "
-                        f"[{conn_info[0]}:{conn_info[1]}]{C.ENDC}")
-                
-            con_key_index = CLIENT_MSG_DATA[3]
-            
-            if con_key_index not in connectedDevices.keys():
-                # wait until Connection Request from client
-                if ((CLIENT_MSG_DATA[2] != MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD[0])
-                        or (CLIENT_MSG_DATA[-1] != SERVER_SUB_COMMAND.REG_W_SERVER[0])):
-                    continue
-                else:
-                    if ((CLIENT_MSG_DATA[2] == MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD[0])
-                            or (CLIENT_MSG_DATA[-1] == SERVER_SUB_COMMAND.REG_W_SERVER[0])):
-                        if debug:
-                            print("*"*10, f" {C.BOLD}{C.OKBLUE}NEW DEVICE: {con_key_index} DETECTED", end="*" * 10+f"{C.ENDC}\r\n")
-                        connectedDevices[con_key_index] = (reader, writer)
-                        if debug:
-                            print("**", " " * 8, f"\t\t{C.BOLD}{C.OKBLUE}DEVICE: {con_key_index} REGISTERED",
-                                  end="*" * 10 + f"{C.ENDC}\r\n")
-                            print(f"{C.BOLD}{C.OKBLUE}*"*20, end=f"{C.ENDC}\r\n")
-    
-                            print("*" * 10, f" {C.BOLD}{C.OKBLUE}[{host}:{port}]-[MSG]: SUMMARY CONNECTED DEVICES:{C.ENDC}")
-                            for con_dev_k, con_dev_v in connectedDevices.items():
-                                print(f"{C.BOLD}{C.OKBLUE}**[{host}:{port}]-[MSG]: \t"
-                                      f"PORT: {con_dev_k} / DEVICE: {con_dev_v[1]}{C.ENDC}")
-                            print(f"{C.BOLD}{C.OKBLUE}*" * 20, end=f"{C.ENDC}\r\n")
-                        
-                        ACK_MSG_DATA: bytearray = CLIENT_MSG_DATA
-                        ACK_MSG_DATA[-1:] = PERIPHERAL_EVENT.EXT_SRV_CONNECTED
-                        ACK_MSG = UpStreamMessageBuilder(data=ACK_MSG_DATA, debug=True).build()
-                        
-                        connectedDevices[con_key_index][1].write(ACK_MSG.COMMAND[0:1])
-                        await connectedDevices[con_key_index][1].drain()
-                        connectedDevices[con_key_index][1].write(ACK_MSG.COMMAND)
-                        await connectedDevices[con_key_index][1].drain()
-                        if debug:
-                            print(f"[{host}:{port}]-[MSG]: SENT ACKNOWLEDGEMENT TO DEVICE AT [{conn_info[0]}:{conn_info[1]}]...")
-                    else:
-                        print("*" * 10, f" {C.BOLD}{C.FAIL}WRONG COMMAND / THIS SHOULD NOT BE POSSIBLE",
-                                  end="*" * 10 + f"{C.ENDC}\r\n")
-                        raise ServerClientRegisterError(message=CLIENT_MSG_DATA.hex())
-            else:
-                if debug:
-                    print(f"[{host}:{port}]-[MSG]: [{conn_info[0]}:{conn_info[1]}]: CONNECTION FOUND IN DICTIONARY...")
-                    print(
-                            f"[{host}:{port}]-[MSG]: RECEIVED [{CLIENT_MSG_DATA.hex()!r}] FROM "
-                            f"[{conn_info[0]}:{conn_info[1]}]")
-                
-                if ((CLIENT_MSG_DATA[2] == MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD[0])
-                        and (CLIENT_MSG_DATA[-1] == SERVER_SUB_COMMAND.DISCONNECT_F_SERVER[0])):
-                    print(
-                            f"[{host}:{port}]-[MSG]: RECEIVED REQ FOR DISCONNECTING DEVICE: "
-                            f"[{conn_info[0]}:{conn_info[1]}]...")
-                    disconnect: bytearray = bytearray(
-                            b'\x00' +
-                            MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD +
-                            CLIENT_MSG_DATA[3:4] +
-                            SERVER_SUB_COMMAND.DISCONNECT_F_SERVER +
-                            PERIPHERAL_EVENT.EXT_SRV_DISCONNECTED
-                            )
-                    disconnect = bytearray(
-                            bytearray((len(disconnect) + 1).to_bytes(1, byteorder='little', signed=False)) +
-                            disconnect
-                            )
-                    ACK: EXT_SERVER_NOTIFICATION = EXT_SERVER_NOTIFICATION(disconnect)
-                    connectedDevices[con_key_index][1].write(ACK.m_header.m_length)
-                    await connectedDevices[con_key_index][1].drain()
-                    connectedDevices[con_key_index][1].write(ACK.COMMAND)
-                    await connectedDevices[con_key_index][1].drain()
-                    connectedDevices.pop(con_key_index)
-                    if debug:
-                        print(f"[{host}:{port}]-[MSG]: DEVICE [{conn_info[0]}:{conn_info[1]}] DISCONNECTED FROM SERVER...")
-                        print(f"connected Devices: {connectedDevices}")
-                    continue
-                elif CLIENT_MSG_DATA[2] == MESSAGE_TYPE.DNS_VIRTUAL_PORT_SETUP[0]:
-                    if debug:
-                        print(f"[{host}:{port}]-[MSG]: [{conn_info[0]}:{conn_info[1]}] RECEIVED VIRTUAL PORT SETUP REQUEST...")
-                elif ((CLIENT_MSG_DATA[2] == MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD)
-                      and (CLIENT_MSG_DATA[4] == SERVER_SUB_COMMAND.REG_W_SERVER)):
-                    if debug:
-                        print(
-                            f"[{host}:{port}]-[MSG]: [{conn_info[0]}:{conn_info[1]}] ALREADY CONNECTED, IGNORING REQUEST...")
-                    continue
-                else:
-                    if debug:
-                        print(f"[{host}:{port}]-[MSG]: SENDING [{CLIENT_MSG_DATA.hex()}]:[{con_key_index!r}] "
-                              f"FROM {conn_info!r}")
-                if os.name == 'posix':
-                    Future_BTLEDevice.writeCharacteristic(0x0e, CLIENT_MSG_DATA, True)
-        except (IncompleteReadError, ConnectionError, ConnectionResetError):
-            print(f"[{host}:{port}]-[MSG]: CLIENT [{conn_info[0]}:{conn_info[1]}] RESET CONNECTION... "
-                  f"DISCONNECTED...")
-            await asyncio.sleep(.05)
-            connectedDevices.clear()
-            return False
-        except ConnectionAbortedError:
-            print(
-                    f"[{host}:{port}]-[MSG]: CLIENT [{conn_info[0]}:{conn_info[1]}] ABORTED CONNECTION... "
-                    f"DISCONNECTED...")
-            await asyncio.sleep(.05)
-            connectedDevices.clear()
-            return False
-        continue
-    return True
+    
+    loop = asyncio.get_running_loop()
+    if addresses is None:
+        addresses = SERVERS
+    servers = [await start_server(address, lambda: ClientProtocol(debug=debug)) for address in addresses]
+    host, port = parse_address(addresses[0])[1:]
+    emit(f"[{host}:{port}]-[MSG]: SERVER RUNNING...")
+    for hub_id, deviceaddr in enumerate(HUBS):
+        if SIMULATED_HUBS:
+            btledevice = SimulatedHub().withDelegate(BTLEDelegate(loop=loop, remoteHost=(host, port),
+                                                                  hub_id=hub_id))
+        else:
+            btledevice = await connectBTLE(loop=loop, deviceaddr=deviceaddr, host=host, hub_id=hub_id)
+        connectedHubs[hub_id] = HubConnection(hub_id, btledevice, pipelined=PIPELINED_WRITES,
+                                              window=PIPELINE_WINDOW, port_windows=PIPELINE_PORT_WINDOWS)
+        connectedHubs[hub_id].start()
+        emit(f"[{host}:{port}]: BTLE CONNECTION TO HUB [{hub_id}] [{deviceaddr}] SET UP...")
+    return servers
 
 
-if __name__ == '__main__':
+def shutdown(servers: list) -> None:
+    """Disconnects the hubs and stops `servers`, the servers returned by :func:`serve`.
     
-    global Future_BTLEDevice
+    """
+    for hub in connectedHubs.values():
+        hub.stop()
+    connectedHubs.clear()
+    for server in servers:
+        server.close()
+    return
+
+
+if __name__ == '__main__':
     
     loop = asyncio.get_event_loop()
-    server = loop.run_until_complete(asyncio.start_server(
-            _listen_clients, '127.0.0.1', 8888))
+    servers = loop.run_until_complete(serve())
     try:
-        
-        loop.run_until_complete(asyncio.wait((asyncio.ensure_future(server.serve_forever()),), timeout=.1))
-        host, port = server.sockets[0].getsockname()
-        print(f"[{host}:{port}]-[MSG]: SERVER RUNNING...")
-        if (os.name == 'posix') and callable(connectBTLE) and callable(_listenBTLE):
-            try:
-                Future_BTLEDevice = loop.run_until_complete(asyncio.ensure_future(connectBTLE(loop=loop)))
-            except Exception as btle_ex:
-                raise
-            else:
-                loop.call_soon(_listenBTLE, Future_BTLEDevice, loop)
-                print(f"[{host}:{port}]: BTLE CONNECTION TO [{Future_BTLEDevice.services} SET UP...")
-        
         loop.run_forever()
     except KeyboardInterrupt:
-        print(f"SHUTTING DOWN...")
+        emit(f"SHUTTING DOWN...")
+        shutdown(servers)
         loop.run_until_complete(loop.shutdown_asyncgens())
         loop.stop()
         
@@ -0,0 +1,235 @@
+# coding=utf-8
+"""
+    legoBTLE.networking.session
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module contains :class:`ClientSession`, one connection to the server shared by all devices of a process.
+
+    Without a session every device opens its own connection and runs its own listener. Devices added to a session
+    register with the server over the session's connection instead; one task reads the server's frames and hands
+    each one to the device registered at the frame's (hub_id, port), the same key the server routes on. The server
+    in turn queues the notifications of all these devices in one outbound queue.
+
+    Example
+    -------
+    Registering a hub and two motors over one connection::
+
+        session = ClientSession(server=('127.0.0.1', 8888))
+        session.add(hub, motor_a, motor_b)
+        await hub.EXT_SRV_CONNECT_REQ()           # or: await session.register(hub, motor_a, motor_b)
+        await motor_a.EXT_SRV_CONNECT_REQ()
+        await motor_b.EXT_SRV_CONNECT_REQ()
+
+    :copyright: Copyright 2020-2021 by Dietrich Christopeit, see AUTHORS.rst.
+    :license: MIT, see LICENSE.rst for details
+"""
+
+import asyncio
+from asyncio import IncompleteReadError
+from asyncio import StreamWriter
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from legoBTLE.legoWP.message.downstream import CMD_EXT_SRV_CONNECT_REQ
+from legoBTLE.legoWP.message.downstream import CMD_EXT_SRV_DISCONNECT_REQ
+from legoBTLE.legoWP.types import C
+from legoBTLE.legoWP.types import MESSAGE_TYPE
+from legoBTLE.legoWP.types import PERIPHERAL_EVENT
+from legoBTLE.networking.framing import ClientFrameProtocol
+from legoBTLE.networking.framing import FRAMING_V2
+from legoBTLE.networking.framing import open_framed_connection
+from legoBTLE.networking.prettyprint.debug import debug_info
+from legoBTLE.networking.prettyprint.tracelog import emit
+
+_HUB_ATTACHED_IO: int = MESSAGE_TYPE.UPS_HUB_ATTACHED_IO[0]
+_VIRTUAL_IO_ATTACHED: int = PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED[0]
+
+
+class ClientSession:
+    """One connection to the server for several devices.
+
+    The first registration negotiates the frame format of the connection (see :mod:`legoBTLE.networking.framing`),
+    so registrations are sent one after the other. Everything else the devices send goes over the shared writer
+    as before.
+
+    """
+
+    def __init__(self, server: Tuple[str, int] = ('127.0.0.1', 8888), framing: int = FRAMING_V2,
+                 frame_flags: int = 0, timeout: float = 5.0, debug: bool = False):
+        """
+
+        Parameters
+        ----------
+        server : tuple[str, int]
+            The IP Address and port of the Server.
+        framing : int
+            The frame format asked for with the first registration.
+        frame_flags : int
+            The optional frame fields asked for with the first registration.
+        timeout : float
+            Seconds to wait for the server's acknowledgement of a registration.
+        debug : bool
+            If ``True``, verbose messages to stdout.
+        """
+        self._server: Tuple[str, int] = server
+        self._framing: int = framing
+        self._frame_flags: int = frame_flags
+        self._timeout: float = timeout
+        self._debug: bool = debug
+        self._connection: Optional[Tuple[ClientFrameProtocol, StreamWriter]] = None
+        self._devices: Dict[int, 'ADevice'] = {}
+        self._register_lock: Optional[asyncio.Lock] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._listener: Optional[asyncio.Task] = None
+        self.unroutable: int = 0
+        return
+
+    @property
+    def server(self) -> Tuple[str, int]:
+        return self._server
+
+    @property
+    def connection(self) -> Optional[Tuple[ClientFrameProtocol, StreamWriter]]:
+        """The shared connection, ``None`` before :meth:`connect`."""
+        return self._connection
+
+    @property
+    def connected(self) -> bool:
+        return (self._listener is not None) and not self._listener.done()
+
+    def add(self, *devices: 'ADevice') -> None:
+        """Make `devices` register over this session when their ``EXT_SRV_CONNECT_REQ`` is called.
+
+        """
+        for device in devices:
+            device.session = self
+        return
+
+    async def connect(self) -> None:
+        """Open the connection and start the listener, if not done yet.
+
+        This method is a coroutine.
+
+        """
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self.connected:
+                return
+            self._connection = await open_framed_connection(host=self._server[0], port=self._server[1])
+            self._listener = asyncio.create_task(self._listen())
+        return
+
+    async def register(self, *devices: 'ADevice') -> bool:
+        """Register `devices` with the server over this session.
+
+        This method is a coroutine.
+
+        Returns
+        -------
+        bool
+            ``True`` if the server acknowledged all registrations.
+
+        Raises
+        ------
+        ConnectionError
+            If the server did not acknowledge a registration in time.
+
+        """
+        self.add(*devices)
+        await self.connect()
+        if self._register_lock is None:
+            self._register_lock = asyncio.Lock()
+        for device in devices:
+            async with self._register_lock:
+                await self._register(device)
+        return True
+
+    async def _register(self, device: 'ADevice') -> None:
+        device.connection_set(self._connection)
+        # connection_set marks the device as connected, the acknowledgement decides
+        device.ext_srv_connected.clear()
+        self._devices[self._key(device.hub_id, device.port[0])] = device
+        command = CMD_EXT_SRV_CONNECT_REQ(port=device.port, framing=self._framing, frame_flags=self._frame_flags)
+        debug_info("[{0.name}:{0.port[0]}]-[MSG]: Sending CMD_EXT_SRV_CONNECT_REQ OVER SESSION: {1.COMMAND!h}",
+                   device, command, debug=self._debug)
+        if not await device._cmd_send(command):
+            raise ConnectionError(f"[{device.name}:{device.port[0]}]-[MSG]: UNABLE TO ESTABLISH CONNECTION... "
+                                  f"aborting...")
+        try:
+            await asyncio.wait_for(device.ext_srv_connected.wait(), timeout=self._timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionError(f"COULD NOT CONNECT [{device.name}:{device.port[0]}] TO "
+                                  f"[{self._server[0]}:{self._server[1]}]...") from None
+        return
+
+    async def disconnect(self, device: 'ADevice') -> bool:
+        """Disconnect `device` from the server, the session's connection stays open.
+
+        This method is a coroutine.
+
+        Returns
+        -------
+        bool
+            ``True`` if the request was sent.
+
+        """
+        s: bool = await device._cmd_send(CMD_EXT_SRV_DISCONNECT_REQ(port=device.port))
+        self.unregister(device)
+        device.ext_srv_connected.clear()
+        device.ext_srv_disconnected.set()
+        return s
+
+    def unregister(self, device: 'ADevice') -> None:
+        """Stop routing frames to `device`.
+
+        """
+        for key, registered in list(self._devices.items()):
+            if registered is device:
+                del self._devices[key]
+        return
+
+    def close(self) -> None:
+        """Close the connection, the devices are marked as disconnected by the listener.
+
+        """
+        if self._connection is not None:
+            self._connection[1].close()
+        return
+
+    @staticmethod
+    def _key(hub_id: int, port: int) -> int:
+        return (hub_id << 8) | port
+
+    async def _listen(self) -> None:
+        protocol: ClientFrameProtocol = self._connection[0]
+        devices: Dict[int, 'ADevice'] = self._devices
+        while True:
+            try:
+                frames = await protocol.read_frames()
+            except (ConnectionError, IOError, IncompleteReadError) as e:
+                debug_info("[{0._server[0]}:{0._server[1]}]-[MSG]: SESSION CONNECTION LOST... {1.args}",
+                           self, e, debug=self._debug)
+                for device in devices.values():
+                    device.ext_srv_connected.clear()
+                    device.ext_srv_disconnected.set()
+                devices.clear()
+                return
+            for frame in frames:
+                key: int = (frame[1] << 8) | frame[3]
+                if (frame[2] == _HUB_ATTACHED_IO) and (frame[4] == _VIRTUAL_IO_ATTACHED):
+                    # the combined device is still registered under its setup port, see BTLEDelegate
+                    setup_key: int = self._key(frame[1], 110 + frame[7] + 2 * frame[8])
+                    if setup_key in devices:
+                        devices[key] = devices.pop(setup_key)
+                device = devices.get(key)
+                if device is None:
+                    self.unroutable += 1
+                    continue
+                try:
+                    await device._dispatch_return_data(frame)
+                except Exception as e:
+                    # a frame one device fails on must not stop the routing for the others
+                    emit(f"[{device.name}:{frame[3]}]-[ERR]: {C.FAIL}Dispatching received data failed... "
+                         f"{e!r}{C.ENDC}")
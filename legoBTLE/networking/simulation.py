@@ -0,0 +1,432 @@
+# coding=utf-8
+"""
+    legoBTLE.networking.simulation
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module contains :class:`SimulatedHub`, a stand-in for :class:`bluepy.btle.Peripheral` that behaves like a
+    LEGO\\ |copy| Technic Hub with tacho motors attached.
+
+    The simulated hub offers the part of the bluepy interface the server uses (``withDelegate``,
+    ``waitForNotifications``, ``writeCharacteristic`` and ``disconnect``). It understands the downstream messages
+    assembled in :mod:`legoBTLE.legoWP.message.downstream` and answers with ``HUB_ATTACHED_IO``,
+    ``PORT_CMD_FEEDBACK`` and ``PORT_VALUE`` notifications, including the setup of virtual ports. With it, the server,
+    the devices and experiments can be run without any bluetooth hardware.
+
+    Example
+    -------
+    Serving a simulated hub instead of a real one::
+
+        hub = SimulatedHub(value_rate=100.0)
+        hub.withDelegate(BTLEDelegate(loop=loop, hub_id=0))
+        connectedHubs[0] = HubConnection(0, hub)
+        connectedHubs[0].start()
+
+    :copyright: Copyright 2020-2021 by Dietrich Christopeit, see AUTHORS.rst.
+    :license: MIT, see LICENSE.rst for details
+"""
+
+import heapq
+import itertools
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from legoBTLE.legoWP.types import DEVICE_TYPE
+from legoBTLE.legoWP.types import HUB_ACTION
+from legoBTLE.legoWP.types import HUB_ALERT_OP
+from legoBTLE.legoWP.types import MESSAGE_TYPE
+from legoBTLE.legoWP.types import PERIPHERAL_EVENT
+from legoBTLE.legoWP.types import SUB_COMMAND
+from legoBTLE.legoWP.types import WRITEDIRECT_MODE
+
+_FB_IN_PROGRESS: int = 0x01
+_FB_COMPLETED: int = 0x0a
+_FB_DISCARDED: int = 0x04
+
+
+def _int8(value: int) -> int:
+    return value - 0x100 if value > 0x7f else value
+
+
+def _int32(data: bytes) -> int:
+    return int.from_bytes(data, 'little', signed=True)
+
+
+class SimulatedMotor:
+    """The state of a simulated tacho motor at one port of the :class:`SimulatedHub`.
+
+    """
+
+    def __init__(self, port: int, device_type: bytes, degrees_per_second: float):
+        self.port: int = port
+        self.device_type: bytes = device_type
+        self.degrees_per_second: float = degrees_per_second
+        self.position: float = 0.0
+        self.speed: float = 0.0
+        self.target: Optional[float] = None
+        self.until: Optional[float] = None
+        self.owner: Optional[int] = None
+
+        self.notify: bool = False
+        self.mode: int = 2
+        self.delta: int = 1
+        self.last_reported: Optional[int] = None
+        return
+
+    def run(self, speed: int, owner: int, target: Optional[float] = None, until: Optional[float] = None) -> None:
+        """Start moving with `speed` percent of the maximum speed.
+
+        Parameters
+        ----------
+        speed : int
+            Speed in percent, the sign gives the direction.
+        owner : int
+            The (possibly virtual) port that issued the command.
+        target : float, optional
+            Stop once this position is reached.
+        until : float, optional
+            Stop at this point in time.
+
+        """
+        self.speed = self.degrees_per_second * max(-100, min(100, speed)) / 100
+        self.target = target
+        self.until = until
+        self.owner = owner
+        return
+
+    def stop(self) -> None:
+        self.speed = 0.0
+        self.target = None
+        self.until = None
+        return
+
+    @property
+    def moving(self) -> bool:
+        return self.speed != 0.0
+
+    def advance(self, dt: float, now: float) -> bool:
+        """Move the motor forward in time.
+
+        Returns
+        -------
+        bool
+            ``True`` if a running movement with a target or a duration finished, ``False`` otherwise.
+        """
+        if self.speed == 0.0:
+            return False
+        step: float = self.speed * dt
+        if self.target is not None:
+            remaining: float = self.target - self.position
+            if (remaining == 0.0) or ((remaining > 0) != (step > 0)) or (abs(step) >= abs(remaining)):
+                self.position = self.target
+                self.stop()
+                return True
+        self.position += step
+        if (self.until is not None) and (now >= self.until):
+            self.stop()
+            return True
+        return False
+
+
+class SimulatedHub:
+    """A simulated LEGO\\ |copy| Hub that can replace :class:`bluepy.btle.Peripheral` in the server.
+
+    The simulation runs in the thread calling :meth:`waitForNotifications` and :meth:`writeCharacteristic`, in
+    the server that is the :class:`legoBTLE.networking.server.BTLEWorker` of the hub. Motor movements are
+    computed from the elapsed time; notifications are delivered to the delegate's ``handleNotification`` in the
+    order they are due.
+
+    """
+
+    def __init__(self,
+                 devices: Optional[Dict[int, bytes]] = None,
+                 value_rate: float = 100.0,
+                 degrees_per_second: float = 1000.0,
+                 command_latency: float = .002,
+                 ):
+        """
+
+        Parameters
+        ----------
+        devices : dict[int, bytes], optional
+            The attached devices as port -> :class:`legoBTLE.legoWP.types.DEVICE_TYPE`, by default tacho motors
+            at the ports A to D.
+        value_rate : float
+            Maximum rate in Hz at which ``PORT_VALUE`` notifications are sent per port.
+        degrees_per_second : float
+            The speed of a motor running at 100%.
+        command_latency : float
+            Delay in seconds before a command that does not move the motor reports its completion.
+        """
+        if devices is None:
+            devices = {port: DEVICE_TYPE.EXTERNAL_MOTOR_WITH_TACHO for port in range(4)}
+        self._motors: Dict[int, SimulatedMotor] = {
+                port: SimulatedMotor(port, device_type, degrees_per_second) for port, device_type in devices.items()
+                }
+        self._virtual_ports: Dict[int, List[SimulatedMotor]] = {}
+        self._next_virtual_port: int = 0x10
+        self._running: Dict[int, List[SimulatedMotor]] = {}
+
+        self._value_interval: float = 1.0 / value_rate
+        self._command_latency: float = command_latency
+
+        self._delegate = None
+        self._events: list = []
+        self._seq = itertools.count()
+        self._last_step: float = time.monotonic()
+        self._next_report: float = self._last_step
+        self._connected: bool = True
+        return
+
+    @property
+    def motors(self) -> Dict[int, SimulatedMotor]:
+        return self._motors
+
+    @property
+    def virtual_ports(self) -> Dict[int, List[SimulatedMotor]]:
+        return self._virtual_ports
+
+    def withDelegate(self, delegate):
+        self._delegate = delegate
+        return self
+
+    def disconnect(self) -> None:
+        self._connected = False
+        return
+
+    def waitForNotifications(self, timeout: float) -> bool:
+        """Deliver all notifications that are due, waiting up to `timeout` seconds for the first one.
+
+        Returns
+        -------
+        bool
+            ``True`` if at least one notification was delivered, ``False`` otherwise.
+        """
+        deadline: float = time.monotonic() + timeout
+        while True:
+            now: float = time.monotonic()
+            self._step(now)
+            delivered: bool = False
+            while self._events and (self._events[0][0] <= now):
+                _, _, data = heapq.heappop(self._events)
+                if self._delegate is not None:
+                    self._delegate.handleNotification(0x0e, data)
+                delivered = True
+            if delivered or (now >= deadline):
+                return delivered
+            wake: float = deadline
+            if self._events:
+                wake = min(wake, self._events[0][0])
+            if any(motor.moving for motor in self._motors.values()):
+                wake = min(wake, self._next_report)
+            time.sleep(max(0.0, wake - now))
+
+    def writeCharacteristic(self, handle: int, val: bytes, withResponse: bool = False):
+        """Process a message written to the hub.
+
+        Parameters
+        ----------
+        handle : int
+            ``0x0f`` enables the hub notifications, ``0x0e`` carries the LEGO\\ |copy| Wireless Protocol messages.
+        val : bytes
+            The message.
+        withResponse : bool
+            Ignored.
+        """
+        now: float = time.monotonic()
+        self._step(now)
+        if handle == 0x0f:
+            for motor in self._motors.values():
+                self._emit(bytes((0x0f, 0x00)) + MESSAGE_TYPE.UPS_HUB_ATTACHED_IO + bytes((motor.port, ))
+                           + PERIPHERAL_EVENT.IO_ATTACHED + motor.device_type + b'\x00' + b'\x00' * 8, now)
+            return None
+
+        data = bytes(val)
+        m_type: bytes = data[2:3]
+        if m_type == MESSAGE_TYPE.DNS_PORT_CMD:
+            self._port_cmd(data, now)
+        elif m_type == MESSAGE_TYPE.DNS_PORT_NOTIFICATION:
+            self._port_notification(data, now)
+        elif m_type == MESSAGE_TYPE.DNS_VIRTUAL_PORT_SETUP:
+            self._virtual_port_setup(data, now)
+        elif m_type == MESSAGE_TYPE.UPS_DNS_HUB_ALERT:
+            if data[4:5] == HUB_ALERT_OP.DNS_UPDATE_REQUEST:
+                self._emit(b'\x06\x00' + MESSAGE_TYPE.UPS_DNS_HUB_ALERT + data[3:4] + HUB_ALERT_OP.UPS_UPDATE
+                           + b'\x00', now)
+        elif m_type == MESSAGE_TYPE.UPS_DNS_HUB_ACTION:
+            if data[3:4] == HUB_ACTION.DNS_HUB_SWITCH_OFF:
+                self._emit(b'\x04\x00' + MESSAGE_TYPE.UPS_DNS_HUB_ACTION + HUB_ACTION.UPS_HUB_WILL_SWITCH_OFF, now)
+            elif data[3:4] == HUB_ACTION.DNS_HUB_DISCONNECT:
+                self._emit(b'\x04\x00' + MESSAGE_TYPE.UPS_DNS_HUB_ACTION + HUB_ACTION.UPS_HUB_WILL_DISCONNECT, now)
+        return None
+
+    def _emit(self, data: bytes, due: float) -> None:
+        heapq.heappush(self._events, (due, next(self._seq), data))
+        return
+
+    def _feedback(self, port: int, msg: int, due: float) -> None:
+        self._emit(bytes((0x05, 0x00, MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK[0], port, msg)), due)
+        return
+
+    def _port_value(self, motor: SimulatedMotor, due: float) -> None:
+        value: int = int(round(motor.position))
+        motor.last_reported = value
+        self._emit(bytes((0x08, 0x00, MESSAGE_TYPE.UPS_PORT_VALUE[0], motor.port))
+                   + value.to_bytes(4, 'little', signed=True), due)
+        return
+
+    def _step(self, now: float) -> None:
+        dt: float = now - self._last_step
+        self._last_step = now
+        for motor in self._motors.values():
+            if motor.advance(dt, now):
+                self._finished(motor, now)
+        if now >= self._next_report:
+            self._next_report = now + self._value_interval
+            for motor in self._motors.values():
+                if motor.notify and ((motor.last_reported is None)
+                                     or (abs(int(round(motor.position)) - motor.last_reported) >= motor.delta)):
+                    self._port_value(motor, now)
+        return
+
+    def _finished(self, motor: SimulatedMotor, now: float) -> None:
+        owner: Optional[int] = motor.owner
+        motor.owner = None
+        if motor.notify:
+            self._port_value(motor, now)
+        running: Optional[List[SimulatedMotor]] = self._running.get(owner)
+        if running is None:
+            return
+        if motor in running:
+            running.remove(motor)
+        if not running:
+            del self._running[owner]
+            self._feedback(owner, _FB_COMPLETED, now)
+        return
+
+    def _motors_at(self, port: int) -> List[SimulatedMotor]:
+        if port in self._virtual_ports:
+            return self._virtual_ports[port]
+        if port in self._motors:
+            return [self._motors[port]]
+        return []
+
+    def _port_cmd(self, data: bytes, now: float) -> None:
+        port: int = data[3]
+        feedback: bool = bool(data[4] & 0x01)
+        sub_cmd: bytes = data[5:6]
+        motors: List[SimulatedMotor] = self._motors_at(port)
+        if not motors:
+            return
+
+        # a new command replaces the one running at the port
+        for motor in motors:
+            if motor.owner is not None:
+                previous: int = motor.owner
+                for other in self._running.pop(previous, []):
+                    other.owner = None
+                    other.stop()
+                if feedback:
+                    self._feedback(previous, _FB_DISCARDED, now)
+        if feedback:
+            self._feedback(port, _FB_IN_PROGRESS, now)
+
+        moving: List[SimulatedMotor] = []
+        if sub_cmd == SUB_COMMAND.TURN_SPD_UNLIMITED:
+            motors[0].run(_int8(data[6]), port)
+        elif sub_cmd == SUB_COMMAND.TURN_SPD_UNLIMITED_SYNC:
+            for motor, speed in zip(motors, (_int8(data[6]), _int8(data[7]))):
+                motor.run(speed, port)
+        elif sub_cmd == SUB_COMMAND.TURN_FOR_TIME:
+            until: float = now + int.from_bytes(data[6:8], 'little') / 1000
+            motors[0].run(_int8(data[8]), port, until=until)
+            moving = motors[:1]
+        elif sub_cmd == SUB_COMMAND.TURN_FOR_TIME_SYNC:
+            until: float = now + int.from_bytes(data[6:8], 'little') / 1000
+            for motor, speed in zip(motors, (_int8(data[8]), _int8(data[9]))):
+                motor.run(speed, port, until=until)
+            moving = list(motors)
+        elif sub_cmd == SUB_COMMAND.TURN_FOR_DEGREES:
+            degrees: int = _int32(data[6:10])
+            speed: int = _int8(data[10])
+            target: float = motors[0].position + (degrees if speed >= 0 else -degrees)
+            motors[0].run(speed if degrees >= 0 else -speed, port, target=target)
+            moving = motors[:1]
+        elif sub_cmd == SUB_COMMAND.TURN_FOR_DEGREES_SYNC:
+            degrees: int = _int32(data[6:10])
+            speeds = (_int8(data[10]), _int8(data[11]))
+            fastest: int = max(abs(speeds[0]), abs(speeds[1]), 1)
+            for motor, speed in zip(motors, speeds):
+                share: float = degrees * abs(speed) / fastest
+                motor.run(speed, port, target=motor.position + (share if speed >= 0 else -share))
+            moving = list(motors)
+        elif sub_cmd == SUB_COMMAND.GOTO_ABSOLUTE_POS:
+            self._goto(motors[0], _int32(data[6:10]), abs(_int8(data[10])), port)
+            moving = motors[:1]
+        elif sub_cmd == SUB_COMMAND.GOTO_ABSOLUTE_POS_SYNC:
+            for motor, abs_pos in zip(motors, (_int32(data[6:10]), _int32(data[10:14]))):
+                self._goto(motor, abs_pos, abs(_int8(data[14])), port)
+            moving = list(motors)
+        elif sub_cmd == SUB_COMMAND.WRITE_DIRECT_MODE_DATA:
+            mode: bytes = data[6:7]
+            if mode == WRITEDIRECT_MODE.SET_POSITION:
+                positions = [_int32(data[i:i + 4]) for i in range(7, len(data) - 3, 4)]
+                if len(positions) > len(motors):
+                    # synced: the virtual port's own position comes first
+                    positions = positions[1:]
+                for motor, position in zip(motors, positions):
+                    motor.stop()
+                    motor.position = float(position)
+            elif mode == WRITEDIRECT_MODE.SET_MOTOR_POWER:
+                for motor in motors:
+                    motor.run(_int8(data[7]), port)
+        elif sub_cmd == SUB_COMMAND.SET_VALUE_L_R:
+            for motor, position in zip(motors, (_int32(data[6:10]), _int32(data[10:14]))):
+                motor.stop()
+                motor.position = float(position)
+
+        moving = [motor for motor in moving if motor.moving]
+        if moving:
+            self._running[port] = moving
+        elif feedback:
+            self._feedback(port, _FB_COMPLETED, now + self._command_latency)
+        return
+
+    @staticmethod
+    def _goto(motor: SimulatedMotor, abs_pos: int, speed: int, port: int) -> None:
+        direction: int = 1 if abs_pos >= motor.position else -1
+        motor.run(direction * max(speed, 1), port, target=float(abs_pos))
+        return
+
+    def _port_notification(self, data: bytes, now: float) -> None:
+        port: int = data[3]
+        motors: List[SimulatedMotor] = self._motors_at(port)
+        for motor in motors:
+            motor.mode = data[4]
+            motor.delta = max(1, int.from_bytes(data[5:9], 'little'))
+            motor.notify = bool(data[9])
+            motor.last_reported = None
+        self._emit(bytes((0x0a, 0x00)) + MESSAGE_TYPE.UPS_PORT_NOTIFICATION + data[3:10], now)
+        for motor in motors:
+            if motor.notify:
+                self._port_value(motor, now)
+        return
+
+    def _virtual_port_setup(self, data: bytes, now: float) -> None:
+        if data[3] == 0x01:
+            port_a, port_b = data[4], data[5]
+            if (port_a not in self._motors) or (port_b not in self._motors):
+                return
+            virtual_port: int = self._next_virtual_port
+            self._next_virtual_port += 1
+            self._virtual_ports[virtual_port] = [self._motors[port_a], self._motors[port_b]]
+            self._emit(bytes((0x09, 0x00)) + MESSAGE_TYPE.UPS_HUB_ATTACHED_IO + bytes((virtual_port, ))
+                       + PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED + self._motors[port_a].device_type + b'\x00'
+                       + bytes((port_a, port_b)), now)
+        else:
+            virtual_port: int = data[4]
+            if self._virtual_ports.pop(virtual_port, None) is not None:
+                self._emit(bytes((0x05, 0x00)) + MESSAGE_TYPE.UPS_HUB_ATTACHED_IO + bytes((virtual_port, ))
+                           + PERIPHERAL_EVENT.IO_DETACHED, now)
+        return
@@ -0,0 +1,709 @@
+# coding=utf-8
+"""
+    legoBTLE.networking.transport
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module contains the transports that carry the frames between server and devices.
+
+    A transport is picked by the address, the same ``(host, port)`` tuple a device is given as `server`:
+
+    ``('127.0.0.1', 8888)``, ``('tcp:127.0.0.1', 8888)``
+        TCP, the default.
+    ``('unix:/tmp/legoBTLE.sock', 0)``
+        A Unix domain socket at the path, the port is ignored.
+    ``('shm:/tmp/legoBTLE.shm', 0)``
+        Two shared memory ring buffers, one per direction, for clients on the same host. The path is a Unix domain
+        socket over which the client hands the rings and their :func:`os.eventfd` wake-ups to the server once; it
+        then only signals the end of the connection. Needs Linux and Python 3.10 or later.
+    ``('mem:legoBTLE', 0)``
+        A server running in the same process and event loop under the name, see
+        :func:`legoBTLE.networking.server.serve`. The bytes written on one end are queued and handed to the other
+        end's protocol by reference in the next iteration of the event loop, no socket is involved.
+
+    All backends drive the same :class:`asyncio.Protocol` objects, i.e.,
+    :class:`legoBTLE.networking.framing.ClientFrameProtocol` on the device side and
+    :class:`legoBTLE.networking.server.ClientProtocol` on the server side. Further backends can be added to
+    :data:`TRANSPORTS`.
+
+    Example
+    -------
+    A motor talking to a server on the same host over shared memory::
+
+        motor = SingleMotor(server=('shm:/tmp/legoBTLE.shm', 0), port=0)
+        await motor.EXT_SRV_CONNECT_REQ()
+
+    :copyright: Copyright 2020-2021 by Dietrich Christopeit, see AUTHORS.rst.
+    :license: MIT, see LICENSE.rst for details
+"""
+
+import asyncio
+import mmap
+import os
+import socket
+import struct
+from collections import deque
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Type
+
+_EVENTFD: bool = hasattr(os, 'eventfd') and hasattr(socket, 'send_fds') and hasattr(os, 'memfd_create')
+
+RING_SIZE: int = 64 * 1024
+"""Size in bytes of each shared memory ring buffer a client sets up."""
+
+_HANDSHAKE: struct.Struct = struct.Struct('<I')
+_HANDSHAKE_FDS: int = 6
+
+
+def parse_address(address: Tuple[str, int]) -> Tuple[str, str, int]:
+    """Splits `address` into the name of the transport, the host or path and the port.
+
+    Parameters
+    ----------
+    address : tuple[str, int]
+        The host, optionally prefixed with ``<transport>:``, and the port.
+
+    Returns
+    -------
+    tuple[str, str, int]
+        The key into :data:`TRANSPORTS`, the host or path, and the port.
+
+    Examples
+    --------
+    >>> parse_address(('127.0.0.1', 8888))
+    ('tcp', '127.0.0.1', 8888)
+    >>> parse_address(('unix:/tmp/legoBTLE.sock', 0))
+    ('unix', '/tmp/legoBTLE.sock', 0)
+
+    """
+    host, port = address[0], address[1]
+    scheme, sep, target = host.partition(':')
+    if sep and (scheme in TRANSPORTS):
+        return scheme, target, port
+    return 'tcp', host, port
+
+
+class TCPBackend:
+    """TCP connections, see :meth:`asyncio.AbstractEventLoop.create_connection`."""
+
+    @staticmethod
+    async def open_connection(target: str, port: int, protocol_factory: Callable[[], asyncio.Protocol]
+                              ) -> Tuple[asyncio.BaseTransport, asyncio.Protocol]:
+        return await asyncio.get_running_loop().create_connection(protocol_factory, host=target, port=port)
+
+    @staticmethod
+    async def start_server(target: str, port: int, protocol_factory: Callable[[], asyncio.Protocol]):
+        return await asyncio.get_running_loop().create_server(protocol_factory, host=target, port=port)
+
+
+class UnixBackend:
+    """Unix domain socket connections, see :meth:`asyncio.AbstractEventLoop.create_unix_connection`."""
+
+    @staticmethod
+    async def open_connection(target: str, port: int, protocol_factory: Callable[[], asyncio.Protocol]
+                              ) -> Tuple[asyncio.BaseTransport, asyncio.Protocol]:
+        return await asyncio.get_running_loop().create_unix_connection(protocol_factory, path=target)
+
+    @staticmethod
+    async def start_server(target: str, port: int, protocol_factory: Callable[[], asyncio.Protocol]):
+        return await asyncio.get_running_loop().create_unix_server(protocol_factory, path=target)
+
+
+class SharedMemoryTransport(asyncio.Transport):
+    """One end of a pair of shared memory ring buffers.
+
+    Each ring is a byte stream with a single writer and a single reader, neither of them takes a lock. Instead of
+    shared head and tail indices the ends exchange byte counts through two eventfds per ring: the writer adds the
+    number of bytes it copied into the ring to the ring's data eventfd, the reader adds the number of bytes it
+    consumed to the ring's space eventfd. Each end keeps its own position, so nothing but the data is shared, and
+    the system calls on the eventfds order the copies between the processes.
+
+    Received bytes are handed to the protocol's :meth:`asyncio.Protocol.data_received` as on a socket. Bytes that
+    do not fit into the ring are buffered until the reader frees space; above the high-water mark the protocol is
+    asked to pause writing.
+
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, protocol: asyncio.Protocol, control: socket.socket,
+                 rx: Tuple[mmap.mmap, int, int], tx: Tuple[mmap.mmap, int, int],
+                 waiter: Optional[asyncio.Future] = None):
+        """
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The event loop serving the transport.
+        protocol : asyncio.Protocol
+            The protocol receiving the data.
+        control : socket.socket
+            The Unix domain socket of the handshake, closed by either end to end the connection.
+        rx : tuple[mmap.mmap, int, int]
+            The ring to read from, its data eventfd and its space eventfd.
+        tx : tuple[mmap.mmap, int, int]
+            The ring to write to, its data eventfd and its space eventfd.
+        waiter : asyncio.Future, optional
+            Set once the protocol has been told about the connection.
+        """
+        super().__init__(extra={'socket': control, 'peername': ('shm', control.fileno()), })
+        self._loop: asyncio.AbstractEventLoop = loop
+        self._protocol: asyncio.Protocol = protocol
+        self._control: socket.socket = control
+        self._rx, self._rx_data, self._rx_space = rx
+        self._tx, self._tx_data, self._tx_space = tx
+        self._rx_pos: int = 0
+        self._tx_pos: int = 0
+        self._tx_free: int = len(self._tx)
+        self._backlog: bytearray = bytearray()
+        self._high_water: int = 4 * RING_SIZE
+        self._low_water: int = RING_SIZE
+        self._closing: bool = False
+        self._closed: bool = False
+        self._reading: bool = False
+        self._protocol_paused: bool = False
+        self._loop.call_soon(self._start, waiter)
+        return
+
+    def _start(self, waiter: Optional[asyncio.Future]) -> None:
+        self._protocol.connection_made(self)
+        self._loop.add_reader(self._control.fileno(), self._on_control)
+        self.resume_reading()
+        if (waiter is not None) and not waiter.done():
+            waiter.set_result(None)
+        return
+
+    def _on_data(self) -> None:
+        try:
+            n = os.eventfd_read(self._rx_data)
+        except BlockingIOError:
+            return
+        ring = self._rx
+        pos = self._rx_pos
+        end = pos + n
+        if end <= len(ring):
+            data = ring[pos:end]
+        else:
+            end -= len(ring)
+            data = ring[pos:] + ring[:end]
+        self._rx_pos = end % len(ring)
+        os.eventfd_write(self._rx_space, n)
+        self._protocol.data_received(data)
+        return
+
+    def _on_control(self) -> None:
+        try:
+            data = self._control.recv(64)
+        except BlockingIOError:
+            return
+        except OSError as exc:
+            self._force_close(exc)
+            return
+        if not data:
+            if self._reading:
+                self._on_data()
+            self._force_close(None)
+        return
+
+    def _on_space(self) -> None:
+        n = self._put(self._backlog)
+        del self._backlog[:n]
+        if not self._backlog:
+            self._loop.remove_reader(self._tx_space)
+            if self._closing:
+                self._force_close(None)
+                return
+        self._maybe_resume_protocol()
+        return
+
+    def _put(self, data) -> int:
+        length = len(data)
+        if self._tx_free < length:
+            try:
+                self._tx_free += os.eventfd_read(self._tx_space)
+            except BlockingIOError:
+                pass
+        n = min(length, self._tx_free)
+        if not n:
+            return 0
+        ring = self._tx
+        pos = self._tx_pos
+        first = min(n, len(ring) - pos)
+        ring[pos:pos + first] = data[:first]
+        if n > first:
+            ring[:n - first] = data[first:n]
+        self._tx_pos = (pos + n) % len(ring)
+        self._tx_free -= n
+        os.eventfd_write(self._tx_data, n)
+        return n
+
+    def write(self, data) -> None:
+        if self._closing or not data:
+            return
+        if self._backlog:
+            self._backlog += data
+        else:
+            n = self._put(data)
+            if n < len(data):
+                self._backlog += data[n:]
+                self._loop.add_reader(self._tx_space, self._on_space)
+        self._maybe_pause_protocol()
+        return
+
+    def can_write_eof(self) -> bool:
+        return False
+
+    def get_write_buffer_size(self) -> int:
+        return len(self._backlog)
+
+    def get_write_buffer_limits(self) -> Tuple[int, int]:
+        return self._low_water, self._high_water
+
+    def set_write_buffer_limits(self, high: Optional[int] = None, low: Optional[int] = None) -> None:
+        if high is None:
+            high = 4 * RING_SIZE if low is None else 4 * low
+        if low is None:
+            low = high // 4
+        self._high_water, self._low_water = high, low
+        self._maybe_pause_protocol()
+        return
+
+    def _maybe_pause_protocol(self) -> None:
+        if (not self._protocol_paused) and (len(self._backlog) > self._high_water):
+            self._protocol_paused = True
+            self._protocol.pause_writing()
+        return
+
+    def _maybe_resume_protocol(self) -> None:
+        if self._protocol_paused and (len(self._backlog) <= self._low_water):
+            self._protocol_paused = False
+            self._protocol.resume_writing()
+        return
+
+    def is_reading(self) -> bool:
+        return self._reading
+
+    def pause_reading(self) -> None:
+        if self._reading and not self._closed:
+            self._reading = False
+            self._loop.remove_reader(self._rx_data)
+        return
+
+    def resume_reading(self) -> None:
+        if not (self._reading or self._closing):
+            self._reading = True
+            self._loop.add_reader(self._rx_data, self._on_data)
+        return
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        self.pause_reading()
+        if not self._backlog:
+            self._force_close(None)
+        return
+
+    def abort(self) -> None:
+        self._backlog.clear()
+        self._closing = True
+        self._force_close(None)
+        return
+
+    def _force_close(self, exc: Optional[Exception]) -> None:
+        if self._closed:
+            return
+        self._closing = True
+        self._closed = True
+        self._reading = False
+        for fd in (self._rx_data, self._tx_space, self._control.fileno()):
+            self._loop.remove_reader(fd)
+        self._loop.call_soon(self._call_connection_lost, exc)
+        return
+
+    def _call_connection_lost(self, exc: Optional[Exception]) -> None:
+        try:
+            self._protocol.connection_lost(exc)
+        finally:
+            self._control.close()
+            for fd in (self._rx_data, self._rx_space, self._tx_data, self._tx_space):
+                os.close(fd)
+            self._rx.close()
+            self._tx.close()
+        return
+
+
+class SharedMemoryServer:
+    """Accepts the handshakes of shared memory clients on a Unix domain socket.
+
+    Mimics the parts of :class:`asyncio.Server` the server module uses.
+
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, path: str, protocol_factory: Callable[[], asyncio.Protocol]):
+        self._loop: asyncio.AbstractEventLoop = loop
+        self._path: str = path
+        self._protocol_factory: Callable[[], asyncio.Protocol] = protocol_factory
+        self._transports: Set[SharedMemoryTransport] = set()
+        if os.path.exists(path):
+            os.unlink(path)
+        self._sock: Optional[socket.socket] = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(path)
+        self._sock.listen(100)
+        self._sock.setblocking(False)
+        self._loop.add_reader(self._sock.fileno(), self._accept)
+        return
+
+    @property
+    def sockets(self) -> List[socket.socket]:
+        return [] if self._sock is None else [self._sock]
+
+    def is_serving(self) -> bool:
+        return self._sock is not None
+
+    def _accept(self) -> None:
+        try:
+            conn, _ = self._sock.accept()
+        except (BlockingIOError, InterruptedError, ConnectionAbortedError):
+            return
+        conn.setblocking(False)
+        self._loop.add_reader(conn.fileno(), self._handshake, conn)
+        return
+
+    def _handshake(self, conn: socket.socket) -> None:
+        self._loop.remove_reader(conn.fileno())
+        try:
+            msg, fds, _, _ = socket.recv_fds(conn, _HANDSHAKE.size, _HANDSHAKE_FDS)
+        except OSError:
+            conn.close()
+            return
+        if (len(msg) != _HANDSHAKE.size) or (len(fds) != _HANDSHAKE_FDS):
+            for fd in fds:
+                os.close(fd)
+            conn.close()
+            return
+        size = _HANDSHAKE.unpack(msg)[0]
+        try:
+            down, up = mmap.mmap(fds[0], size), mmap.mmap(fds[1], size)
+        except (OSError, ValueError):
+            for fd in fds:
+                os.close(fd)
+            conn.close()
+            return
+        os.close(fds[0])
+        os.close(fds[1])
+        protocol = self._protocol_factory()
+        transport = SharedMemoryTransport(self._loop, protocol, conn, rx=(down, fds[2], fds[3]),
+                                          tx=(up, fds[4], fds[5]))
+        self._transports.add(transport)
+        self._loop.call_soon(self._prune)
+        return
+
+    def _prune(self) -> None:
+        self._transports = {t for t in self._transports if not t.is_closing()}
+        return
+
+    def close(self) -> None:
+        if self._sock is None:
+            return
+        self._loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+        self._sock = None
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+        for transport in self._transports:
+            transport.close()
+        self._transports.clear()
+        return
+
+    async def wait_closed(self) -> None:
+        return
+
+    async def serve_forever(self) -> None:
+        await self._loop.create_future()
+
+
+class SharedMemoryBackend:
+    """Shared memory ring buffers between processes of the same host, see :class:`SharedMemoryTransport`."""
+
+    @staticmethod
+    def _check() -> None:
+        if not _EVENTFD:
+            raise NotImplementedError("SHARED MEMORY TRANSPORT NEEDS os.eventfd, LINUX AND PYTHON >= 3.10...")
+        return
+
+    @staticmethod
+    async def open_connection(target: str, port: int, protocol_factory: Callable[[], asyncio.Protocol]
+                              ) -> Tuple[asyncio.BaseTransport, asyncio.Protocol]:
+        SharedMemoryBackend._check()
+        loop = asyncio.get_running_loop()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        fds: List[int] = []
+        try:
+            await loop.sock_connect(sock, target)
+            for _ in range(2):
+                fd = os.memfd_create('legoBTLE-ring', os.MFD_CLOEXEC)
+                fds.append(fd)
+                os.ftruncate(fd, RING_SIZE)
+            for _ in range(4):
+                fds.append(os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC))
+            down, up = mmap.mmap(fds[0], RING_SIZE), mmap.mmap(fds[1], RING_SIZE)
+            socket.send_fds(sock, [_HANDSHAKE.pack(RING_SIZE)], fds)
+        except BaseException:
+            for fd in fds:
+                os.close(fd)
+            sock.close()
+            raise
+        os.close(fds[0])
+        os.close(fds[1])
+        protocol = protocol_factory()
+        waiter = loop.create_future()
+        transport = SharedMemoryTransport(loop, protocol, sock, rx=(up, fds[4], fds[5]), tx=(down, fds[2], fds[3]),
+                                          waiter=waiter)
+        await waiter
+        return transport, protocol
+
+    @staticmethod
+    async def start_server(target: str, port: int, protocol_factory: Callable[[], asyncio.Protocol]
+                           ) -> SharedMemoryServer:
+        SharedMemoryBackend._check()
+        return SharedMemoryServer(asyncio.get_running_loop(), target, protocol_factory)
+
+
+class MemoryTransport(asyncio.Transport):
+    """One end of an in-process connection.
+
+    :meth:`write` appends the data to the peer's queue, the peer hands all queued chunks to its protocol in one
+    callback of the event loop. Immutable data, i.e., :class:`bytes`, is passed on by reference; anything else is
+    copied, as the writer may reuse its buffer. The queue is emptied every iteration of the event loop, so the
+    protocols are never asked to pause writing.
+
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, protocol: asyncio.Protocol, peername: Tuple[str, int]):
+        super().__init__(extra={'peername': peername, })
+        self._loop: asyncio.AbstractEventLoop = loop
+        self._protocol: asyncio.Protocol = protocol
+        self._peer: Optional['MemoryTransport'] = None
+        self._queue: Deque[bytes] = deque()
+        self._scheduled: bool = False
+        self._reading: bool = True
+        self._closing: bool = False
+        self._closed: bool = False
+        return
+
+    @staticmethod
+    def pair(loop: asyncio.AbstractEventLoop, client: asyncio.Protocol, server: asyncio.Protocol, name: str
+             ) -> Tuple['MemoryTransport', 'MemoryTransport']:
+        """Connects `client` and `server`, their ``connection_made`` is called in the next iteration of `loop`.
+
+        """
+        client_end = MemoryTransport(loop, client, (name, 0))
+        server_end = MemoryTransport(loop, server, (name, id(client_end)))
+        client_end._peer, server_end._peer = server_end, client_end
+        loop.call_soon(server.connection_made, server_end)
+        loop.call_soon(client.connection_made, client_end)
+        return client_end, server_end
+
+    def write(self, data) -> None:
+        if self._closing or not data:
+            return
+        peer = self._peer
+        peer._queue.append(data if type(data) is bytes else bytes(data))
+        if not peer._scheduled:
+            peer._scheduled = True
+            self._loop.call_soon(peer._deliver)
+        return
+
+    def _deliver(self) -> None:
+        self._scheduled = False
+        queue = self._queue
+        while queue and self._reading and not self._closed:
+            self._protocol.data_received(queue.popleft())
+        return
+
+    def can_write_eof(self) -> bool:
+        return False
+
+    def get_write_buffer_size(self) -> int:
+        return 0
+
+    def is_reading(self) -> bool:
+        return self._reading
+
+    def pause_reading(self) -> None:
+        self._reading = False
+        return
+
+    def resume_reading(self) -> None:
+        if not self._reading:
+            self._reading = True
+            if self._queue and not self._scheduled:
+                self._scheduled = True
+                self._loop.call_soon(self._deliver)
+        return
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        # queued after the peer's delivery, so all data written so far arrives first
+        self._loop.call_soon(self._peer._lost)
+        self._loop.call_soon(self._lost)
+        return
+
+    def abort(self) -> None:
+        self.close()
+        return
+
+    def _lost(self) -> None:
+        if self._closed:
+            return
+        self._closing = True
+        self._closed = True
+        self._queue.clear()
+        self._protocol.connection_lost(None)
+        return
+
+
+class MemoryServer:
+    """A server for clients in the same process, registered under its name in :data:`MemoryBackend.servers`.
+
+    Mimics the parts of :class:`asyncio.Server` the server module uses.
+
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, name: str, protocol_factory: Callable[[], asyncio.Protocol]):
+        self._loop: asyncio.AbstractEventLoop = loop
+        self._name: str = name
+        self._protocol_factory: Callable[[], asyncio.Protocol] = protocol_factory
+        self._transports: Set[MemoryTransport] = set()
+        return
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    @property
+    def sockets(self) -> List[socket.socket]:
+        return []
+
+    def is_serving(self) -> bool:
+        return MemoryBackend.servers.get(self._name) is self
+
+    def connect(self, protocol: asyncio.Protocol) -> MemoryTransport:
+        """Connects the client `protocol`, returns the client's end of the connection.
+
+        """
+        client_end, server_end = MemoryTransport.pair(self._loop, protocol, self._protocol_factory(), self._name)
+        self._transports = {t for t in self._transports if not t.is_closing()}
+        self._transports.add(server_end)
+        return client_end
+
+    def close(self) -> None:
+        if MemoryBackend.servers.get(self._name) is self:
+            del MemoryBackend.servers[self._name]
+        for transport in self._transports:
+            transport.close()
+        self._transports.clear()
+        return
+
+    async def wait_closed(self) -> None:
+        return
+
+    async def serve_forever(self) -> None:
+        await self._loop.create_future()
+
+
+class MemoryBackend:
+    """Connections to a server in the same process and event loop, see :class:`MemoryTransport`."""
+
+    servers: Dict[str, MemoryServer] = {}
+    """The running in-process servers by name."""
+
+    @staticmethod
+    async def open_connection(target: str, port: int, protocol_factory: Callable[[], asyncio.Protocol]
+                              ) -> Tuple[asyncio.BaseTransport, asyncio.Protocol]:
+        loop = asyncio.get_running_loop()
+        server = MemoryBackend.servers.get(target)
+        if server is None:
+            raise ConnectionRefusedError(f"NO IN-PROCESS SERVER [{target}] RUNNING...")
+        if server.loop is not loop:
+            raise ConnectionRefusedError(f"IN-PROCESS SERVER [{target}] RUNS IN ANOTHER EVENT LOOP...")
+        protocol = protocol_factory()
+        transport = server.connect(protocol)
+        await asyncio.sleep(0)
+        return transport, protocol
+
+    @staticmethod
+    async def start_server(target: str, port: int, protocol_factory: Callable[[], asyncio.Protocol]
+                           ) -> MemoryServer:
+        if target in MemoryBackend.servers:
+            raise OSError(f"IN-PROCESS SERVER [{target}] ALREADY RUNNING...")
+        server = MemoryServer(asyncio.get_running_loop(), target, protocol_factory)
+        MemoryBackend.servers[target] = server
+        return server
+
+
+TRANSPORTS: Dict[str, Type] = {
+        'tcp':  TCPBackend,
+        'unix': UnixBackend,
+        'shm':  SharedMemoryBackend,
+        'mem':  MemoryBackend,
+        }
+"""The transports by the prefix selecting them in an address, see :func:`parse_address`."""
+
+
+async def open_connection(address: Tuple[str, int], protocol_factory: Callable[[], asyncio.Protocol]
+                          ) -> Tuple[asyncio.BaseTransport, asyncio.Protocol]:
+    """Connects to the server at `address` over the transport the address selects.
+
+    This method is a coroutine.
+
+    Parameters
+    ----------
+    address : tuple[str, int]
+        The address of the server, see :func:`parse_address`.
+    protocol_factory : callable
+        Creates the protocol of the connection.
+
+    Returns
+    -------
+    tuple[asyncio.BaseTransport, asyncio.Protocol]
+        The transport and the protocol of the connection.
+
+    """
+    scheme, target, port = parse_address(address)
+    return await TRANSPORTS[scheme].open_connection(target, port, protocol_factory)
+
+
+async def start_server(address: Tuple[str, int], protocol_factory: Callable[[], asyncio.Protocol]):
+    """Serves clients at `address` over the transport the address selects.
+
+    This method is a coroutine.
+
+    Parameters
+    ----------
+    address : tuple[str, int]
+        The address to listen on, see :func:`parse_address`.
+    protocol_factory : callable
+        Creates the protocol of each client connection.
+
+    Returns
+    -------
+    asyncio.Server or SharedMemoryServer
+        The listening server.
+
+    """
+    scheme, target, port = parse_address(address)
+    return await TRANSPORTS[scheme].start_server(target, port, protocol_factory)
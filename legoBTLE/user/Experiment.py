@@ -137,13 +137,13 @@ class Experiment:
         # CONNECT DEVICES
         debug_info_header("LIST OF DEVICES", debug=self._debug)
         for d in devices:
-            debug_info(f"NAME: {d.name} / PORT: {d.port[0]} / TYPE: {d.__class__}", debug=self._debug)
-        debug_info_footer(footer=f"LIST OF DEVICES", debug=self._debug)
+            debug_info("NAME: {0.name} / PORT: {0.port[0]} / TYPE: {0.__class__}", d, debug=self._debug)
+        debug_info_footer("LIST OF DEVICES", debug=self._debug)
 
         debug_info_header("SERVER CONNECTION SETUP", debug=self._debug)
         connection_results = await self._connect_devs_by(devices, 'EXT_SRV_CONNECT_REQ')
         await asyncio.sleep(1.0)
-        debug_info_footer(footer=f"SERVER CONNECTION SETUP", debug=self._debug)
+        debug_info_footer("SERVER CONNECTION SETUP", debug=self._debug)
         
         notification_request_tasks = []
         # for hub setup
@@ -155,29 +155,29 @@ class Experiment:
         debug_info_header("VIRTUAL PORT SETUP", debug=self._debug)
         for v in virtualMotors:
             if isinstance(v, SynchronizedMotor):
-                debug_info_begin(f"VIRTUAL PORT SETUP REQ: {v.name}", debug=self._debug)
+                debug_info_begin("VIRTUAL PORT SETUP REQ: {0.name}", v, debug=self._debug)
                 vms.append(await v.VIRTUAL_PORT_SETUP(connect=True))
-                debug_info_end(f"VIRTUAL PORT SETUP REQ: {v.name}", debug=self._debug)
-        debug_info(f"SETUP VIRTUAL: {*vms,}", debug=self._debug)
-        debug_info_footer(footer=f"VIRTUAL PORT SETUP", debug=self._debug)
+                debug_info_end("VIRTUAL PORT SETUP REQ: {0.name}", v, debug=self._debug)
+        debug_info("SETUP VIRTUAL: {0}", {*vms,}, debug=self._debug)
+        debug_info_footer("VIRTUAL PORT SETUP", debug=self._debug)
 
         debug_info_header("PORT NOTIFICATION SETUP for all general devices", debug=self._debug)
         for d in devices:
             if not isinstance(d, Hub):
-                debug_info_begin(f"PORT NOTIFICATION REQ: {d.name}", debug=self._debug)
+                debug_info_begin("PORT NOTIFICATION REQ: {0.name}", d, debug=self._debug)
                 notification_request_tasks.append(asyncio.create_task(d.REQ_PORT_NOTIFICATION()))
-                debug_info_end(f"PORT NOTIFICATION REQ: {d.name}", debug=self._debug)
+                debug_info_end("PORT NOTIFICATION REQ: {0.name}", d, debug=self._debug)
         await asyncio.sleep(1)
-        debug_info_footer(footer=f"PORT NOTIFICATIONS SETUP for all general devices", debug=self._debug)
+        debug_info_footer("PORT NOTIFICATIONS SETUP for all general devices", debug=self._debug)
 
         debug_info_header("GENERAL NOTIFICATION SETUP for Hub devices", debug=self._debug)
         for h in hubs:
             if isinstance(h, Hub):
-                debug_info_begin(f"GENERAL NOTIFICATION REQ: {h.name}", debug=self._debug)
+                debug_info_begin("GENERAL NOTIFICATION REQ: {0.name}", h, debug=self._debug)
                 results.append(await h.REQ_PORT_NOTIFICATION(delay_after=5))
-                debug_info_end(f"GENERAL NOTIFICATION REQ: {h.name}", debug=self._debug)
+                debug_info_end("GENERAL NOTIFICATION REQ: {0.name}", h, debug=self._debug)
         await asyncio.sleep(1)
-        debug_info_footer(footer=f"GENERAL NOTIFICATION SETUP for Hub devices", debug=self._debug)
+        debug_info_footer("GENERAL NOTIFICATION SETUP for Hub devices", debug=self._debug)
         
         return self._con_device_tasks
     
@@ -186,14 +186,14 @@ class Experiment:
         connection_attempts: [Coroutine] = []
         
         for d in devices:
-            debug_info_begin(f"SERVER CONNECTION ATTEMPT: {d.name}", debug=self._debug)
+            debug_info_begin("SERVER CONNECTION ATTEMPT: {0.name}", d, debug=self._debug)
             connection_attempts.append(getattr(d, con_method)())
-            debug_info_end(f"SERVER CONNECTION ATTEMPT: {d.name}", debug=self._debug)
+            debug_info_end("SERVER CONNECTION ATTEMPT: {0.name}", d, debug=self._debug)
         
         result = await asyncio.gather(*connection_attempts, return_exceptions=True)
         
         for r in result:
-            debug_info(f"RESULT CON ATTEMPT: {r}", debug=self._debug)
+            debug_info("RESULT CON ATTEMPT: {0}", r, debug=self._debug)
         
         return result
     